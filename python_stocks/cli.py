@@ -3,12 +3,15 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .main import run_simulation
+from .main import run_monte_carlo, run_simulation, run_walk_forward
 from .market_data import (
     CURATED_TICKERS,
+    STORE_FORMATS,
     DailyPriceStore,
     ingest_curated_daily_data,
+    migrate_price_store,
 )
+from .services.strategy_service import RESULT_METRICS
 
 DEFAULT_TICKERS = ["SPY"]
 DEFAULT_START_DATE = "2015-01-01"
@@ -44,52 +47,56 @@ def _parse_parameter_overrides(
     return overrides
 
 
-def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(prog="python_stocks")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    run_parser = subparsers.add_parser("run", help="Run trading strategy simulations")
-    run_parser.add_argument(
+def _add_market_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
         "--tickers",
         nargs="+",
         default=DEFAULT_TICKERS,
         help="Ticker symbols to simulate",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--start",
         dest="start_date",
         default=DEFAULT_START_DATE,
         help="Start date (YYYY-MM-DD)",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--end", dest="end_date", default=DEFAULT_END_DATE, help="End date (YYYY-MM-DD)"
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--initial",
         dest="initial_deposit",
         type=int,
         default=DEFAULT_INITIAL_DEPOSIT,
         help="Initial deposit",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--daily",
         dest="daily_deposit",
         type=int,
         default=DEFAULT_DAILY_DEPOSIT,
         help="Daily deposit amount",
     )
-    run_parser.add_argument(
+    parser.add_argument(
         "--monthly",
         dest="monthly_deposit",
         type=int,
         default=DEFAULT_MONTHLY_DEPOSIT,
         help="Monthly deposit amount",
     )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python_stocks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run trading strategy simulations")
+    _add_market_arguments(run_parser)
     run_parser.add_argument(
         "--strategies",
         nargs="+",
         default=None,
-        help="Registered strategies to run (default: all)",
+        help="Registered strategies to run (default: all but opt-in ones like equal_weight)",
     )
     run_parser.add_argument(
         "--param",
@@ -98,6 +105,85 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=[],
         help="Strategy parameter sweep overrides of the form strategy.param=1,2,3",
     )
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to simulate strategy runs in parallel",
+    )
+    run_parser.add_argument(
+        "--reporting",
+        choices=["silent", "summary", "verbose"],
+        default="verbose",
+        help="Per-strategy console summaries (summary) and portfolio plots (verbose)",
+    )
+    run_parser.add_argument(
+        "--successive-halving",
+        action="store_true",
+        help="Prune parameter combinations on growing prefixes of the date range",
+    )
+    run_parser.add_argument(
+        "--halving-metric",
+        choices=RESULT_METRICS,
+        default="sharpe_ratio",
+        help="Metric used to rank combinations between halving stages",
+    )
+    run_parser.add_argument(
+        "--halving-eta",
+        type=int,
+        default=2,
+        help="Keep 1/eta of the combinations per stage and grow the prefix eta-fold",
+    )
+    run_parser.add_argument(
+        "--halving-min-days",
+        type=int,
+        default=90,
+        help="Shortest prefix (in days) simulated at the first halving stage",
+    )
+    run_parser.add_argument(
+        "--checkpoint-dir",
+        default=None,
+        help="Save periodic simulation checkpoints to this directory "
+        "(default with --resume or --incremental: .python_stocks_checkpoints)",
+    )
+    run_parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=250,
+        help="Days simulated between checkpoints",
+    )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the last matching checkpoint instead of day one",
+    )
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Extend the last finished run's checkpoint over newly ingested "
+        "bars, simulating only the new days (implies --resume)",
+    )
+    run_parser.add_argument(
+        "--retention",
+        choices=["full", "equity", "metrics"],
+        default="full",
+        help="What each finished run keeps: its daily ledger (full), a float32 "
+        "equity curve (equity) or only its metrics",
+    )
+    run_parser.add_argument(
+        "--sink",
+        dest="sink_path",
+        default=None,
+        help="Stream each finished run to this .csv, .ndjson or .parquet file "
+        "instead of keeping every history in memory",
+    )
+    run_parser.add_argument(
+        "--sink-equity",
+        dest="sink_equity_frequency",
+        default=None,
+        help="Also write each run's equity curve sampled at this pandas "
+        "frequency (e.g. W or ME)",
+    )
     run_parser.add_argument(
         "--report-dir",
         dest="report_dir",
@@ -111,6 +197,108 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         help="Skip interactive plot display (useful for GitHub Pages artifact generation)",
     )
 
+    walk_parser = subparsers.add_parser(
+        "walk-forward",
+        help="Tune a strategy on rolling in-sample windows and test it out-of-sample",
+    )
+    _add_market_arguments(walk_parser)
+    walk_parser.add_argument(
+        "--strategy",
+        required=True,
+        help="Registered strategy whose parameters are tuned",
+    )
+    walk_parser.add_argument(
+        "--param",
+        dest="parameter_overrides",
+        action="append",
+        default=[],
+        help="Parameter grid to search, of the form strategy.param=1,2,3",
+    )
+    walk_parser.add_argument(
+        "--in-sample-days",
+        type=int,
+        default=730,
+        help="Calendar days in each in-sample (optimization) window",
+    )
+    walk_parser.add_argument(
+        "--out-of-sample-days",
+        type=int,
+        default=182,
+        help="Calendar days in each out-of-sample (test) window",
+    )
+    walk_parser.add_argument(
+        "--step-days",
+        type=int,
+        default=None,
+        help="Days between fold starts (default: the out-of-sample length)",
+    )
+    walk_parser.add_argument(
+        "--anchored",
+        action="store_true",
+        help="Start every in-sample window at the first day instead of rolling it",
+    )
+    walk_parser.add_argument(
+        "--metric",
+        choices=RESULT_METRICS,
+        default="sharpe_ratio",
+        help="Strategy result metric used to pick the in-sample winner",
+    )
+    walk_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used for each in-sample sweep",
+    )
+    walk_parser.add_argument(
+        "--report-dir",
+        dest="report_dir",
+        default=None,
+        help="Directory to write the per-fold walk-forward report (CSV/JSON)",
+    )
+
+    monte_carlo_parser = subparsers.add_parser(
+        "monte-carlo",
+        help="Run vectorized strategies over block-bootstrapped price paths",
+    )
+    _add_market_arguments(monte_carlo_parser)
+    monte_carlo_parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=None,
+        help="Vectorized strategies to run (default: every vectorized, non-opt-in strategy)",
+    )
+    monte_carlo_parser.add_argument(
+        "--param",
+        dest="parameter_overrides",
+        action="append",
+        default=[],
+        help="Strategy parameter sweep overrides of the form strategy.param=1,2,3",
+    )
+    monte_carlo_parser.add_argument(
+        "--paths", type=int, default=1000, help="Number of simulated price paths"
+    )
+    monte_carlo_parser.add_argument(
+        "--block-size",
+        type=int,
+        default=20,
+        help="Trading days per resampled block (1 resamples single days)",
+    )
+    monte_carlo_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="Paths generated and simulated together; bounds memory use",
+    )
+    monte_carlo_parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for reproducible paths"
+    )
+    monte_carlo_parser.add_argument(
+        "--report-dir",
+        dest="report_dir",
+        default=None,
+        help="Directory to write the metric summary and per-path metrics (CSV)",
+    )
+
     ingest_parser = subparsers.add_parser(
         "ingest-daily",
         help="Refresh curated daily market OHLCV cache from the configured provider",
@@ -137,6 +325,39 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=3,
         help="Warn when data lags this many business days behind expected latest day",
     )
+    ingest_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Tickers fetched and saved concurrently",
+    )
+    ingest_parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Maximum provider requests per second across all workers",
+    )
+
+    migrate_parser = subparsers.add_parser(
+        "migrate-store",
+        help="Convert the market-data cache between CSV and memory-mapped .npy columns",
+    )
+    migrate_parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="Optional override for the market-data cache directory",
+    )
+    migrate_parser.add_argument(
+        "--to",
+        choices=list(STORE_FORMATS),
+        default="npy",
+        help="Storage format to convert the cache to",
+    )
+    migrate_parser.add_argument(
+        "--remove-source",
+        action="store_true",
+        help="Delete each ticker's files in the old format once converted",
+    )
 
     return parser.parse_args(argv)
 
@@ -156,6 +377,55 @@ def main(argv: Optional[List[str]] = None) -> None:
             parameter_overrides=_parse_parameter_overrides(args.parameter_overrides),
             report_dir=args.report_dir,
             show_plots=args.show_plots,
+            workers=args.workers,
+            reporting=args.reporting,
+            successive_halving=args.successive_halving,
+            halving_metric=args.halving_metric,
+            halving_eta=args.halving_eta,
+            halving_min_days=args.halving_min_days,
+            checkpoint_dir=args.checkpoint_dir,
+            checkpoint_every=args.checkpoint_every,
+            resume=args.resume,
+            incremental=args.incremental,
+            sink_path=args.sink_path,
+            sink_equity_frequency=args.sink_equity_frequency,
+            retention=args.retention,
+        )
+
+    if args.command == "walk-forward":
+        run_walk_forward(
+            tickers=args.tickers,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            initial_deposit=args.initial_deposit,
+            daily_deposit=args.daily_deposit,
+            monthly_deposit=args.monthly_deposit,
+            strategy=args.strategy,
+            in_sample_days=args.in_sample_days,
+            out_of_sample_days=args.out_of_sample_days,
+            step_days=args.step_days,
+            anchored=args.anchored,
+            metric=args.metric,
+            parameter_overrides=_parse_parameter_overrides(args.parameter_overrides),
+            report_dir=args.report_dir,
+            workers=args.workers,
+        )
+
+    if args.command == "monte-carlo":
+        run_monte_carlo(
+            tickers=args.tickers,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            initial_deposit=args.initial_deposit,
+            daily_deposit=args.daily_deposit,
+            monthly_deposit=args.monthly_deposit,
+            strategies=args.strategies,
+            parameter_overrides=_parse_parameter_overrides(args.parameter_overrides),
+            paths=args.paths,
+            block_size=args.block_size,
+            chunk_size=args.chunk_size,
+            seed=args.seed,
+            report_dir=args.report_dir,
         )
 
     if args.command == "ingest-daily":
@@ -166,10 +436,25 @@ def main(argv: Optional[List[str]] = None) -> None:
             store=store,
             full_refresh=args.full_refresh,
             stale_after_business_days=args.stale_after,
+            workers=args.workers,
+            rate_limit=args.rate_limit,
         )
 
         for result in results:
-            print(f"[{result.status.upper()}] {result.message}")
+            scope = ""
+            if result.quality_scope == "increment":
+                scope = " (quality checked on the appended rows only)"
+            print(f"[{result.status.upper()}] {result.message}{scope}")
+
+    if args.command == "migrate-store":
+        written = migrate_price_store(
+            Path(args.data_dir) if args.data_dir else None,
+            to=args.to,
+            remove_source=args.remove_source,
+        )
+        for path in written:
+            print(f"[OK] wrote {path}")
+        print(f"Converted {len(written)} tickers to {args.to}")
 
 
 if __name__ == "__main__":
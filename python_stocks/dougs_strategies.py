@@ -1,7 +1,9 @@
 import numpy as np
 
+from .indicators import IndicatorSpec
 from .math_helper import no_delay_moving_average_filter, slope
 from .services.strategy_service import StrategyContext
+from .signals import MarketArrays, TradeSignals
 from .trading_history import TradingHistory
 
 ##### STRATEGIES
@@ -39,9 +41,9 @@ def strategy_marcus_2p25(
     interest = params.get("interest_rate", 2.25)
     trading_history_day = 365
     daily_interest = interest / 100 / trading_history_day
-    df = trading_history.trading_history_df
-    last_idx = df.index[-1]
-    df.at[last_idx, "bank_account"] += daily_interest * df.at[last_idx, "bank_account"]
+    ledger = trading_history.ledger
+    bank_account = ledger.get("bank_account")
+    ledger.set("bank_account", bank_account + daily_interest * bank_account)
 
     return trading_history
 
@@ -54,34 +56,91 @@ def strategy_maf_investment(
     short_window = params.get("short_window", 10)
     long_window = params.get("long_window", 100)
 
-    closing_prices = trading_history.stock_df_to_today[ticker]["Close"]
-    closing_prices = list(
-        closing_prices[~closing_prices.isin([np.nan, np.inf, -np.inf])]
-    )
+    short_filter = trading_history.indicators.get(IndicatorSpec(ticker, short_window))
+    long_filter = trading_history.indicators.get(IndicatorSpec(ticker, long_window))
+    if short_filter is not None and long_filter is not None:
+        # The engine keeps streaming filters current, so today's and
+        # yesterday's values are already available.
+        latest, short_value, long_value = (
+            short_filter.latest,
+            short_filter.value,
+            long_filter.value,
+        )
+        if (
+            short_filter.count < max(short_window, long_window)
+            or latest is None
+            or short_value is None
+            or long_value is None
+        ):
+            return trading_history
+        _maf_trade(
+            trading_history,
+            ticker,
+            latest,
+            short_value,
+            short_filter.slope,
+            long_value,
+            long_filter.slope,
+        )
+        return trading_history
+
+    closing_prices = trading_history.market.closes(ticker)
     if len(closing_prices) < max(short_window, long_window):
         return trading_history
 
-    mafshort = no_delay_moving_average_filter(closing_prices, short_window)
+    # The filters only read the trailing ``window`` prices, so pass just that
+    # tail instead of converting the whole history to a list.
+    yesterday_prices = closing_prices[:-1]
+    mafshort = no_delay_moving_average_filter(
+        closing_prices[-short_window:].tolist(), short_window
+    )
     mafshort_yesterday = no_delay_moving_average_filter(
-        closing_prices[0:-1], short_window
+        yesterday_prices[-short_window:].tolist(), short_window
+    )
+    maflong = no_delay_moving_average_filter(
+        closing_prices[-long_window:].tolist(), long_window
     )
-    maflong = no_delay_moving_average_filter(closing_prices, long_window)
     maflong_yesterday = no_delay_moving_average_filter(
-        closing_prices[0:-1], long_window
+        yesterday_prices[-long_window:].tolist(), long_window
     )
     slope_mafshort = slope([mafshort_yesterday, mafshort], 2)
     slope_maflong = slope([maflong_yesterday, maflong], 2)
 
-    if (closing_prices[-1] < mafshort) and (slope_maflong > 0):
+    _maf_trade(
+        trading_history,
+        ticker,
+        closing_prices[-1],
+        mafshort,
+        slope_mafshort,
+        maflong,
+        slope_maflong,
+    )
+    return trading_history
+
+
+def _maf_trade(
+    trading_history: TradingHistory,
+    ticker: str,
+    latest_close: float,
+    mafshort: float,
+    slope_mafshort: float,
+    maflong: float,
+    slope_maflong: float,
+) -> None:
+    if (latest_close < mafshort) and (slope_maflong > 0):
         trading_history.buy_all_shares(ticker)
-    if (
-        (mafshort > maflong)
-        and (slope_mafshort < 0)
-        and (closing_prices[-1] > mafshort)
-    ):
+    if (mafshort > maflong) and (slope_mafshort < 0) and (latest_close > mafshort):
         trading_history.sell_all_shares(ticker)
 
-    return trading_history
+
+def maf_indicators(params: dict) -> list[IndicatorSpec]:
+    """Streaming filters read by ``strategy_maf_investment``."""
+
+    ticker = params.get("ticker", "SPY")
+    return [
+        IndicatorSpec(ticker, params.get("short_window", 10)),
+        IndicatorSpec(ticker, params.get("long_window", 100)),
+    ]
 
 
 def strategy_openclose_investment(
@@ -89,14 +148,8 @@ def strategy_openclose_investment(
 ):
     trading_history, params = _resolve_context(context, params)
     ticker = params.get("ticker", "SPY")
-    closing_prices = trading_history.stock_df_to_today[ticker]["Close"]
-    closing_prices = list(
-        closing_prices[~closing_prices.isin([np.nan, np.inf, -np.inf])]
-    )
-    opening_prices = trading_history.stock_df_to_today[ticker]["Open"]
-    opening_prices = list(
-        opening_prices[~opening_prices.isin([np.nan, np.inf, -np.inf])]
-    )
+    closing_prices = trading_history.market.closes(ticker)
+    opening_prices = trading_history.market.history(ticker, "Open")
     if len(closing_prices) < 2:
         return trading_history
 
@@ -106,3 +159,52 @@ def strategy_openclose_investment(
         trading_history.buy_all_shares(ticker, "Open")
 
     return trading_history
+
+
+##### VECTORIZED SIGNALS
+# Array equivalents of the strategies above, evaluated once over the whole
+# history. Each returns the same trades its per-day counterpart would make.
+
+
+def signals_no_investment(market: MarketArrays, params: dict) -> TradeSignals:
+    return TradeSignals.hold_cash(market)
+
+
+def signals_buy_and_hold(market: MarketArrays, params: dict) -> TradeSignals:
+    ticker = params.get("ticker", "SPY")
+    every_day = np.ones((market.paths, market.rows), dtype=bool)
+    return TradeSignals(
+        ticker,
+        buy=every_day,
+        sell=~every_day,
+        when=params.get("when", "Close"),
+    )
+
+
+def signals_openclose_investment(market: MarketArrays, params: dict) -> TradeSignals:
+    ticker = params.get("ticker", "SPY")
+    active = market.clean_count(ticker, "Close") >= 2
+    previous_close = market.clean_lag(ticker, "Close", 1)
+    latest_open = market.clean_lag(ticker, "Open")
+    sell = active & (previous_close < latest_open)
+    return TradeSignals(ticker, buy=active & ~sell, sell=sell, when="Open")
+
+
+def signals_maf_investment(market: MarketArrays, params: dict) -> TradeSignals:
+    ticker = params.get("ticker", "SPY")
+    short_window = params.get("short_window", 10)
+    long_window = params.get("long_window", 100)
+    short_filter = market.indicator(IndicatorSpec(ticker, short_window))
+    long_filter = market.indicator(IndicatorSpec(ticker, long_window))
+
+    active = short_filter.count >= max(short_window, long_window)
+    latest_close = short_filter.latest
+    mafshort, maflong = short_filter.value, long_filter.value
+    buy = active & (latest_close < mafshort) & (long_filter.slope > 0)
+    sell = (
+        active
+        & (mafshort > maflong)
+        & (short_filter.slope < 0)
+        & (latest_close > mafshort)
+    )
+    return TradeSignals(ticker, buy=buy, sell=sell)
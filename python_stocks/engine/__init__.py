@@ -1,5 +1,32 @@
 """Simulation engine package for running headless strategy batches."""
 
+from .checkpoint import SimulationCheckpoint
+from .monte_carlo import MonteCarloEngine, MonteCarloOutput
 from .simulator import SimulationEngine, SimulationOutput, render_summary_artifacts
+from .sinks import (
+    CsvResultSink,
+    NdjsonResultSink,
+    ParquetResultSink,
+    ResultSink,
+    open_sink,
+)
+from .sweep import SuccessiveHalvingSweep, SweepResult
+from .walk_forward import WalkForwardOptimizer, WalkForwardResult
 
-__all__ = ["SimulationEngine", "SimulationOutput", "render_summary_artifacts"]
+__all__ = [
+    "CsvResultSink",
+    "MonteCarloEngine",
+    "MonteCarloOutput",
+    "NdjsonResultSink",
+    "ParquetResultSink",
+    "ResultSink",
+    "SimulationCheckpoint",
+    "SimulationEngine",
+    "SimulationOutput",
+    "SuccessiveHalvingSweep",
+    "SweepResult",
+    "WalkForwardOptimizer",
+    "WalkForwardResult",
+    "open_sink",
+    "render_summary_artifacts",
+]
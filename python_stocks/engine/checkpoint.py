@@ -0,0 +1,202 @@
+"""On-disk checkpoints of the engine's day loop for resumable runs.
+
+A checkpoint is keyed twice: by the call's configuration (deposit, seed,
+costs, runs) and by a digest of the market data rows it has covered. The
+second key is what lets an incremental checkpoint carry a finished run over
+to data with newly ingested bars appended: only the new days are stepped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, cast
+
+import numpy as np
+import pandas as pd
+
+from ..ledger import TradingLedger
+from ..trading_history import TradingHistory
+
+CHECKPOINT_FILE = "checkpoint.npz"
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable digest of everything that determines a simulation's outcome."""
+
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CheckpointState:
+    """A saved day loop: histories as of ``next_row`` (or finished).
+
+    ``rows`` is the length of the data the state was saved against; it is
+    shorter than the current data when a finished run is being extended.
+    """
+
+    key: str
+    next_row: int
+    complete: bool
+    histories: List[Dict[str, Any]]
+    ledgers: List[Dict[str, np.ndarray]]
+    rows: int = 0
+    indicators: List[Dict[str, Any]] = field(default_factory=list)
+
+    def restore(self, history: TradingHistory, position: int) -> None:
+        """Load the saved ledger, cost totals and RNG state into ``history``."""
+
+        saved, arrays = self.histories[position], self.ledgers[position]
+        ledger = history.ledger
+        values = arrays["values"]
+        index = pd.DatetimeIndex(arrays["dates"])
+        history.ledger = TradingLedger.from_columns(
+            ledger.columns,
+            index,
+            {name: values[:, column] for column, name in enumerate(ledger.columns)},
+            ledger.capacity,
+        )
+        history.total_fees = saved["total_fees"]
+        history.total_slippage_cost = saved["total_slippage_cost"]
+        history.rng.bit_generator.state = saved["rng"]
+
+
+class SimulationCheckpoint:
+    """Periodic snapshots of one engine call, kept in ``directory``.
+
+    Every ``every`` simulated days the engine saves each per-day history's
+    ledger, fee and slippage totals and random state, plus the next day to
+    simulate; a finished call is saved once more with every history. Each
+    snapshot is a single compressed ``.npz`` replaced atomically, so a crash
+    mid-write leaves the previous snapshot intact. With ``resume`` a
+    matching snapshot is picked up instead of starting from the first day.
+
+    An ``incremental`` checkpoint also accepts a finished snapshot whose data
+    is a prefix of the current data, i.e. the same call run again after new
+    bars were ingested. The day loop then restores the saved histories and
+    streaming indicators and simulates only the appended days.
+    """
+
+    def __init__(
+        self,
+        directory: os.PathLike | str,
+        *,
+        every: int = 250,
+        resume: bool = True,
+        incremental: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.every = max(int(every), 1)
+        self.resume = resume or incremental
+        self.incremental = incremental
+
+    def child(self, name: str) -> "SimulationCheckpoint":
+        """Checkpoint for one part of a larger call (a seed or a shard)."""
+
+        return SimulationCheckpoint(
+            self.directory / name,
+            every=self.every,
+            resume=self.resume,
+            incremental=self.incremental,
+        )
+
+    @property
+    def path(self) -> Path:
+        return self.directory / CHECKPOINT_FILE
+
+    def due(self, row: int) -> bool:
+        return row % self.every == 0
+
+    def save(
+        self,
+        key: str,
+        next_row: int,
+        histories: Sequence[TradingHistory],
+        *,
+        complete: bool = False,
+        rows: int = 0,
+        data_key: str = "",
+        indicators: Sequence[Dict[str, Any]] = (),
+    ) -> None:
+        manifest = {
+            "key": key,
+            "next_row": next_row,
+            "complete": complete,
+            "rows": rows,
+            "data_key": data_key,
+            "indicators": list(indicators),
+            "histories": [
+                {
+                    "name": history.name,
+                    "total_fees": history.total_fees,
+                    "total_slippage_cost": history.total_slippage_cost,
+                    "rng": history.rng.bit_generator.state,
+                }
+                for history in histories
+            ],
+        }
+        arrays: Dict[str, np.ndarray] = {"manifest": np.array(json.dumps(manifest))}
+        for position, history in enumerate(histories):
+            ledger = history.ledger
+            arrays[f"values_{position}"] = ledger.values
+            arrays[f"dates_{position}"] = ledger.index.to_numpy()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_suffix(".partial")
+        with open(partial, "wb") as handle:
+            # numpy's stubs type **kwds against the allow_pickle keyword.
+            np.savez_compressed(handle, **cast(Dict[str, Any], arrays))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(partial, self.path)
+
+    def load(
+        self, key: str, rows: int, data_key: Callable[[int], str]
+    ) -> Optional[CheckpointState]:
+        """The saved state for ``key`` over ``rows`` rows of data, if any.
+
+        ``data_key(n)`` digests the first ``n`` rows of the current data. A
+        snapshot saved against fewer rows is only used when this checkpoint
+        is incremental, the saved call finished and those rows are unchanged.
+        """
+
+        if not self.resume or not self.path.exists():
+            return None
+        with np.load(self.path, allow_pickle=False) as stored:
+            manifest = json.loads(str(stored["manifest"]))
+            saved_rows = manifest.get("rows", 0)
+            if manifest["key"] != key or saved_rows > rows:
+                return None
+            if saved_rows < rows and not (self.incremental and manifest["complete"]):
+                return None
+            if manifest.get("data_key") != data_key(saved_rows):
+                return None
+            ledgers = [
+                {
+                    "values": stored[f"values_{position}"],
+                    "dates": stored[f"dates_{position}"],
+                }
+                for position in range(len(manifest["histories"]))
+            ]
+        return CheckpointState(
+            key=key,
+            next_row=manifest["next_row"],
+            complete=manifest["complete"],
+            histories=manifest["histories"],
+            ledgers=ledgers,
+            rows=saved_rows,
+            indicators=manifest.get("indicators", []),
+        )
+
+
+__all__ = ["CheckpointState", "SimulationCheckpoint", "fingerprint"]
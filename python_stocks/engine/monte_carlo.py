@@ -0,0 +1,357 @@
+"""Monte Carlo simulation over bootstrapped price paths.
+
+The historical replay is a single path. :class:`MonteCarloEngine` resamples
+blocks of daily returns from the loaded history into many synthetic paths,
+runs every vectorized strategy across all of them at once and reports the
+distribution of CAGR, max drawdown and Sharpe ratio.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..indicators import IndicatorCache
+from ..price_matrix import PriceMatrix
+from ..rebalance import simulate_rebalance
+from ..signals import MarketArrays, simulate_signals
+from ..strategy_registry import Strategy, StrategyRegistry
+from .simulator import SimulationEngine, _format_parameters
+
+MONTE_CARLO_METRICS = ("cagr", "max_drawdown", "sharpe_ratio")
+
+
+class BlockBootstrap:
+    """Stitch random blocks of historical daily returns into price paths.
+
+    Returns are taken between consecutive trading rows (rows where any ticker
+    has a close). Every row is resampled jointly across tickers, so their
+    co-movement is preserved: closes follow the resampled close-to-close
+    returns, and the other fields keep their ratio to the close of the row
+    they were drawn from. Non-trading rows stay ``NaN`` as in the history, and
+    so do the rows before a ticker's first close.
+    ``block_size=1`` resamples single days independently.
+    """
+
+    def __init__(self, prices: PriceMatrix, rows: int, block_size: int = 20) -> None:
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.tickers = prices.tickers
+        self.fields = prices.fields
+        self.rows = rows
+        close = prices.field_position("Close")
+        self._trading = np.flatnonzero(
+            np.isfinite(prices.raw[:rows, :, close]).any(axis=1)
+        )
+        filled = prices.values[self._trading]
+        closes = filled[:, :, close]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = closes[1:] / closes[:-1]
+            shape = filled / closes[:, :, np.newaxis]
+        self._growth = np.where(np.isfinite(growth), growth, 1.0)
+        self._shape = np.where(np.isfinite(shape), shape, np.nan)
+        # Tickers listed after the first trading row start at their own first
+        # close; ``len(closes)`` marks a ticker with no close at all.
+        listed = prices.last_valid[self._trading, :, close] >= 0
+        self._first = np.where(listed.any(axis=0), listed.argmax(axis=0), len(closes))
+        self._start = np.array(
+            [
+                closes[first, t] if first < len(closes) else np.nan
+                for t, first in enumerate(self._first)
+            ]
+        )
+        self._close = close
+        self.block_size = min(block_size, max(len(self._growth), 1))
+
+    def sample_rows(self, seed_sequences: Sequence[np.random.SeedSequence]):
+        """Source return rows for each path, one generator per seed sequence."""
+
+        draws = len(self._growth)
+        blocks = -(-draws // self.block_size)
+        offsets = np.arange(self.block_size)
+        sampled = np.empty((len(seed_sequences), draws), dtype=np.intp)
+        if not draws:
+            return sampled
+        for path, seed_sequence in enumerate(seed_sequences):
+            starts = np.random.default_rng(seed_sequence).integers(
+                0, draws - self.block_size + 1, blocks
+            )
+            sampled[path] = (starts[:, np.newaxis] + offsets).ravel()[:draws]
+        return sampled
+
+    def paths(
+        self, seed_sequences: Sequence[np.random.SeedSequence]
+    ) -> Dict[Tuple[str, str], np.ndarray]:
+        """Price arrays shaped ``(paths, rows)`` for every ticker and field."""
+
+        sampled = self.sample_rows(seed_sequences)
+        paths = len(seed_sequences)
+        # Row 0 keeps its historical prices; row k + 1 applies return draw k.
+        source = np.concatenate(
+            [np.zeros((paths, 1), dtype=np.intp), sampled + 1], axis=1
+        )
+        columns: Dict[Tuple[str, str], np.ndarray] = {}
+        for t, ticker in enumerate(self.tickers):
+            growth = np.concatenate(
+                [np.ones((paths, 1)), self._growth[sampled, t]], axis=1
+            )
+            first = min(self._first[t], growth.shape[1] - 1)
+            cumulative = np.cumprod(growth, axis=1)
+            closes = self._start[t] * (cumulative / cumulative[:, first, np.newaxis])
+            closes[:, :first] = np.nan
+            for f, field in enumerate(self.fields):
+                values = (
+                    closes if f == self._close else closes * self._shape[source, t, f]
+                )
+                column = np.full((paths, self.rows), np.nan)
+                column[:, self._trading] = values
+                columns[(ticker, field)] = column
+        return columns
+
+
+@dataclass
+class MonteCarloOutput:
+    """Per-path metrics of every strategy run over the simulated paths.
+
+    ``distribution_df`` holds one row per run and path; ``run`` numbers the
+    expanded strategy/parameter combinations in registry order.
+    """
+
+    distribution_df: pd.DataFrame
+    paths: int
+    block_size: int
+    seed: Optional[int] = None
+
+    def summary(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95)) -> pd.DataFrame:
+        """Mean and quantiles of each metric per strategy run."""
+
+        grouped = self.distribution_df.groupby(
+            ["run", "strategy", "parameters"], sort=False
+        )[list(MONTE_CARLO_METRICS)]
+        frames = {"mean": grouped.mean()}
+        for quantile in quantiles:
+            frames[f"p{round(quantile * 100):02d}"] = grouped.quantile(quantile)
+        summary = pd.concat(frames, axis=1).swaplevel(axis=1)
+        return summary[list(MONTE_CARLO_METRICS)].reset_index()
+
+
+def path_metrics(equity: np.ndarray, index: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+    """CAGR, compounded max drawdown and Sharpe ratio of each equity path.
+
+    The formulas follow :func:`python_stocks.return_analytics.compute_return_analytics`
+    row by row along the ``(paths, rows)`` array.
+    """
+
+    paths, rows = equity.shape
+    days = (index[-1] - index[0]).days if rows else 0
+    years = days / 365.0 if rows > 1 else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = equity[:, 1:] / equity[:, :-1] - 1
+        cagr = (
+            (equity[:, -1] / equity[:, 0]) ** (1 / years) - 1
+            if years > 0
+            else np.zeros(paths)
+        )
+    valid = ~np.isnan(returns)
+    counts = valid.sum(axis=1)
+    compounded = np.cumprod(1 + np.where(valid, returns, 0.0), axis=1)
+    drawdown = compounded / np.maximum.accumulate(compounded, axis=1) - 1
+    max_drawdown = np.where(counts > 0, drawdown.min(axis=1, initial=0.0), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(valid, returns, 0.0).sum(axis=1) / counts
+        squared = np.where(valid, (mean[:, np.newaxis] - returns) ** 2, 0.0)
+        std = np.sqrt(squared.sum(axis=1) / (counts - 1))
+        volatility = std * (252**0.5)
+        sharpe = np.where(volatility != 0, (mean * 252) / volatility, 0.0)
+    sharpe = np.where(counts > 0, sharpe, 0.0)
+    return {"cagr": cagr, "max_drawdown": max_drawdown, "sharpe_ratio": sharpe}
+
+
+class MonteCarloEngine:
+    """Run vectorized strategies over block-bootstrapped price paths.
+
+    Paths are generated and simulated ``chunk_size`` at a time, so memory is
+    bounded by the chunk rather than the path count. Seeding follows
+    :meth:`SimulationEngine.run_batch`: ``SeedSequence(seed)`` spawns one
+    child per path, so a path's prices depend only on the seed and its
+    position, never on the chunk size or on which strategies run.
+    """
+
+    def __init__(
+        self,
+        historic_data,
+        *,
+        registry: Optional[StrategyRegistry] = None,
+        transaction_cost_rate: float = 0.0,
+        slippage_pct: float = 0.0,
+        block_size: int = 20,
+    ) -> None:
+        self.historic_data = historic_data
+        self._engine = SimulationEngine(
+            historic_data,
+            registry=registry,
+            transaction_cost_rate=transaction_cost_rate,
+            slippage_pct=slippage_pct,
+            reporting="silent",
+        )
+        # Like the historical replay, the last row is never traded.
+        self.rows = max(historic_data.total_days() - 1, 0)
+        self.bootstrap = BlockBootstrap(historic_data.prices, self.rows, block_size)
+
+    def _vectorized_runs(
+        self,
+        enabled_strategies: Optional[List[str]],
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+    ) -> List[Tuple[Strategy, Dict[str, object]]]:
+        strategy_runs = self._engine._expand_runs(
+            enabled_strategies, parameter_overrides
+        )
+        stepped = sorted(
+            {
+                strategy.name
+                for strategy, _ in strategy_runs
+                if not self._engine._uses_signals(strategy)
+            }
+        )
+        if enabled_strategies and stepped:
+            raise ValueError(
+                "Monte Carlo mode needs vectorized or rebalancing strategies; "
+                f"{', '.join(stepped)} only step one day at a time"
+            )
+        return [
+            (strategy, params)
+            for strategy, params in strategy_runs
+            if self._engine._uses_signals(strategy)
+        ]
+
+    def _equity(
+        self,
+        strategy: Strategy,
+        params: Dict[str, object],
+        market: MarketArrays,
+        initial_deposit: int,
+    ) -> np.ndarray:
+        engine = self._engine
+        deposits = self.historic_data.deposit_schedule()
+        if strategy.rebalance is not None:
+            rebalanced = simulate_rebalance(
+                strategy.rebalance(market, params),
+                market,
+                deposits,
+                initial_deposit,
+                transaction_cost_rate=engine.transaction_cost_rate,
+                slippage_pct=engine.slippage_pct,
+            )
+            equity = rebalanced.bank_account.copy()
+            for position, ticker in enumerate(rebalanced.tickers):
+                closes = market.filled(ticker, "Close")
+                held = rebalanced.positions[:, :, position]
+                equity += np.where(np.isnan(closes), 0.0, closes * held)
+            return equity
+
+        # _vectorized_runs rejects strategies without a whole-history form.
+        assert strategy.vectorized is not None
+        signals = strategy.vectorized(market, params)
+        fills = simulate_signals(
+            signals,
+            market,
+            deposits,
+            initial_deposit,
+            transaction_cost_rate=engine.transaction_cost_rate,
+            slippage_pct=engine.slippage_pct,
+        )
+        equity = fills.bank_account
+        if signals.ticker is not None:
+            closes = market.filled(signals.ticker, "Close")
+            equity = equity + np.where(np.isnan(closes), 0.0, closes * fills.positions)
+        return equity
+
+    def iter_chunks(
+        self,
+        initial_deposit: int,
+        *,
+        paths: int,
+        seed: Optional[int] = None,
+        chunk_size: int = 256,
+        enabled_strategies: Optional[List[str]] = None,
+        parameter_overrides: Optional[
+            Mapping[str, Mapping[str, Iterable[object]]]
+        ] = None,
+    ):
+        """Yield the per-path metrics DataFrame of each chunk of paths."""
+
+        strategy_runs = self._vectorized_runs(enabled_strategies, parameter_overrides)
+        seed_sequences = np.random.SeedSequence(seed).spawn(paths)
+        index = self.historic_data.prices.index[: self.rows]
+
+        for first in range(0, paths, max(chunk_size, 1)):
+            chunk = seed_sequences[first : first + chunk_size]
+            market = MarketArrays(
+                self.bootstrap.paths(chunk), index, indicators=IndicatorCache()
+            )
+            path_numbers = np.arange(first, first + len(chunk))
+            frames = []
+            for run, (strategy, params) in enumerate(strategy_runs):
+                equity = self._equity(strategy, params, market, initial_deposit)
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            "run": run,
+                            "strategy": strategy.name,
+                            "parameters": _format_parameters(params),
+                            "path": path_numbers,
+                            **path_metrics(equity, index),
+                        }
+                    )
+                )
+            yield pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def run(
+        self,
+        initial_deposit: int,
+        *,
+        paths: int = 1000,
+        seed: Optional[int] = None,
+        chunk_size: int = 256,
+        enabled_strategies: Optional[List[str]] = None,
+        parameter_overrides: Optional[
+            Mapping[str, Mapping[str, Iterable[object]]]
+        ] = None,
+    ) -> MonteCarloOutput:
+        """Simulate ``paths`` bootstrapped histories and collect their metrics."""
+
+        chunks = list(
+            self.iter_chunks(
+                initial_deposit,
+                paths=paths,
+                seed=seed,
+                chunk_size=chunk_size,
+                enabled_strategies=enabled_strategies,
+                parameter_overrides=parameter_overrides,
+            )
+        )
+        distribution = (
+            pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        )
+        if not distribution.empty:
+            distribution = distribution.sort_values(
+                ["run", "path"], kind="stable"
+            ).reset_index(drop=True)
+        return MonteCarloOutput(
+            distribution_df=distribution,
+            paths=paths,
+            block_size=self.bootstrap.block_size,
+            seed=seed,
+        )
+
+
+__all__ = [
+    "BlockBootstrap",
+    "MONTE_CARLO_METRICS",
+    "MonteCarloEngine",
+    "MonteCarloOutput",
+    "path_metrics",
+]
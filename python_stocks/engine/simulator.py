@@ -9,28 +9,90 @@ inspection.
 from __future__ import annotations
 
 import json
-import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
 import pandas as pd
 
+from ..indicators import IndicatorCache, IndicatorCacheStats
 from ..plotting import plt
+from ..rebalance import simulate_rebalance
 from ..registry_factory import build_default_registry
 from ..services.strategy_service import StrategyResult
+from ..signals import MarketArrays, simulate_signals
 from ..strategy_registry import Strategy, StrategyRegistry
-from ..trading_history import TradingHistory
+from ..trading_history import EquityHistory, TradingHistory
+from .checkpoint import SimulationCheckpoint, fingerprint
+from .sinks import ResultSink, sample_equity
+
+REPORTING_MODES = ("silent", "summary", "verbose")
+RETENTION_MODES = ("full", "equity", "metrics")
+
+
+def _check_reporting(reporting: str) -> str:
+    if reporting not in REPORTING_MODES:
+        raise ValueError(
+            f"Unknown reporting mode {reporting!r}; expected one of {REPORTING_MODES}"
+        )
+    return reporting
+
+
+def _check_retention(retention: str) -> str:
+    if retention not in RETENTION_MODES:
+        raise ValueError(
+            f"Unknown retention mode {retention!r}; expected one of {RETENTION_MODES}"
+        )
+    return retention
 
 
 @dataclass(frozen=True)
 class SimulationOutput:
-    """Container bundling raw histories with normalized results."""
+    """Container bundling raw histories with normalized results.
+
+    Console summaries and portfolio plots are rendered on demand from the
+    histories' cached equity curves, so a silent run can still be reported
+    afterwards.
+    """
 
     report_df: pd.DataFrame
     results: List[StrategyResult]
-    histories: List[TradingHistory]
+    histories: List[TradingHistory | EquityHistory]
+    seed: Optional[int] = None
+    indicator_stats: IndicatorCacheStats = IndicatorCacheStats()
+
+    def print_summaries(self) -> None:
+        for history in self.histories:
+            history.printer()
+
+    def plot_portfolios(self) -> None:
+        for history in self.histories:
+            history.add_port_value_to_plt()
+
+    def report(self, reporting: str) -> None:
+        """Render this output for a reporting mode.
+
+        ``silent`` renders nothing, ``summary`` prints each run's summary and
+        ``verbose`` also adds every portfolio curve to the current figure.
+        """
+
+        if _check_reporting(reporting) == "silent":
+            return
+        for history in self.histories:
+            if reporting == "verbose":
+                history.add_port_value_to_plt()
+            history.printer()
 
 
 def _format_parameters(parameters: Dict[str, object]) -> str:
@@ -42,9 +104,9 @@ def _format_parameters(parameters: Dict[str, object]) -> str:
 def _compute_trade_counts(
     trading_history: TradingHistory, tracked_tickers: List[str]
 ) -> int:
-    position_changes = (
-        trading_history.trading_history_df[tracked_tickers].diff().fillna(0)
-    )
+    positions = trading_history.trading_history_df[tracked_tickers]
+    start = getattr(trading_history, "start_row", 0)
+    position_changes = positions.iloc[start:].diff().fillna(0)
     return int((position_changes != 0).sum().sum())
 
 
@@ -65,33 +127,14 @@ def _compute_metrics(
     benchmark_ticker: Optional[str] = None,
     time_in_market_penalty_rate: float = 0.01,
 ) -> Dict[str, float | int]:
-    portfolio_values = pd.Series(
-        trading_history.portfolio_value_history(),
-        index=trading_history.trading_history_df.index,
-    )
-    returns = portfolio_values.pct_change().dropna()
-    years = (
-        (portfolio_values.index[-1] - portfolio_values.index[0]).days / 365.0
-        if len(portfolio_values.index) > 1
-        else 0
-    )
-
-    cagr = (
-        (portfolio_values.iloc[-1] / portfolio_values.iloc[0]) ** (1 / years) - 1
-        if years > 0
-        else 0
-    )
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.cummax()
-    drawdown = cumulative / running_max - 1
-    max_drawdown = drawdown.min() if not drawdown.empty else 0
-
-    volatility = returns.std() * (252**0.5) if not returns.empty else 0
-    sharpe = (returns.mean() * 252) / volatility if volatility else 0
+    # Warm-up rows (before ``start_row``) are not scored.
+    start = getattr(trading_history, "start_row", 0)
+    portfolio_values = trading_history.equity_curve().iloc[start:]
+    analytics = trading_history.return_analytics()
 
     trade_counts = _compute_trade_counts(trading_history, tracked_tickers)
 
-    positions = trading_history.trading_history_df[tracked_tickers]
+    positions = trading_history.trading_history_df[tracked_tickers].iloc[start:]
     invested_days = (
         int((positions.abs().sum(axis=1) > 0).sum()) if not positions.empty else 0
     )
@@ -105,9 +148,11 @@ def _compute_metrics(
     )
     benchmark_series = pd.Series(dtype=float)
     if benchmark_symbol and benchmark_symbol in trading_history.stock_df_to_today:
-        benchmark_series = trading_history.stock_df_to_today[benchmark_symbol][
-            "Close"
-        ].ffill()
+        benchmark_series = (
+            trading_history.stock_df_to_today[benchmark_symbol]["Close"]
+            .ffill()
+            .iloc[start:]
+        )
     tracking_error = (
         _tracking_error(portfolio_values, benchmark_series)
         if not benchmark_series.empty
@@ -115,10 +160,10 @@ def _compute_metrics(
     )
 
     return {
-        "cagr": cagr,
-        "max_drawdown": max_drawdown,
-        "volatility": volatility,
-        "sharpe_ratio": sharpe,
+        "cagr": analytics.cagr,
+        "max_drawdown": analytics.max_drawdown,
+        "volatility": analytics.volatility,
+        "sharpe_ratio": analytics.sharpe_ratio,
         "trade_count": trade_counts,
         "total_fees": trading_history.total_fees,
         "slippage_cost": trading_history.total_slippage_cost,
@@ -128,8 +173,43 @@ def _compute_metrics(
     }
 
 
+def _build_result(
+    strategy: Strategy, params: Dict[str, object], metrics: Dict[str, float | int]
+) -> StrategyResult:
+    return StrategyResult(
+        strategy=strategy.name,
+        parameters=params,
+        cagr=metrics["cagr"],
+        max_drawdown=metrics["max_drawdown"],
+        volatility=metrics["volatility"],
+        sharpe_ratio=metrics["sharpe_ratio"],
+        trade_count=int(metrics["trade_count"]),
+        total_fees=metrics["total_fees"],
+        slippage_cost=metrics["slippage_cost"],
+        tracking_error=metrics["tracking_error"],
+        time_in_market_penalty=metrics["time_in_market_penalty"],
+    )
+
+
 class SimulationEngine:
-    """Batch-capable simulation engine with deterministic seeds."""
+    """Batch-capable simulation engine with deterministic seeds.
+
+    ``reporting`` selects what each run renders as it completes: ``"silent"``
+    (nothing), ``"summary"`` (console summaries) or ``"verbose"`` (summaries
+    plus portfolio curves on the current matplotlib figure). Individual calls
+    can override it.
+
+    ``retention`` sets what a finished run keeps once it has been scored:
+    ``"full"`` keeps the :class:`TradingHistory` with its daily ledger,
+    ``"equity"`` an :class:`EquityHistory` holding a float32 equity curve,
+    and ``"metrics"`` nothing beyond the :class:`StrategyResult`. The compact
+    modes also simulate runs in chunks, so a sweep's memory grows with the
+    number of combinations rather than combinations x days x tickers.
+
+    ``warmup_days`` leading rows feed prices and indicators to the runs
+    without trading or scoring them: every run starts with its deposit on
+    that row, and its metrics cover only the rows from there on.
+    """
 
     def __init__(
         self,
@@ -139,42 +219,53 @@ class SimulationEngine:
         transaction_cost_rate: float = 0.0,
         slippage_pct: float = 0.0,
         benchmark_ticker: Optional[str] = None,
+        vectorized: bool = True,
+        reporting: str = "verbose",
+        retention: str = "full",
+        warmup_days: int = 0,
     ) -> None:
         self.historic_data = historic_data
         self.registry = registry
         self.transaction_cost_rate = max(0.0, transaction_cost_rate)
         self.slippage_pct = max(0.0, slippage_pct)
         self.benchmark_ticker = benchmark_ticker
+        self.vectorized = vectorized
+        self.reporting = _check_reporting(reporting)
+        self.retention = _check_retention(retention)
+        self.warmup_days = max(0, warmup_days)
 
     def _build_registry(self) -> StrategyRegistry:
         if self.registry is not None:
             return self.registry
         return build_default_registry(self.historic_data.tickers())
 
-    def _seed(self, seed: Optional[int]) -> None:
-        if seed is None:
-            return
-        random.seed(seed)
-        np.random.seed(seed)
+    def _expand_runs(
+        self,
+        enabled_strategies: Optional[List[str]],
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+    ) -> List[Tuple[Strategy, Dict[str, object]]]:
+        registry = self._build_registry()
+        return registry.expand_strategies(enabled_strategies, parameter_overrides)
+
+    def _uses_signals(self, strategy: Strategy) -> bool:
+        if strategy.rebalance is not None:
+            return True
+        return self.vectorized and strategy.vectorized is not None
 
     def _build_histories(
         self,
         initial_deposit: int,
-        registry: StrategyRegistry,
-        enabled_strategies: Optional[List[str]],
-        parameter_overrides: Optional[Dict[str, Dict[str, Iterable[object]]]],
+        strategy_runs: List[Tuple[Strategy, Dict[str, object]]],
+        seed_sequences: List[np.random.SeedSequence],
+        indicator_cache: IndicatorCache,
     ) -> List[Tuple[TradingHistory, Strategy, Dict[str, object]]]:
         ticker_list = list(self.historic_data.tickers())
 
         ticker_list.append("bank_account")
         ticker_list.append("money_invested")
 
-        strategy_runs = registry.expand_strategies(
-            enabled_strategies, parameter_overrides
-        )
-
         histories: List[Tuple[TradingHistory, Strategy, Dict[str, object]]] = []
-        for strategy, params in strategy_runs:
+        for (strategy, params), seed_sequence in zip(strategy_runs, seed_sequences):
             runner = strategy.build_runner(params)
             label = f"{strategy.name} {_format_parameters(params)}"
             history = TradingHistory(
@@ -184,83 +275,706 @@ class SimulationEngine:
                 label,
                 transaction_cost_rate=self.transaction_cost_rate,
                 slippage_pct=self.slippage_pct,
+                capacity=self.historic_data.total_days(),
+                rng=np.random.default_rng(seed_sequence),
+                start_row=self.warmup_days,
             )
+            if strategy.indicators is not None and not self._uses_signals(strategy):
+                history.indicators = indicator_cache.indicator_set(
+                    strategy.indicators(params)
+                )
             histories.append((history, strategy, params))
         return histories
 
-    def run_once(
+    def _simulate(
         self,
         initial_deposit: int,
-        *,
-        enabled_strategies: Optional[List[str]] = None,
-        parameter_overrides: Optional[Dict[str, Dict[str, Iterable[object]]]] = None,
-        seed: Optional[int] = None,
-    ) -> SimulationOutput:
-        self._seed(seed)
-        registry = self._build_registry()
-
+        strategy_runs: List[Tuple[Strategy, Dict[str, object]]],
+        seed_sequences: List[np.random.SeedSequence],
+        indicator_cache: Optional[IndicatorCache] = None,
+        checkpoint: Optional[SimulationCheckpoint] = None,
+        call_key: str = "",
+    ) -> List[Tuple[Optional[TradingHistory | EquityHistory], StrategyResult]]:
+        """Step the given runs through every day and score each history.
+
+        Indicators declared by the runs are shared through ``indicator_cache``
+        and updated once per bar, however many runs read them. With a
+        ``checkpoint`` the loop is saved periodically and, when a snapshot for
+        the same call exists, continued from it. A finished snapshot of the
+        call over fewer rows (see ``SimulationCheckpoint(incremental=True)``)
+        is extended: only the appended days are stepped.
+        """
+
+        if indicator_cache is None:
+            indicator_cache = IndicatorCache()
         histories = self._build_histories(
-            initial_deposit, registry, enabled_strategies, parameter_overrides
+            initial_deposit, strategy_runs, seed_sequences, indicator_cache
         )
-
-        for row_n in range(1, self.historic_data.total_days()):
-            stock_df_to_today, money_to_add = (
-                self.historic_data.get_stock_df_to_today_and_money_to_add(row_n)
+        stepped = [
+            history
+            for history, strategy, _ in histories
+            if not self._uses_signals(strategy)
+        ]
+
+        total_days = self.historic_data.total_days()
+        market = self.historic_data.market_view()
+        first_row, state, data_key = 1, None, ""
+        if checkpoint is not None:
+            data_key = self._data_key(total_days)
+            call_key = fingerprint(
+                call_key, [history.name for history, _, _ in histories]
             )
-            for history, _, _ in histories:
-                history.new_day(stock_df_to_today, money_to_add)
+            state = checkpoint.load(call_key, total_days, self._data_key)
+
+        if state is not None and state.complete and state.rows == total_days:
+            market.seek(max(total_days - 2, 0))
+            for position, (history, _, _) in enumerate(histories):
+                state.restore(history, position)
+                history.market = market
+        else:
+            if state is not None:
+                # A finished snapshot holds every history; a periodic one
+                # only the stepped ones. Vectorized runs are recomputed below.
+                positions = (
+                    [
+                        position
+                        for position, (_, strategy, _) in enumerate(histories)
+                        if not self._uses_signals(strategy)
+                    ]
+                    if state.complete
+                    else range(len(stepped))
+                )
+                for position, history in zip(positions, stepped):
+                    state.restore(history, position)
+                indicator_cache.restore(state.indicators)
+                first_row = state.next_row
+
+            for row_n in range(first_row, total_days):
+                market.seek(row_n - 1)
+                money_to_add = market.money_to_add
+                indicator_cache.update(market)
+                for history in stepped:
+                    history.new_day(market, money_to_add)
+                if checkpoint is not None and checkpoint.due(row_n):
+                    checkpoint.save(
+                        call_key,
+                        row_n + 1,
+                        stepped,
+                        rows=total_days,
+                        data_key=data_key,
+                        indicators=indicator_cache.snapshot(),
+                    )
+
+            if len(stepped) < len(histories):
+                self._fill_vectorized(
+                    initial_deposit, histories, market, indicator_cache
+                )
+            if checkpoint is not None:
+                checkpoint.save(
+                    call_key,
+                    total_days,
+                    [history for history, _, _ in histories],
+                    complete=True,
+                    rows=total_days,
+                    data_key=data_key,
+                    indicators=indicator_cache.snapshot(),
+                )
 
-        results: List[StrategyResult] = []
         tracked_tickers = list(self.historic_data.tickers())
+        index = histories[0][0].ledger.index if histories else None
+        simulated = []
         for history, strategy, params in histories:
-            history.add_port_value_to_plt()
-            history.printer()
+            result = _build_result(
+                strategy,
+                params,
+                _compute_metrics(
+                    history,
+                    tracked_tickers,
+                    benchmark_ticker=self.benchmark_ticker,
+                ),
+            )
+            simulated.append((self._retain(history, index), result))
+        return simulated
+
+    def _retain(
+        self, history: TradingHistory, index: Optional[pd.DatetimeIndex]
+    ) -> Optional[TradingHistory | EquityHistory]:
+        """What the retention mode keeps of a scored history."""
+
+        if self.retention == "full":
+            return history
+        if self.retention == "equity":
+            return EquityHistory.from_history(history, index)
+        return None
+
+    def _simulate_chunks(
+        self,
+        initial_deposit: int,
+        strategy_runs: List[Tuple[Strategy, Dict[str, object]]],
+        seed_sequences: List[np.random.SeedSequence],
+        checkpoint: Optional[SimulationCheckpoint],
+        call_key: str,
+        chunk_size: int,
+    ) -> Tuple[
+        List[Tuple[Optional[TradingHistory | EquityHistory], StrategyResult]],
+        IndicatorCacheStats,
+    ]:
+        """:meth:`_simulate`, ``chunk_size`` runs at a time unless retaining all.
+
+        Full histories are needed until the end anyway, so ``"full"`` steps
+        every run together and shares indicators across all of them.
+        """
+
+        if self.retention == "full" or chunk_size >= len(strategy_runs):
+            indicator_cache = IndicatorCache()
+            simulated = self._simulate(
+                initial_deposit,
+                strategy_runs,
+                seed_sequences,
+                indicator_cache,
+                checkpoint,
+                call_key,
+            )
+            return simulated, indicator_cache.stats
+
+        chunk_size = max(chunk_size, 1)
+        simulated = []
+        indicator_stats = IndicatorCacheStats()
+        for number, start in enumerate(range(0, len(strategy_runs), chunk_size)):
+            indicator_cache = IndicatorCache()
+            simulated += self._simulate(
+                initial_deposit,
+                strategy_runs[start : start + chunk_size],
+                seed_sequences[start : start + chunk_size],
+                indicator_cache,
+                checkpoint.child(f"chunk-{number}") if checkpoint else None,
+                call_key,
+            )
+            indicator_stats += indicator_cache.stats
+        return simulated, indicator_stats
+
+    def _fill_vectorized(
+        self,
+        initial_deposit: int,
+        histories: List[Tuple[TradingHistory, Strategy, Dict[str, object]]],
+        market,
+        indicator_cache: IndicatorCache,
+    ) -> None:
+        """Fill vectorized runs from their whole-history signals or weights.
+
+        Covers the same rows as the day loop in :meth:`_simulate` (every row
+        but the last) and leaves the histories pointing at the shared market
+        view on the final simulated day.
+        """
 
-            metrics = _compute_metrics(
-                history,
-                tracked_tickers,
-                benchmark_ticker=self.benchmark_ticker,
+        rows = max(self.historic_data.total_days() - 1, 0)
+        if not rows:
+            return
+        arrays = MarketArrays.from_price_matrix(
+            self.historic_data.prices, rows, indicators=indicator_cache
+        )
+        market.seek(rows - 1)
+        for history, strategy, params in histories:
+            if not self._uses_signals(strategy):
+                continue
+            if strategy.rebalance is not None:
+                rebalanced = simulate_rebalance(
+                    strategy.rebalance(arrays, params),
+                    arrays,
+                    market.deposits,
+                    initial_deposit,
+                    transaction_cost_rate=self.transaction_cost_rate,
+                    slippage_pct=self.slippage_pct,
+                    start_row=self.warmup_days,
+                )
+                history.record_rebalance(rebalanced, arrays.index)
+                history.market = market
+                continue
+            # _uses_signals admits only rebalancing or vectorized strategies.
+            assert strategy.vectorized is not None
+            signals = strategy.vectorized(arrays, params)
+            fills = simulate_signals(
+                signals,
+                arrays,
+                market.deposits,
+                initial_deposit,
+                transaction_cost_rate=self.transaction_cost_rate,
+                slippage_pct=self.slippage_pct,
+                start_row=self.warmup_days,
             )
-            results.append(
-                StrategyResult(
-                    strategy=strategy.name,
-                    parameters=params,
-                    cagr=metrics["cagr"],
-                    max_drawdown=metrics["max_drawdown"],
-                    volatility=metrics["volatility"],
-                    sharpe_ratio=metrics["sharpe_ratio"],
-                    trade_count=int(metrics["trade_count"]),
-                    total_fees=metrics["total_fees"],
-                    slippage_cost=metrics["slippage_cost"],
-                    tracking_error=metrics["tracking_error"],
-                    time_in_market_penalty=metrics["time_in_market_penalty"],
+            history.record_fills(fills, arrays.index, signals.ticker)
+            history.market = market
+
+    def _simulate_parallel(
+        self,
+        initial_deposit: int,
+        run_indices: List[int],
+        seed_sequences: List[np.random.SeedSequence],
+        workers: int,
+        enabled_strategies: Optional[List[str]],
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+        checkpoint: Optional[SimulationCheckpoint] = None,
+        call_key: str = "",
+        chunk_size: int = 64,
+    ) -> Tuple[
+        List[Tuple[Optional[TradingHistory | EquityHistory], StrategyResult]],
+        IndicatorCacheStats,
+    ]:
+        """Shard the expanded runs across a process pool.
+
+        Each worker receives the engine (and with it the read-only market data)
+        once through the pool initializer, re-expands the same strategy grid
+        and simulates only its shard of ``run_indices``. Results are merged
+        back by run index so the output order matches a serial run.
+        """
+
+        shard_count = min(workers, len(run_indices))
+        shards = [run_indices[start::shard_count] for start in range(shard_count)]
+        seed_by_index = dict(zip(run_indices, seed_sequences))
+        completed: Dict[
+            int, Tuple[Optional[TradingHistory | EquityHistory], StrategyResult]
+        ] = {}
+        indicator_stats = IndicatorCacheStats()
+        with ProcessPoolExecutor(
+            max_workers=shard_count, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_shard,
+                    initial_deposit,
+                    enabled_strategies,
+                    parameter_overrides,
+                    shard,
+                    [seed_by_index[index] for index in shard],
+                    checkpoint.child(f"shard-{number}") if checkpoint else None,
+                    call_key,
+                    chunk_size,
+                )
+                for number, shard in enumerate(shards)
+            ]
+            for future in futures:
+                shard_results, shard_stats = future.result()
+                indicator_stats += shard_stats
+                for index, history, result in shard_results:
+                    completed[index] = (history, result)
+
+        merged = [completed[index] for index in run_indices]
+        self._attach_market([history for history, _ in merged])
+        return merged, indicator_stats
+
+    def _call_key(self, initial_deposit: int, seed: Optional[int]) -> str:
+        """Fingerprint of the settings a checkpoint must match to be resumed.
+
+        The market data is matched separately, row by row, by :meth:`_data_key`.
+        """
+
+        return fingerprint(
+            initial_deposit,
+            seed,
+            self.historic_data.tickers(),
+            self.transaction_cost_rate,
+            self.slippage_pct,
+            self.vectorized,
+            self.warmup_days,
+        )
+
+    def _data_key(self, rows: int) -> str:
+        """Fingerprint of the first ``rows`` rows of prices and deposits."""
+
+        data = self.historic_data
+        return fingerprint(
+            data.prices.fields,
+            data.prices.index[:rows].to_numpy(),
+            data.prices.raw[:rows],
+            data.deposit_schedule()[:rows],
+        )
+
+    def _attach_market(self, histories) -> None:
+        """Point histories received from a worker at this process's market data."""
+
+        market = self.historic_data.market_view(
+            cursor=max(self.historic_data.total_days() - 2, 0)
+        )
+        for history in histories:
+            if isinstance(history, TradingHistory):
+                history.market = market
+
+    def _stream_to_sink(
+        self,
+        initial_deposit: int,
+        run_indices: List[int],
+        strategy_runs: List[Tuple[Strategy, Dict[str, object]]],
+        seed_sequences: List[np.random.SeedSequence],
+        workers: int,
+        enabled_strategies: Optional[List[str]],
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+        checkpoint: Optional[SimulationCheckpoint],
+        call_key: str,
+        sink: ResultSink,
+        chunk_size: int,
+    ) -> Tuple[List[StrategyResult], IndicatorCacheStats]:
+        """Simulate ``chunk_size`` runs at a time and write them to ``sink``.
+
+        Only the results are kept; each chunk's histories are released once
+        its results and equity samples are written. With ``workers`` the
+        chunks run in a process pool and are written as they complete.
+        """
+
+        chunk_size = max(chunk_size, 1)
+        chunks = [
+            list(range(start, min(start + chunk_size, len(run_indices))))
+            for start in range(0, len(run_indices), chunk_size)
+        ]
+        results: Dict[int, StrategyResult] = {}
+        indicator_stats = IndicatorCacheStats()
+
+        def chunk_checkpoint(number: int) -> Optional[SimulationCheckpoint]:
+            return checkpoint.child(f"chunk-{number}") if checkpoint else None
+
+        if workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_chunk,
+                        initial_deposit,
+                        enabled_strategies,
+                        parameter_overrides,
+                        [run_indices[position] for position in chunk],
+                        [seed_sequences[position] for position in chunk],
+                        chunk_checkpoint(number),
+                        call_key,
+                        sink.equity_frequency,
+                    )
+                    for number, chunk in enumerate(chunks)
+                ]
+                for future in as_completed(futures):
+                    written, chunk_stats = future.result()
+                    indicator_stats += chunk_stats
+                    for index, result, equity in written:
+                        sink.write(index, result, equity)
+                        results[index] = result
+        else:
+            for number, chunk in enumerate(chunks):
+                indicator_cache = IndicatorCache()
+                simulated = self._simulate(
+                    initial_deposit,
+                    [strategy_runs[position] for position in chunk],
+                    [seed_sequences[position] for position in chunk],
+                    indicator_cache,
+                    chunk_checkpoint(number),
+                    call_key,
                 )
+                indicator_stats += indicator_cache.stats
+                for position, (history, result) in zip(chunk, simulated):
+                    index = run_indices[position]
+                    sink.write(
+                        index, result, sample_equity(history, sink.equity_frequency)
+                    )
+                    results[index] = result
+
+        return [results[index] for index in run_indices], indicator_stats
+
+    def _execute(
+        self,
+        initial_deposit: int,
+        *,
+        enabled_strategies: Optional[List[str]],
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+        seed: Optional[int],
+        workers: int,
+        run_indices: Optional[Sequence[int]] = None,
+        checkpoint: Optional[SimulationCheckpoint] = None,
+        sink: Optional[ResultSink] = None,
+        chunk_size: int = 64,
+    ) -> SimulationOutput:
+        strategy_runs = self._expand_runs(enabled_strategies, parameter_overrides)
+        # Every run draws from its own stream spawned from the seed, so results
+        # do not depend on global RNG state, run order, the selected subset or
+        # process placement.
+        seed_sequences = np.random.SeedSequence(seed).spawn(len(strategy_runs))
+        if run_indices is None:
+            run_indices = range(len(strategy_runs))
+        run_indices = list(run_indices)
+        strategy_runs = [strategy_runs[index] for index in run_indices]
+        seed_sequences = [seed_sequences[index] for index in run_indices]
+        call_key = "" if checkpoint is None else self._call_key(initial_deposit, seed)
+
+        if sink is not None:
+            results, indicator_stats = self._stream_to_sink(
+                initial_deposit,
+                run_indices,
+                strategy_runs,
+                seed_sequences,
+                workers,
+                enabled_strategies,
+                parameter_overrides,
+                checkpoint,
+                call_key,
+                sink,
+                chunk_size,
+            )
+            return SimulationOutput(
+                report_df=pd.DataFrame([result.as_dict() for result in results]),
+                results=results,
+                histories=[],
+                seed=seed,
+                indicator_stats=indicator_stats,
             )
 
+        if workers > 1 and len(strategy_runs) > 1:
+            simulated, indicator_stats = self._simulate_parallel(
+                initial_deposit,
+                run_indices,
+                seed_sequences,
+                workers,
+                enabled_strategies,
+                parameter_overrides,
+                checkpoint,
+                call_key,
+                chunk_size,
+            )
+        else:
+            simulated, indicator_stats = self._simulate_chunks(
+                initial_deposit,
+                strategy_runs,
+                seed_sequences,
+                checkpoint,
+                call_key,
+                chunk_size,
+            )
+
+        results = [result for _, result in simulated]
         report_df = pd.DataFrame([result.as_dict() for result in results])
         return SimulationOutput(
-            report_df=report_df, results=results, histories=[h for h, _, _ in histories]
+            report_df=report_df,
+            results=results,
+            histories=[history for history, _ in simulated if history is not None],
+            seed=seed,
+            indicator_stats=indicator_stats,
         )
 
-    def run_batch(
+    def run_once(
+        self,
+        initial_deposit: int,
+        *,
+        enabled_strategies: Optional[List[str]] = None,
+        parameter_overrides: Optional[
+            Mapping[str, Mapping[str, Iterable[object]]]
+        ] = None,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        reporting: Optional[str] = None,
+        run_indices: Optional[Sequence[int]] = None,
+        checkpoint: Optional[SimulationCheckpoint] = None,
+        sink: Optional[ResultSink] = None,
+        chunk_size: int = 64,
+    ) -> SimulationOutput:
+        """Simulate every expanded strategy run over the loaded history.
+
+        ``workers`` greater than one distributes the runs across that many
+        processes; the report and histories keep the serial ordering.
+        ``reporting`` overrides the engine's reporting mode for this call.
+        ``run_indices`` restricts the call to those positions of the expanded
+        run list, in the given order; each run keeps the seed stream it would
+        get in a full run. ``checkpoint`` saves the day loop periodically and
+        resumes a matching earlier call; the output is the same as an
+        uninterrupted run. With a ``sink`` the runs are simulated
+        ``chunk_size`` at a time and each result is written to it as its
+        chunk finishes; the output then carries results but no histories.
+        ``chunk_size`` also bounds the runs stepped together under a compact
+        retention mode.
+        """
+
+        output = self._execute(
+            initial_deposit,
+            enabled_strategies=enabled_strategies,
+            parameter_overrides=parameter_overrides,
+            seed=seed,
+            workers=workers,
+            run_indices=run_indices,
+            checkpoint=checkpoint,
+            sink=sink,
+            chunk_size=chunk_size,
+        )
+        output.report(reporting or self.reporting)
+        return output
+
+    def iter_batch(
         self,
         initial_deposit: int,
         *,
         seeds: Iterable[int],
         enabled_strategies: Optional[List[str]] = None,
-        parameter_overrides: Optional[Dict[str, Dict[str, Iterable[object]]]] = None,
-    ) -> List[SimulationOutput]:
-        outputs: List[SimulationOutput] = []
-        for seed in seeds:
-            outputs.append(
-                self.run_once(
+        parameter_overrides: Optional[
+            Mapping[str, Mapping[str, Iterable[object]]]
+        ] = None,
+        workers: int = 1,
+        reporting: Optional[str] = None,
+        checkpoint: Optional[SimulationCheckpoint] = None,
+    ) -> Iterator[SimulationOutput]:
+        """Yield one output per seed as soon as it finishes.
+
+        With ``workers`` greater than one the seeds run in separate processes
+        and outputs arrive in completion order; ``SimulationOutput.seed``
+        identifies each one. Every seed's output is identical to a serial
+        ``run_once`` with the same seed. Each seed checkpoints into its own
+        subdirectory of ``checkpoint``.
+        """
+
+        def seed_checkpoint(seed: int) -> Optional[SimulationCheckpoint]:
+            return checkpoint.child(f"seed-{seed}") if checkpoint else None
+
+        seeds = list(seeds)
+        if workers <= 1 or len(seeds) <= 1:
+            for seed in seeds:
+                yield self.run_once(
                     initial_deposit,
                     enabled_strategies=enabled_strategies,
                     parameter_overrides=parameter_overrides,
                     seed=seed,
+                    reporting=reporting,
+                    checkpoint=seed_checkpoint(seed),
                 )
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(seeds)),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_seed,
+                    initial_deposit,
+                    enabled_strategies,
+                    parameter_overrides,
+                    seed,
+                    seed_checkpoint(seed),
+                )
+                for seed in seeds
+            ]
+            for future in as_completed(futures):
+                output = future.result()
+                self._attach_market(output.histories)
+                output.report(reporting or self.reporting)
+                yield output
+
+    def run_batch(
+        self,
+        initial_deposit: int,
+        *,
+        seeds: Iterable[int],
+        enabled_strategies: Optional[List[str]] = None,
+        parameter_overrides: Optional[
+            Mapping[str, Mapping[str, Iterable[object]]]
+        ] = None,
+        workers: int = 1,
+        reporting: Optional[str] = None,
+        checkpoint: Optional[SimulationCheckpoint] = None,
+    ) -> List[SimulationOutput]:
+        """Run one simulation per seed and return the outputs in seed order."""
+
+        seeds = list(seeds)
+        outputs = {
+            output.seed: output
+            for output in self.iter_batch(
+                initial_deposit,
+                seeds=seeds,
+                enabled_strategies=enabled_strategies,
+                parameter_overrides=parameter_overrides,
+                workers=workers,
+                reporting=reporting,
+                checkpoint=checkpoint,
             )
-        return outputs
+        }
+        return [outputs[seed] for seed in seeds]
+
+
+_WORKER_ENGINE: Optional[SimulationEngine] = None
+
+
+def _init_worker(engine: SimulationEngine) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine
+
+
+def _worker_engine() -> SimulationEngine:
+    assert _WORKER_ENGINE is not None, "worker was not initialized"
+    return _WORKER_ENGINE
+
+
+def _run_shard(
+    initial_deposit: int,
+    enabled_strategies: Optional[List[str]],
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+    indices: List[int],
+    seed_sequences: List[np.random.SeedSequence],
+    checkpoint: Optional[SimulationCheckpoint] = None,
+    call_key: str = "",
+    chunk_size: int = 64,
+) -> Tuple[
+    List[Tuple[int, Optional[TradingHistory | EquityHistory], StrategyResult]],
+    IndicatorCacheStats,
+]:
+    engine = _worker_engine()
+    strategy_runs = engine._expand_runs(enabled_strategies, parameter_overrides)
+    simulated, indicator_stats = engine._simulate_chunks(
+        initial_deposit,
+        [strategy_runs[index] for index in indices],
+        seed_sequences,
+        checkpoint,
+        call_key,
+        chunk_size,
+    )
+    return [
+        (index, history, result) for index, (history, result) in zip(indices, simulated)
+    ], indicator_stats
+
+
+def _run_chunk(
+    initial_deposit: int,
+    enabled_strategies: Optional[List[str]],
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+    indices: List[int],
+    seed_sequences: List[np.random.SeedSequence],
+    checkpoint: Optional[SimulationCheckpoint],
+    call_key: str,
+    equity_frequency: Optional[str],
+) -> Tuple[List[Tuple[int, StrategyResult, Optional[pd.Series]]], IndicatorCacheStats]:
+    simulated, indicator_stats = _run_shard(
+        initial_deposit,
+        enabled_strategies,
+        parameter_overrides,
+        indices,
+        seed_sequences,
+        checkpoint,
+        call_key,
+    )
+    return [
+        (index, result, sample_equity(history, equity_frequency))
+        for index, history, result in simulated
+    ], indicator_stats
+
+
+def _run_seed(
+    initial_deposit: int,
+    enabled_strategies: Optional[List[str]],
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+    seed: int,
+    checkpoint: Optional[SimulationCheckpoint] = None,
+) -> SimulationOutput:
+    return _worker_engine()._execute(
+        initial_deposit,
+        enabled_strategies=enabled_strategies,
+        parameter_overrides=parameter_overrides,
+        seed=seed,
+        workers=1,
+        checkpoint=checkpoint,
+    )
 
 
 def render_summary_artifacts(
@@ -279,10 +993,9 @@ def render_summary_artifacts(
 
     for history in output.histories:
         fig = plt.figure()
+        portfolio_values = history.equity_curve()
         plt.plot(
-            history.trading_history_df.index,
-            history.portfolio_value_history(),
-            label=history.name,
+            portfolio_values.index, portfolio_values.to_numpy(), label=history.name
         )
         plt.legend()
         plt.title(f"Portfolio value - {history.name}")
@@ -299,6 +1012,8 @@ def render_summary_artifacts(
 
 
 __all__ = [
+    "REPORTING_MODES",
+    "RETENTION_MODES",
     "SimulationEngine",
     "SimulationOutput",
     "render_summary_artifacts",
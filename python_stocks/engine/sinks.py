@@ -0,0 +1,298 @@
+"""Streaming sinks that write each finished run instead of keeping it.
+
+A sweep over thousands of parameter combinations holds every
+:class:`~python_stocks.trading_history.TradingHistory` until ``report_df`` is
+built. Passing a sink to :meth:`SimulationEngine.run_once` simulates the runs a
+chunk at a time, writes each result (and optionally a downsampled equity
+curve) as soon as its chunk finishes and drops the histories, so memory stays
+flat however large the grid is.
+"""
+
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+
+import pandas as pd
+
+from ..services.strategy_service import StrategyResult
+from ..trading_history import EquityHistory, TradingHistory
+
+RESULT_COLUMNS = ["run"] + [
+    result_field.name for result_field in dataclasses.fields(StrategyResult)
+]
+EQUITY_COLUMNS = ["run", "date", "equity"]
+
+
+class ResultSink(Protocol):
+    """Destination for finished runs, written in completion order."""
+
+    equity_frequency: Optional[str]
+
+    def write(
+        self, run: int, result: StrategyResult, equity: Optional[pd.Series] = None
+    ) -> None:
+        """Record one run; ``run`` is its position in the expanded run list."""
+
+    def close(self) -> None:
+        """Flush and release the destination."""
+
+    def __enter__(self) -> ResultSink: ...
+
+    def __exit__(self, *exc_info: object) -> None: ...
+
+
+def sample_equity(
+    history: Optional[TradingHistory | EquityHistory], frequency: Optional[str]
+) -> Optional[pd.Series]:
+    """The history's equity curve at ``frequency`` (a pandas offset alias).
+
+    Each period keeps its last value; ``None`` means no curve is written
+    (also when the engine's retention mode kept no history).
+    """
+
+    if frequency is None or history is None:
+        return None
+    return history.equity_curve().resample(frequency).last().dropna()
+
+
+def _result_row(run: int, result: StrategyResult) -> Dict[str, Any]:
+    row = {"run": run, **result.as_dict()}
+    row["parameters"] = json.dumps(result.parameters, sort_keys=True)
+    return row
+
+
+def _equity_rows(run: int, equity: Optional[pd.Series]) -> List[Dict[str, Any]]:
+    if equity is None:
+        return []
+    return [
+        {"run": run, "date": date, "equity": float(value)}
+        for date, value in equity.items()
+    ]
+
+
+def _equity_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}_equity{path.suffix}")
+
+
+class _FileSink(ABC):
+    """Shared setup for sinks writing to ``path``; usable as a context manager."""
+
+    def __init__(
+        self, path: os.PathLike | str, *, equity_frequency: Optional[str] = None
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.equity_frequency = equity_frequency
+        self.written = 0
+
+    @abstractmethod
+    def write(
+        self, run: int, result: StrategyResult, equity: Optional[pd.Series] = None
+    ) -> None:
+        """Record one run; ``run`` is its position in the expanded run list."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and release the destination."""
+
+    def __enter__(self) -> _FileSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class CsvResultSink(_FileSink):
+    """One CSV row per run; equity curves go to ``<name>_equity.csv``.
+
+    Parameters are written as JSON, and equity rows are ``run, date, equity``.
+    """
+
+    def __init__(
+        self, path: os.PathLike | str, *, equity_frequency: Optional[str] = None
+    ) -> None:
+        super().__init__(path, equity_frequency=equity_frequency)
+        self._handle = open(self.path, "w", newline="")
+        self._writer = csv.DictWriter(self._handle, RESULT_COLUMNS)
+        self._writer.writeheader()
+        self._equity_handle = None
+        self._equity_writer = None
+        if equity_frequency is not None:
+            self._equity_handle = open(_equity_path(self.path), "w", newline="")
+            self._equity_writer = csv.DictWriter(self._equity_handle, EQUITY_COLUMNS)
+            self._equity_writer.writeheader()
+
+    def write(
+        self, run: int, result: StrategyResult, equity: Optional[pd.Series] = None
+    ) -> None:
+        self._writer.writerow(_result_row(run, result))
+        if self._equity_writer is not None:
+            self._equity_writer.writerows(
+                {**row, "date": row["date"].date().isoformat()}
+                for row in _equity_rows(run, equity)
+            )
+        self.written += 1
+
+    def close(self) -> None:
+        for handle in (self._handle, self._equity_handle):
+            if handle is not None and not handle.closed:
+                handle.close()
+
+
+class NdjsonResultSink(_FileSink):
+    """One JSON object per line and run, with the equity curve embedded.
+
+    The curve, when sampled, is stored as parallel ``dates``/``values`` lists
+    under ``equity``.
+    """
+
+    def __init__(
+        self, path: os.PathLike | str, *, equity_frequency: Optional[str] = None
+    ) -> None:
+        super().__init__(path, equity_frequency=equity_frequency)
+        self._handle = open(self.path, "w")
+
+    def write(
+        self, run: int, result: StrategyResult, equity: Optional[pd.Series] = None
+    ) -> None:
+        record: Dict[str, Any] = {"run": run, **result.as_dict()}
+        if equity is not None:
+            record["equity"] = {
+                "dates": [date.date().isoformat() for date in equity.index],
+                "values": [float(value) for value in equity],
+            }
+        self._handle.write(json.dumps(record) + "\n")
+        self.written += 1
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+class ParquetResultSink(_FileSink):
+    """Results (and ``<name>_equity.parquet``) written in row groups.
+
+    Rows are buffered ``row_group_size`` at a time and appended through
+    ``pyarrow.parquet.ParquetWriter``, so the file grows as runs finish.
+    Requires the optional ``pyarrow`` dependency.
+    """
+
+    def __init__(
+        self,
+        path: os.PathLike | str,
+        *,
+        equity_frequency: Optional[str] = None,
+        row_group_size: int = 1024,
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError(
+                "Parquet result sinks require pyarrow; "
+                "install it with `pip install pyarrow`"
+            ) from error
+
+        super().__init__(path, equity_frequency=equity_frequency)
+        self._pa = pa
+        self.row_group_size = max(row_group_size, 1)
+        metric_types = {"run": pa.int64(), "trade_count": pa.int64()}
+        self._schema = pa.schema(
+            [
+                (
+                    name,
+                    (
+                        pa.string()
+                        if name in ("strategy", "parameters")
+                        else metric_types.get(name, pa.float64())
+                    ),
+                )
+                for name in RESULT_COLUMNS
+            ]
+        )
+        self._equity_schema = pa.schema(
+            [
+                ("run", pa.int64()),
+                ("date", pa.timestamp("ns")),
+                ("equity", pa.float64()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._equity_writer = (
+            pq.ParquetWriter(_equity_path(self.path), self._equity_schema)
+            if equity_frequency is not None
+            else None
+        )
+        self._rows: List[Dict[str, Any]] = []
+        self._equity_rows: List[Dict[str, Any]] = []
+
+    def _flush(self) -> None:
+        pa = self._pa
+        if self._rows:
+            self._writer.write_table(
+                pa.Table.from_pylist(self._rows, schema=self._schema)
+            )
+            self._rows = []
+        if self._equity_writer is not None and self._equity_rows:
+            self._equity_writer.write_table(
+                pa.Table.from_pylist(self._equity_rows, schema=self._equity_schema)
+            )
+            self._equity_rows = []
+
+    def write(
+        self, run: int, result: StrategyResult, equity: Optional[pd.Series] = None
+    ) -> None:
+        self._rows.append(_result_row(run, result))
+        if self._equity_writer is not None:
+            self._equity_rows.extend(_equity_rows(run, equity))
+        self.written += 1
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.close()
+        if self._equity_writer is not None:
+            self._equity_writer.close()
+        self._writer = None
+
+
+SINK_FORMATS: Dict[str, type[_FileSink]] = {
+    ".csv": CsvResultSink,
+    ".ndjson": NdjsonResultSink,
+    ".jsonl": NdjsonResultSink,
+    ".parquet": ParquetResultSink,
+}
+
+
+def open_sink(
+    path: os.PathLike | str, *, equity_frequency: Optional[str] = None
+) -> ResultSink:
+    """Open the sink matching ``path``'s suffix (.csv, .ndjson/.jsonl, .parquet)."""
+
+    suffix = Path(path).suffix.lower()
+    if suffix not in SINK_FORMATS:
+        raise ValueError(
+            f"Unsupported result sink {suffix or str(path)!r}; "
+            f"expected one of {sorted(SINK_FORMATS)}"
+        )
+    return SINK_FORMATS[suffix](path, equity_frequency=equity_frequency)
+
+
+__all__ = [
+    "CsvResultSink",
+    "NdjsonResultSink",
+    "ParquetResultSink",
+    "ResultSink",
+    "SINK_FORMATS",
+    "open_sink",
+    "sample_equity",
+]
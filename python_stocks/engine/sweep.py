@@ -0,0 +1,345 @@
+"""Successive halving: prune dominated parameter combinations early."""
+
+from __future__ import annotations
+
+import math
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from ..indicators import IndicatorCacheStats
+from ..services.strategy_service import StrategyResult, check_metric, metric_score
+from ..strategy_registry import StrategyRegistry
+from .checkpoint import SimulationCheckpoint
+from .simulator import (
+    SimulationEngine,
+    SimulationOutput,
+    _format_parameters,
+    _init_worker,
+    _worker_engine,
+)
+
+
+def halving_schedule(
+    total_days: int,
+    runs: int,
+    *,
+    eta: int = 2,
+    min_days: int = 90,
+    keep: int = 1,
+) -> List[int]:
+    """Prefix length, in rows, simulated at each stage.
+
+    Every stage keeps ``1 / eta`` of the runs (never fewer than ``keep``) and
+    multiplies the prefix by ``eta``; the last stage covers all ``total_days``.
+    Prefixes shorter than ``min_days`` are raised to it, so early stages may
+    repeat a prefix.
+    """
+
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    rounds, remaining = 0, runs
+    while remaining > max(keep, 1):
+        remaining = max(keep, math.ceil(remaining / eta))
+        rounds += 1
+    return [
+        min(total_days, max(min_days, total_days // eta ** (rounds - stage)))
+        for stage in range(rounds + 1)
+    ]
+
+
+@dataclass(frozen=True)
+class SweepStage:
+    """Runs simulated over one prefix and the ones dropped after it."""
+
+    stage: int
+    days: int
+    end_date: pd.Timestamp
+    results: Dict[int, StrategyResult]
+    pruned: List[int]
+
+
+@dataclass
+class SweepResult:
+    """Outcome of a successive-halving sweep.
+
+    Runs are identified by their position in the expanded run list. ``output``
+    holds the full-range simulation of the runs that survived every stage.
+    """
+
+    metric: str
+    runs: List[Tuple[str, Dict[str, object]]]
+    stages: List[SweepStage]
+    output: SimulationOutput
+
+    @property
+    def survivors(self) -> List[int]:
+        return list(self.stages[-1].results) if self.stages else []
+
+    @property
+    def best(self) -> Optional[StrategyResult]:
+        final = self.stages[-1].results if self.stages else {}
+        if not final:
+            return None
+        return max(final.values(), key=lambda result: metric_score(result, self.metric))
+
+    @property
+    def report_df(self) -> pd.DataFrame:
+        """One row per run: the last stage it reached and its score there."""
+
+        rows = []
+        for index, (strategy, parameters) in enumerate(self.runs):
+            reached = [stage for stage in self.stages if index in stage.results]
+            last = reached[-1]
+            pruned = index in last.pruned
+            rows.append(
+                {
+                    "run": index,
+                    "strategy": strategy,
+                    "parameters": _format_parameters(parameters),
+                    "pruned_at_stage": last.stage if pruned else None,
+                    "days_simulated": last.days,
+                    "last_date": last.end_date,
+                    self.metric: getattr(last.results[index], self.metric),
+                }
+            )
+        return pd.DataFrame(rows)
+
+
+def _merge_outputs(
+    outputs: List[SimulationOutput], seed: Optional[int]
+) -> SimulationOutput:
+    """One output for runs that were each simulated on their own."""
+
+    results = [result for output in outputs for result in output.results]
+    indicator_stats = IndicatorCacheStats()
+    for output in outputs:
+        indicator_stats += output.indicator_stats
+    return SimulationOutput(
+        report_df=pd.DataFrame([result.as_dict() for result in results]),
+        results=results,
+        histories=[history for output in outputs for history in output.histories],
+        seed=seed,
+        indicator_stats=indicator_stats,
+    )
+
+
+def _run_survivor(
+    initial_deposit: int,
+    enabled_strategies: Optional[List[str]],
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+    seed: Optional[int],
+    run: int,
+    checkpoint: SimulationCheckpoint,
+) -> SimulationOutput:
+    return _worker_engine()._execute(
+        initial_deposit,
+        enabled_strategies=enabled_strategies,
+        parameter_overrides=parameter_overrides,
+        seed=seed,
+        workers=1,
+        run_indices=[run],
+        checkpoint=checkpoint,
+    )
+
+
+class SuccessiveHalvingSweep:
+    """Sweep a parameter grid, pruning the worst runs on growing prefixes.
+
+    All expanded runs are simulated over a short prefix of the history; the
+    best ``1 / eta`` by ``metric`` move on to a prefix ``eta`` times longer,
+    until the survivors run over the full range. Each run keeps the seed
+    stream it would get in a single full :meth:`SimulationEngine.run_once`.
+
+    Survivors are extended, not restarted: every run is checkpointed on its
+    own when its stage finishes, and the next stage resumes it through an
+    incremental :class:`SimulationCheckpoint`, stepping only the rows its
+    longer prefix adds. Runs simulated one at a time do not share indicators
+    with each other, so ``indicator_stats`` counts one miss per run and spec.
+    """
+
+    def __init__(
+        self,
+        historic_data,
+        *,
+        metric: str = "sharpe_ratio",
+        eta: int = 2,
+        min_days: int = 90,
+        keep: int = 1,
+        registry: Optional[StrategyRegistry] = None,
+        transaction_cost_rate: float = 0.0,
+        slippage_pct: float = 0.0,
+        benchmark_ticker: Optional[str] = None,
+        workers: int = 1,
+    ) -> None:
+        self.historic_data = historic_data
+        self.metric = check_metric(metric)
+        self.eta = eta
+        self.min_days = min_days
+        self.keep = keep
+        self.workers = workers
+        self.registry = registry
+        self.transaction_cost_rate = transaction_cost_rate
+        self.slippage_pct = slippage_pct
+        self.benchmark_ticker = benchmark_ticker
+        self.engine = self._build_engine(historic_data, retention="full")
+
+    def _build_engine(self, historic_data, *, retention: str) -> SimulationEngine:
+        return SimulationEngine(
+            historic_data,
+            registry=self.registry,
+            transaction_cost_rate=self.transaction_cost_rate,
+            slippage_pct=self.slippage_pct,
+            benchmark_ticker=self.benchmark_ticker,
+            reporting="silent",
+            retention=retention,
+        )
+
+    def _prefix_engine(self, days: int) -> SimulationEngine:
+        if days >= self.historic_data.total_days():
+            return self.engine
+        # Pruning only compares metrics; the ledgers of a prefix are not kept.
+        return self._build_engine(
+            self.historic_data.window(0, days), retention="metrics"
+        )
+
+    def _simulate_stage(
+        self,
+        engine: SimulationEngine,
+        alive: List[int],
+        checkpoint: SimulationCheckpoint,
+        initial_deposit: int,
+        enabled_strategies: Optional[List[str]],
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
+        seed: Optional[int],
+    ) -> Dict[int, SimulationOutput]:
+        """Each run in ``alive`` over ``engine``'s data, from its own snapshot."""
+
+        if self.workers <= 1 or len(alive) <= 1:
+            return {
+                run: engine._execute(
+                    initial_deposit,
+                    enabled_strategies=enabled_strategies,
+                    parameter_overrides=parameter_overrides,
+                    seed=seed,
+                    workers=1,
+                    run_indices=[run],
+                    checkpoint=checkpoint.child(f"run-{run}"),
+                )
+                for run in alive
+            }
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(alive)),
+            initializer=_init_worker,
+            initargs=(engine,),
+        ) as executor:
+            futures = {
+                run: executor.submit(
+                    _run_survivor,
+                    initial_deposit,
+                    enabled_strategies,
+                    parameter_overrides,
+                    seed,
+                    run,
+                    checkpoint.child(f"run-{run}"),
+                )
+                for run in alive
+            }
+            outputs = {run: future.result() for run, future in futures.items()}
+        for output in outputs.values():
+            engine._attach_market(output.histories)
+        return outputs
+
+    def run(
+        self,
+        initial_deposit: int,
+        *,
+        enabled_strategies: Optional[List[str]] = None,
+        parameter_overrides: Optional[
+            Mapping[str, Mapping[str, Iterable[object]]]
+        ] = None,
+        seed: Optional[int] = None,
+        checkpoint: Optional[SimulationCheckpoint] = None,
+    ) -> SweepResult:
+        """Run every stage, extending each survivor from its previous stage.
+
+        ``checkpoint`` keeps one subdirectory per run and is always treated
+        as incremental; without one the stage snapshots live in a temporary
+        directory for the duration of the call.
+        """
+
+        strategy_runs = self.engine._expand_runs(
+            enabled_strategies, parameter_overrides
+        )
+        total_days = self.historic_data.total_days()
+        schedule = halving_schedule(
+            total_days,
+            len(strategy_runs),
+            eta=self.eta,
+            min_days=self.min_days,
+            keep=self.keep,
+        )
+        index = self.historic_data.data_frame.index
+
+        stages: List[SweepStage] = []
+        alive = list(range(len(strategy_runs)))
+        outputs: Dict[int, SimulationOutput] = {}
+        with (
+            nullcontext(str(checkpoint.directory))
+            if checkpoint
+            else tempfile.TemporaryDirectory(prefix="python_stocks-sweep-")
+        ) as directory:
+            # Only finished stages are needed to extend a run; a scratch
+            # directory skips the periodic snapshots.
+            stage_checkpoint = SimulationCheckpoint(
+                directory,
+                every=checkpoint.every if checkpoint else total_days,
+                incremental=True,
+            )
+            for stage, days in enumerate(schedule):
+                if not (stages and stages[-1].days == days):
+                    # A prefix repeated by ``min_days`` keeps the outputs of
+                    # the previous stage; they would be identical.
+                    outputs.update(
+                        self._simulate_stage(
+                            self._prefix_engine(days),
+                            alive,
+                            stage_checkpoint,
+                            initial_deposit,
+                            enabled_strategies,
+                            parameter_overrides,
+                            seed,
+                        )
+                    )
+                results = {run: outputs[run].results[0] for run in alive}
+                pruned: List[int] = []
+                if stage < len(schedule) - 1:
+                    ranked = sorted(
+                        alive,
+                        key=lambda run: metric_score(results[run], self.metric),
+                        reverse=True,
+                    )
+                    survivors = max(self.keep, math.ceil(len(alive) / self.eta))
+                    pruned = sorted(ranked[survivors:])
+                    alive = sorted(ranked[:survivors])
+                stages.append(SweepStage(stage, days, index[days - 1], results, pruned))
+
+        return SweepResult(
+            metric=self.metric,
+            runs=[(strategy.name, params) for strategy, params in strategy_runs],
+            stages=stages,
+            output=_merge_outputs([outputs[run] for run in alive], seed),
+        )
+
+
+__all__ = [
+    "SuccessiveHalvingSweep",
+    "SweepResult",
+    "SweepStage",
+    "halving_schedule",
+]
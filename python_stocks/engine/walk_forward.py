@@ -0,0 +1,235 @@
+"""Walk-forward optimization over rolling in-sample/out-of-sample windows."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from ..services.strategy_service import (
+    RESULT_METRICS,
+    StrategyResult,
+    check_metric,
+    metric_score,
+)
+from ..strategy_registry import StrategyRegistry
+from .simulator import SimulationEngine, _format_parameters
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """Row ranges of one fold: optimize on ``in_sample``, then test after it."""
+
+    fold: int
+    in_sample: Tuple[int, int]
+    out_of_sample: Tuple[int, int]
+
+
+def walk_forward_windows(
+    total_rows: int,
+    in_sample_days: int,
+    out_of_sample_days: int,
+    *,
+    step_days: Optional[int] = None,
+    anchored: bool = False,
+) -> List[WalkForwardWindow]:
+    """Split ``total_rows`` daily rows into consecutive walk-forward folds.
+
+    Each fold's out-of-sample window starts where its in-sample window ends.
+    Folds advance by ``step_days`` (default: the out-of-sample length); with
+    ``anchored`` every in-sample window starts at row 0 and only grows.
+    """
+
+    if in_sample_days < 2 or out_of_sample_days < 2:
+        raise ValueError("Walk-forward windows need at least two days each")
+    step = step_days or out_of_sample_days
+    if step < 1:
+        raise ValueError("step_days must be positive")
+
+    windows: List[WalkForwardWindow] = []
+    start = 0
+    while start + in_sample_days + out_of_sample_days <= total_rows:
+        split = start + in_sample_days
+        windows.append(
+            WalkForwardWindow(
+                fold=len(windows),
+                in_sample=(0 if anchored else start, split),
+                out_of_sample=(split, split + out_of_sample_days),
+            )
+        )
+        start += step
+    return windows
+
+
+@dataclass(frozen=True)
+class WalkForwardFold:
+    """The parameters chosen in-sample and how they fared out-of-sample."""
+
+    window: WalkForwardWindow
+    dates: Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp, pd.Timestamp]
+    parameters: Dict[str, object]
+    in_sample: StrategyResult
+    out_of_sample: StrategyResult
+    in_sample_report: pd.DataFrame
+
+
+@dataclass
+class WalkForwardResult:
+    """Every fold of a walk-forward run, in chronological order."""
+
+    strategy: str
+    metric: str
+    folds: List[WalkForwardFold]
+
+    @property
+    def report_df(self) -> pd.DataFrame:
+        rows = []
+        for fold in self.folds:
+            in_start, in_end, out_start, out_end = fold.dates
+            row = {
+                "fold": fold.window.fold,
+                "in_sample_start": in_start,
+                "in_sample_end": in_end,
+                "out_of_sample_start": out_start,
+                "out_of_sample_end": out_end,
+                "parameters": _format_parameters(fold.parameters),
+                f"in_sample_{self.metric}": getattr(fold.in_sample, self.metric),
+            }
+            for name in RESULT_METRICS:
+                row[f"out_of_sample_{name}"] = getattr(fold.out_of_sample, name)
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+
+class WalkForwardOptimizer:
+    """Tune one strategy's parameters fold by fold and test them forward.
+
+    For every fold the parameter grid is swept over the in-sample window
+    (across ``workers`` processes), the combination with the best ``metric``
+    is kept, and that single combination is simulated over the following
+    out-of-sample window. The forward run starts at the in-sample window with
+    those rows as warm-up (see ``SimulationEngine(warmup_days=...)``), so its
+    indicators are primed when trading starts and only the out-of-sample rows
+    are scored. Window data are views of the loaded price arrays.
+    """
+
+    def __init__(
+        self,
+        historic_data,
+        strategy: str,
+        *,
+        in_sample_days: int,
+        out_of_sample_days: int,
+        step_days: Optional[int] = None,
+        anchored: bool = False,
+        metric: str = "sharpe_ratio",
+        registry: Optional[StrategyRegistry] = None,
+        transaction_cost_rate: float = 0.0,
+        slippage_pct: float = 0.0,
+        benchmark_ticker: Optional[str] = None,
+        workers: int = 1,
+    ) -> None:
+        self.historic_data = historic_data
+        self.strategy = strategy
+        self.windows = walk_forward_windows(
+            historic_data.total_days(),
+            in_sample_days,
+            out_of_sample_days,
+            step_days=step_days,
+            anchored=anchored,
+        )
+        self.metric = check_metric(metric)
+        self.registry = registry
+        self.transaction_cost_rate = transaction_cost_rate
+        self.slippage_pct = slippage_pct
+        self.benchmark_ticker = benchmark_ticker
+        self.workers = workers
+
+    def _engine(self, rows: Tuple[int, int], warmup_days: int = 0) -> SimulationEngine:
+        return SimulationEngine(
+            self.historic_data.window(*rows),
+            registry=self.registry,
+            transaction_cost_rate=self.transaction_cost_rate,
+            slippage_pct=self.slippage_pct,
+            benchmark_ticker=self.benchmark_ticker,
+            reporting="silent",
+            retention="metrics",
+            warmup_days=warmup_days,
+        )
+
+    def _dates(self, window: WalkForwardWindow) -> Tuple[pd.Timestamp, ...]:
+        index = self.historic_data.data_frame.index
+        (in_start, in_stop), (out_start, out_stop) = (
+            window.in_sample,
+            window.out_of_sample,
+        )
+        return (
+            index[in_start],
+            index[in_stop - 1],
+            index[out_start],
+            index[out_stop - 1],
+        )
+
+    def run_fold(
+        self,
+        window: WalkForwardWindow,
+        initial_deposit: int,
+        parameter_overrides: Optional[Mapping[str, Iterable[object]]] = None,
+        *,
+        seed: Optional[int] = None,
+    ) -> WalkForwardFold:
+        overrides = {self.strategy: parameter_overrides or {}}
+        sweep = self._engine(window.in_sample).run_once(
+            initial_deposit,
+            enabled_strategies=[self.strategy],
+            parameter_overrides=overrides,
+            seed=seed,
+            workers=self.workers,
+        )
+        if not sweep.results:
+            raise ValueError(f"Strategy {self.strategy!r} produced no runs")
+        best = max(sweep.results, key=lambda result: metric_score(result, self.metric))
+
+        chosen = {name: [value] for name, value in best.parameters.items()}
+        (in_start, _), (out_start, out_stop) = window.in_sample, window.out_of_sample
+        forward = self._engine(
+            (in_start, out_stop), warmup_days=out_start - in_start
+        ).run_once(
+            initial_deposit,
+            enabled_strategies=[self.strategy],
+            parameter_overrides={self.strategy: chosen},
+            seed=seed,
+        )
+        return WalkForwardFold(
+            window=window,
+            dates=self._dates(window),
+            parameters=dict(best.parameters),
+            in_sample=best,
+            out_of_sample=forward.results[0],
+            in_sample_report=sweep.report_df,
+        )
+
+    def run(
+        self,
+        initial_deposit: int,
+        parameter_overrides: Optional[Mapping[str, Iterable[object]]] = None,
+        *,
+        seed: Optional[int] = None,
+    ) -> WalkForwardResult:
+        """Optimize and test every fold; ``parameter_overrides`` sets the grid."""
+
+        folds = [
+            self.run_fold(window, initial_deposit, parameter_overrides, seed=seed)
+            for window in self.windows
+        ]
+        return WalkForwardResult(self.strategy, self.metric, folds)
+
+
+__all__ = [
+    "WalkForwardFold",
+    "WalkForwardOptimizer",
+    "WalkForwardResult",
+    "WalkForwardWindow",
+    "walk_forward_windows",
+]
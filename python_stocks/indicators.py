@@ -0,0 +1,378 @@
+"""Streaming indicators updated one bar at a time by the simulation engine.
+
+Strategies declare the indicators they need as :class:`IndicatorSpec` values.
+The engine keeps an :class:`IndicatorSet` per run and feeds it each new bar,
+so a strategy reads the current value, yesterday's value and the slope
+instead of recomputing filters over the whole price history every day.
+
+An :class:`IndicatorCache` shares indicators between the runs of a parameter
+sweep: runs declaring the same spec read one streaming indicator, and
+vectorized strategies read one precomputed :class:`IndicatorSeries` per spec.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+import numpy as np
+
+from .math_helper import (
+    moving_average_kernel,
+    no_delay_moving_average_on_that_day_kernel,
+)
+
+if TYPE_CHECKING:
+    from .signals import MarketArrays
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """Which indicator to maintain, over which ticker, field and window.
+
+    ``exact=False`` selects the constant-cost running-sum form of the filter
+    (see :class:`_WindowAverage`).
+    """
+
+    ticker: str
+    window: int
+    kind: str = "no_delay_ma"
+    field: str = "Close"
+    exact: bool = True
+
+
+class _WindowAverage(ABC):
+    """Average of the most recent ``span`` finite prices.
+
+    Only the last few prices are retained and, by default, the sum is taken
+    oldest to newest on every bar, exactly as the list-based filters in
+    ``math_helper`` do. Values are then bit-identical to recomputing the
+    filter over the full history, but each update costs O(window).
+
+    ``exact=False`` keeps a compensated (Neumaier) running sum instead: one
+    addition and at most one subtraction per bar whatever the window. Its
+    values differ from the exact ones in the last few bits, and from the
+    cumulative-sum ``kernel(..., exact=False)`` used by vectorized strategies
+    by as much, so stepped and vectorized runs agree only within rounding.
+    """
+
+    __slots__ = (
+        "window",
+        "exact",
+        "count",
+        "value",
+        "previous",
+        "latest",
+        "_recent",
+        "_total",
+        "_error",
+    )
+
+    def __init__(self, window: int, *, exact: bool = True) -> None:
+        self.window = window
+        self.exact = exact
+        self.count = 0
+        self.value: Optional[float] = None
+        self.previous: Optional[float] = None
+        self.latest: Optional[float] = None
+        self._recent: deque = deque(maxlen=self._span(max(window, 1)))
+        self._total = 0.0
+        self._error = 0.0
+
+    @abstractmethod
+    def _span(self, available: int) -> int:
+        """How many of ``available`` finite prices the average covers."""
+
+    @staticmethod
+    @abstractmethod
+    def kernel(values: np.ndarray, maf_n: int, *, exact: bool = True) -> np.ndarray:
+        """Whole-history form of the filter, one value per index."""
+
+    @property
+    def slope(self) -> float:
+        """Day-over-day change, matching ``slope([previous, value], 2)``."""
+
+        if self.value is None or self.previous is None:
+            return 0
+        return self.value - self.previous
+
+    def state(self) -> Dict[str, Any]:
+        """Everything :meth:`update` depends on, as plain JSON values."""
+
+        return {
+            "count": self.count,
+            "value": self.value,
+            "previous": self.previous,
+            "latest": self.latest,
+            "recent": list(self._recent),
+            "total": self._total,
+            "error": self._error,
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.count = state["count"]
+        self.value = state["value"]
+        self.previous = state["previous"]
+        self.latest = state["latest"]
+        self._recent.clear()
+        self._recent.extend(state["recent"])
+        self._total = state.get("total", 0.0)
+        self._error = state.get("error", 0.0)
+
+    def _add(self, term: float) -> None:
+        total = self._total + term
+        if abs(self._total) >= abs(term):
+            self._error += (self._total - total) + term
+        else:
+            self._error += (term - total) + self._total
+        self._total = total
+
+    def update(self, price: float) -> None:
+        window = max(self.window, 1)
+        span = self._span(min(window, self.count + 1))
+        if not self.exact:
+            # The span grows by at most one price per bar; when it does not,
+            # the oldest price it covered drops out.
+            if self.count and span == self._span(min(window, self.count)):
+                self._add(-self._recent[-span])
+            self._add(price)
+        self._recent.append(price)
+        self.count += 1
+        self.latest = price
+        self.previous = self.value
+        if not self.exact:
+            self.value = (self._total + self._error) / span
+            return
+        recent: Iterable[float] = self._recent
+        if span < len(self._recent):
+            recent = islice(self._recent, len(self._recent) - span, None)
+        self.value = sum(recent) / span
+
+
+class MovingAverage(_WindowAverage):
+    """Streaming ``math_helper.moving_average_filter``."""
+
+    __slots__ = ()
+    kernel = staticmethod(moving_average_kernel)
+
+    def _span(self, available: int) -> int:
+        return available
+
+
+class NoDelayMovingAverage(_WindowAverage):
+    """Streaming ``math_helper.no_delay_moving_average_filter``.
+
+    The zero-phase filter's latest value reduces to the mean of the last
+    ``floor(min(window, count) / 2)`` prices (at least one).
+    """
+
+    __slots__ = ()
+    kernel = staticmethod(no_delay_moving_average_on_that_day_kernel)
+
+    def _span(self, available: int) -> int:
+        return max(available // 2, 1)
+
+
+INDICATOR_KINDS: Dict[str, Type[_WindowAverage]] = {
+    "ma": MovingAverage,
+    "no_delay_ma": NoDelayMovingAverage,
+}
+
+
+class IndicatorSet:
+    """Indicators for one simulation run, keyed by their spec.
+
+    With a ``pool`` the set reuses (and registers) indicator instances shared
+    with other runs instead of creating private ones.
+    """
+
+    def __init__(
+        self,
+        specs: Iterable[IndicatorSpec] = (),
+        *,
+        pool: Optional[Dict[IndicatorSpec, _WindowAverage]] = None,
+    ) -> None:
+        self._indicators: Dict[IndicatorSpec, _WindowAverage] = {}
+        for spec in specs:
+            if spec in self._indicators:
+                continue
+            indicator = pool.get(spec) if pool is not None else None
+            if indicator is None:
+                indicator = INDICATOR_KINDS[spec.kind](spec.window, exact=spec.exact)
+                if pool is not None:
+                    pool[spec] = indicator
+            self._indicators[spec] = indicator
+        self._positions: Optional[Tuple[int, List[Tuple[int, int, _WindowAverage]]]] = (
+            None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._indicators)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_positions"] = None
+        return state
+
+    def get(self, spec: IndicatorSpec) -> Optional[_WindowAverage]:
+        return self._indicators.get(spec)
+
+    def update(self, market) -> None:
+        """Feed the bar at ``market.cursor``; missing prices are skipped."""
+
+        prices = market.prices
+        if self._positions is None or self._positions[0] != id(prices):
+            self._positions = (
+                id(prices),
+                [
+                    (
+                        prices.ticker_position(spec.ticker),
+                        prices.field_position(spec.field),
+                        indicator,
+                    )
+                    for spec, indicator in self._indicators.items()
+                ],
+            )
+        bar = prices.raw[market.cursor]
+        for ticker, field, indicator in self._positions[1]:
+            price = bar[ticker, field]
+            if np.isfinite(price):
+                indicator.update(float(price))
+
+
+@dataclass(frozen=True)
+class IndicatorSeries:
+    """Whole-history indicator values, shaped ``(paths, rows)``.
+
+    Row ``r`` holds what a streaming indicator fed the finite prices up to and
+    including ``r`` would report: ``value``, ``previous`` (one finite bar
+    earlier), ``latest`` price and ``count`` of finite prices. Values are
+    ``NaN`` until enough prices exist.
+    """
+
+    value: np.ndarray
+    previous: np.ndarray
+    latest: np.ndarray
+    count: np.ndarray
+
+    @property
+    def slope(self) -> np.ndarray:
+        return self.value - self.previous
+
+
+@dataclass(frozen=True)
+class IndicatorCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def __add__(self, other: "IndicatorCacheStats") -> "IndicatorCacheStats":
+        return IndicatorCacheStats(self.hits + other.hits, self.misses + other.misses)
+
+
+class IndicatorCache:
+    """Indicators shared by every run simulated over one dataset.
+
+    Keys are :class:`IndicatorSpec` values, i.e. ticker, field, kind,
+    window and exactness. Each request for a spec that is already cached counts as a hit;
+    the first request computes it and counts as a miss.
+    """
+
+    def __init__(self) -> None:
+        self._shared = IndicatorSet()
+        self._series: Dict[IndicatorSpec, IndicatorSeries] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> IndicatorCacheStats:
+        return IndicatorCacheStats(self.hits, self.misses)
+
+    def _count(self, present: bool) -> None:
+        if present:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def indicator_set(self, specs: Iterable[IndicatorSpec]) -> IndicatorSet:
+        """Streaming indicators for one run, shared with other runs."""
+
+        specs = list(dict.fromkeys(specs))
+        pool = self._shared._indicators
+        for spec in specs:
+            self._count(spec in pool)
+        self._shared._positions = None
+        return IndicatorSet(specs, pool=pool)
+
+    def update(self, market) -> None:
+        """Feed the bar at ``market.cursor`` to every shared indicator once."""
+
+        self._shared.update(market)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """State of every shared streaming indicator, for checkpoints."""
+
+        return [
+            {"spec": dataclasses.astuple(spec), **indicator.state()}
+            for spec, indicator in self._shared._indicators.items()
+        ]
+
+    def restore(self, snapshot: Iterable[Dict[str, Any]]) -> None:
+        """Load a :meth:`snapshot` into the indicators this cache already holds."""
+
+        pool = self._shared._indicators
+        for saved in snapshot:
+            indicator = pool.get(IndicatorSpec(*saved["spec"]))
+            if indicator is not None:
+                indicator.load_state(saved)
+
+    def series(self, spec: IndicatorSpec, market: "MarketArrays") -> IndicatorSeries:
+        """Whole-history values of ``spec`` over ``market``'s price arrays."""
+
+        self._count(spec in self._series)
+        if spec not in self._series:
+            self._series[spec] = _indicator_series(spec, market)
+        return self._series[spec]
+
+
+def _indicator_series(spec: IndicatorSpec, market: "MarketArrays") -> IndicatorSeries:
+    raw = market.raw(spec.ticker, spec.field)
+    count = market.clean_count(spec.ticker, spec.field)
+    kernel = INDICATOR_KINDS[spec.kind].kernel
+    value = np.full(raw.shape, np.nan)
+    previous = np.full(raw.shape, np.nan)
+    latest = np.full(raw.shape, np.nan)
+    finite = np.isfinite(raw)
+    if (finite == finite[:1]).all():
+        # Bootstrapped paths share the historical calendar, so their missing
+        # bars line up and the kernel can run over every path at once.
+        groups = [(slice(None), raw[:, finite[0]] if len(raw) else raw)]
+    else:
+        groups = [
+            (slice(path, path + 1), raw[path : path + 1, finite[path]])
+            for path in range(raw.shape[0])
+        ]
+    for paths, clean in groups:
+        along_clean = kernel(clean, spec.window, exact=spec.exact)
+        position = count[paths][0] - 1
+        seen = position >= 0
+        value[paths, seen] = along_clean[:, position[seen]]
+        latest[paths, seen] = clean[:, position[seen]]
+        prior = position >= 1
+        previous[paths, prior] = along_clean[:, position[prior] - 1]
+    return IndicatorSeries(value, previous, latest, count)
+
+
+__all__ = [
+    "INDICATOR_KINDS",
+    "IndicatorCache",
+    "IndicatorCacheStats",
+    "IndicatorSeries",
+    "IndicatorSet",
+    "IndicatorSpec",
+    "MovingAverage",
+    "NoDelayMovingAverage",
+]
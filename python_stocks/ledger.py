@@ -0,0 +1,142 @@
+"""Array-backed storage for per-day trading ledgers."""
+
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class TradingLedger:
+    """Preallocated ledger of positions and cash balances, one row per day.
+
+    Rows live in a single ``float64`` matrix sized up front (typically from
+    ``StockData.total_days()``) so appending a day is a row copy rather than a
+    DataFrame reallocation. Storage doubles if the capacity is exceeded. Every
+    mutation bumps :attr:`revision` so callers can invalidate derived caches.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int = 0) -> None:
+        self.columns = list(columns)
+        self._column_index: Dict[str, int] = {
+            name: position for position, name in enumerate(self.columns)
+        }
+        self._values = np.zeros((max(capacity, 1), len(self.columns)), dtype=float)
+        self._dates: np.ndarray | None = None
+        self._length = 0
+        self.revision = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return self._values.shape[0]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Return a view of the populated rows."""
+
+        return self._values[: self._length]
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        if self._dates is None:
+            return pd.DatetimeIndex([])
+        return pd.DatetimeIndex(self._dates[: self._length])
+
+    def column_position(self, column: str) -> int:
+        return self._column_index[column]
+
+    def column(self, column: str) -> np.ndarray:
+        """Return a view of a single column across the populated rows."""
+
+        return self.values[:, self._column_index[column]]
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if rows <= self.capacity:
+            return
+        new_capacity = max(rows, self.capacity * 2)
+        values = np.zeros((new_capacity, len(self.columns)), dtype=float)
+        values[: self._length] = self._values[: self._length]
+        self._values = values
+        if self._dates is not None:
+            dates = np.empty(new_capacity, dtype=self._dates.dtype)
+            dates[: self._length] = self._dates[: self._length]
+            self._dates = dates
+
+    def append_row(self, date: pd.Timestamp, *, carry: bool = True) -> int:
+        """Append a row for ``date`` and return its position.
+
+        With ``carry`` the previous row's balances are copied forward; otherwise
+        the row starts at zero.
+        """
+
+        stamp = pd.Timestamp(date).to_datetime64()
+        if self._dates is None:
+            self._dates = np.empty(self.capacity, dtype=stamp.dtype)
+        self._ensure_capacity(self._length + 1)
+        row = self._length
+        if carry and row > 0:
+            self._values[row] = self._values[row - 1]
+        else:
+            self._values[row] = 0.0
+        self._dates[row] = stamp
+        self._length += 1
+        self.revision += 1
+        return row
+
+    def _row(self, row: int) -> int:
+        return self._length + row if row < 0 else row
+
+    def get(self, column: str, row: int = -1) -> float:
+        return float(self._values[self._row(row), self._column_index[column]])
+
+    def set(self, column: str, value: float, row: int = -1) -> None:
+        self._values[self._row(row), self._column_index[column]] = value
+        self.revision += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        """Expose the populated rows as a DataFrame without copying storage."""
+
+        return pd.DataFrame(
+            self.values, index=self.index, columns=self.columns, copy=False
+        )
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, capacity: int = 0) -> "TradingLedger":
+        """Build a ledger from an existing history DataFrame."""
+
+        ledger = cls(list(frame.columns), max(capacity, len(frame.index)))
+        rows = len(frame.index)
+        if rows:
+            ledger._values[:rows] = frame.to_numpy(dtype=float, na_value=0.0)
+            ledger._dates = np.empty(
+                ledger.capacity, dtype=pd.DatetimeIndex(frame.index).dtype
+            )
+            ledger._dates[:rows] = pd.DatetimeIndex(frame.index).to_numpy()
+        ledger._length = rows
+        return ledger
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Sequence[str],
+        index: pd.DatetimeIndex,
+        data: Dict[str, np.ndarray],
+        capacity: int = 0,
+    ) -> "TradingLedger":
+        """Build a ledger from whole columns; columns missing from ``data`` are 0."""
+
+        rows = len(index)
+        ledger = cls(columns, max(capacity, rows))
+        for name, values in data.items():
+            ledger._values[:rows, ledger._column_index[name]] = values
+        ledger._dates = np.empty(ledger.capacity, dtype=index.dtype)
+        ledger._dates[:rows] = index.to_numpy()
+        ledger._length = rows
+        return ledger
+
+
+__all__ = ["TradingLedger"]
@@ -4,11 +4,18 @@ from typing import Iterable, Optional
 
 from .plotting import plt
 
+from .engine.checkpoint import SimulationCheckpoint
+from .engine.monte_carlo import MonteCarloEngine
+from .engine.sinks import open_sink
+from .engine.sweep import SuccessiveHalvingSweep
+from .engine.walk_forward import WalkForwardOptimizer
 from .math_helper import print_time
 from .interactive_charts import export_interactive_price_charts
 from .run_strategies import run_some_strategies
 from .services.data_service import DataService
 
+DEFAULT_CHECKPOINT_DIR = ".python_stocks_checkpoints"
+
 
 def run_simulation(
     tickers: Iterable[str],
@@ -21,7 +28,22 @@ def run_simulation(
     parameter_overrides: Optional[dict] = None,
     report_dir: Optional[str] = None,
     show_plots: bool = True,
+    workers: int = 1,
+    reporting: str = "verbose",
+    successive_halving: bool = False,
+    halving_metric: str = "sharpe_ratio",
+    halving_eta: int = 2,
+    halving_min_days: int = 90,
+    checkpoint_dir: Optional[str] = None,
+    checkpoint_every: int = 250,
+    resume: bool = False,
+    incremental: bool = False,
+    sink_path: Optional[str] = None,
+    sink_equity_frequency: Optional[str] = None,
+    retention: str = "full",
 ) -> None:
+    if successive_halving and sink_path:
+        raise ValueError("A result sink cannot be combined with successive halving")
     plt.close("all")
     start_time = time.time()
     portfolio_fig = plt.figure()
@@ -34,12 +56,58 @@ def run_simulation(
         stock_history_data.limit_timeframe(start_date, end_date)
     stock_history_data.add_external_investments(monthly_deposit, daily_deposit)
 
-    report_df, _ = run_some_strategies(
-        initial_deposit,
-        stock_history_data,
-        enabled_strategies=list(strategies) if strategies else None,
-        parameter_overrides=parameter_overrides,
-    )
+    checkpoint = None
+    if checkpoint_dir or resume or incremental:
+        checkpoint = SimulationCheckpoint(
+            checkpoint_dir or DEFAULT_CHECKPOINT_DIR,
+            every=checkpoint_every,
+            resume=resume,
+            incremental=incremental,
+        )
+
+    pruning_df = None
+    if successive_halving:
+        sweep = SuccessiveHalvingSweep(
+            stock_history_data,
+            metric=halving_metric,
+            eta=halving_eta,
+            min_days=halving_min_days,
+            workers=workers,
+        ).run(
+            initial_deposit,
+            enabled_strategies=list(strategies) if strategies else None,
+            parameter_overrides=parameter_overrides,
+            checkpoint=checkpoint,
+        )
+        sweep.output.report(reporting)
+        report_df = sweep.output.report_df
+        pruning_df = sweep.report_df
+        print("\nSuccessive halving stages:\n", pruning_df)
+    elif sink_path:
+        with open_sink(sink_path, equity_frequency=sink_equity_frequency) as sink:
+            report_df, _ = run_some_strategies(
+                initial_deposit,
+                stock_history_data,
+                enabled_strategies=list(strategies) if strategies else None,
+                parameter_overrides=parameter_overrides,
+                workers=workers,
+                reporting=reporting,
+                checkpoint=checkpoint,
+                sink=sink,
+                retention=retention,
+            )
+        print(f"Streamed {len(report_df)} results to {sink_path}")
+    else:
+        report_df, _ = run_some_strategies(
+            initial_deposit,
+            stock_history_data,
+            enabled_strategies=list(strategies) if strategies else None,
+            parameter_overrides=parameter_overrides,
+            workers=workers,
+            reporting=reporting,
+            checkpoint=checkpoint,
+            retention=retention,
+        )
 
     if not report_df.empty:
         print("\nStrategy performance summary:\n", report_df)
@@ -55,6 +123,8 @@ def run_simulation(
         report_df.to_json(
             report_path / "strategy_summary.json", orient="records", indent=2
         )
+        if pruning_df is not None:
+            pruning_df.to_csv(report_path / "sweep_pruning.csv", index=False)
 
         for idx, fig_num in enumerate(sorted(plt.get_fignums()), start=1):
             fig = plt.figure(fig_num)
@@ -73,3 +143,114 @@ def run_simulation(
 
     if show_plots:
         plt.show()
+
+
+def run_walk_forward(
+    tickers: Iterable[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    initial_deposit: int,
+    daily_deposit: int,
+    monthly_deposit: int,
+    strategy: str,
+    in_sample_days: int,
+    out_of_sample_days: int,
+    step_days: Optional[int] = None,
+    anchored: bool = False,
+    metric: str = "sharpe_ratio",
+    parameter_overrides: Optional[dict] = None,
+    report_dir: Optional[str] = None,
+    workers: int = 1,
+) -> None:
+    start_time = time.time()
+
+    data_service = DataService()
+    stock_history_data = data_service.build_stock_data(list(tickers))
+
+    if start_date or end_date:
+        stock_history_data.limit_timeframe(start_date, end_date)
+    stock_history_data.add_external_investments(monthly_deposit, daily_deposit)
+
+    optimizer = WalkForwardOptimizer(
+        stock_history_data,
+        strategy,
+        in_sample_days=in_sample_days,
+        out_of_sample_days=out_of_sample_days,
+        step_days=step_days,
+        anchored=anchored,
+        metric=metric,
+        workers=workers,
+    )
+    result = optimizer.run(initial_deposit, (parameter_overrides or {}).get(strategy))
+    report_df = result.report_df
+
+    if report_df.empty:
+        print("\nNo walk-forward folds fit in the selected date range.")
+    else:
+        print("\nWalk-forward summary:\n", report_df)
+
+    if report_dir:
+        report_path = Path(report_dir)
+        report_path.mkdir(parents=True, exist_ok=True)
+        report_df.to_csv(report_path / "walk_forward.csv", index=False)
+        report_df.to_json(
+            report_path / "walk_forward.json",
+            orient="records",
+            indent=2,
+            date_format="iso",
+        )
+
+    end_time = time.time()
+    print_time(end_time - start_time)
+
+
+def run_monte_carlo(
+    tickers: Iterable[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    initial_deposit: int,
+    daily_deposit: int,
+    monthly_deposit: int,
+    strategies: Optional[Iterable[str]] = None,
+    parameter_overrides: Optional[dict] = None,
+    paths: int = 1000,
+    block_size: int = 20,
+    chunk_size: int = 256,
+    seed: Optional[int] = None,
+    report_dir: Optional[str] = None,
+) -> None:
+    start_time = time.time()
+
+    data_service = DataService()
+    stock_history_data = data_service.build_stock_data(list(tickers))
+
+    if start_date or end_date:
+        stock_history_data.limit_timeframe(start_date, end_date)
+    stock_history_data.add_external_investments(monthly_deposit, daily_deposit)
+
+    engine = MonteCarloEngine(stock_history_data, block_size=block_size)
+    output = engine.run(
+        initial_deposit,
+        paths=paths,
+        seed=seed,
+        chunk_size=chunk_size,
+        enabled_strategies=list(strategies) if strategies else None,
+        parameter_overrides=parameter_overrides,
+    )
+
+    if output.distribution_df.empty:
+        print("\nNo vectorized strategies to simulate.")
+    else:
+        summary_df = output.summary()
+        print(f"\nMonte Carlo summary ({paths} paths):\n", summary_df)
+
+        if report_dir:
+            report_path = Path(report_dir)
+            report_path.mkdir(parents=True, exist_ok=True)
+            summary_df.to_csv(report_path / "monte_carlo_summary.csv", index=False)
+            output.distribution_df.to_csv(
+                report_path / "monte_carlo_paths.csv", index=False
+            )
+
+    end_time = time.time()
+    print_time(end_time - start_time)
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import io
+import json
 import logging
 import os
 from pathlib import Path
-from typing import Protocol, Sequence
+import shutil
+import threading
+import time
+from typing import Callable, Protocol, Sequence
+import zlib
 
+import numpy as np
 import pandas as pd
 
-from .data_loading import load_into_stock_data_set
+from .data_loading import OPTIONAL_COLUMNS, _validate_columns, load_into_stock_data_set
 
 LOGGER = logging.getLogger(__name__)
 
 CURATED_TICKERS: tuple[str, ...] = ("SPY", "DIA", "NDAQ", "TQQQ")
 DEFAULT_STALE_AFTER_BUSINESS_DAYS = 3
 _STOOQ_URL = "https://stooq.com/q/d/l/?s={symbol}.us&i=d"
+STORE_FORMATS: tuple[str, ...] = ("csv", "npy")
+_STORE_MANIFEST = "store.json"
+_STORE_COLUMNS: tuple[str, ...] = ("Close", "Open", "High", "Low", "Volume")
 
 
 class DailyOhlcvProvider(Protocol):
@@ -33,6 +44,54 @@ class DailyOhlcvProvider(Protocol):
         """Return daily OHLCV rows with Date/Open/High/Low/Close/Volume columns."""
 
 
+class RateLimiter:
+    """Space calls at least ``1 / rate`` seconds apart, across threads.
+
+    Each :meth:`acquire` reserves the next free slot under a lock and then
+    sleeps until it, so concurrent workers never exceed ``rate`` calls per
+    second against one provider.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = 1.0 / rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class _RateLimitedProvider:
+    def __init__(self, provider: DailyOhlcvProvider, limiter: RateLimiter) -> None:
+        self._provider = provider
+        self._limiter = limiter
+
+    def fetch_daily_ohlcv(
+        self,
+        symbol: str,
+        *,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> pd.DataFrame:
+        self._limiter.acquire()
+        return self._provider.fetch_daily_ohlcv(symbol, start=start, end=end)
+
+
 class StooqDailyProvider:
     """Fetch end-of-day OHLCV quotes from stooq.com's public CSV endpoint."""
 
@@ -60,31 +119,449 @@ class StooqDailyProvider:
         return frame.reset_index(drop=True)
 
 
+@dataclass(frozen=True)
+class StoreIndex:
+    """Sidecar summary of one stored ticker: enough to append without loading.
+
+    ``size`` and ``crc32`` describe the data file (the CSV, or ``Date.npy``
+    for the npy format) as it was last written.
+    """
+
+    rows: int
+    max_date: pd.Timestamp
+    size: int
+    crc32: int
+
+
+def _file_crc32(path: Path, limit: int | None = None) -> int:
+    """Checksum of ``path``, or of its first ``limit`` bytes."""
+
+    checksum, remaining = 0, limit
+    with open(path, "rb") as handle:
+        while remaining is None or remaining > 0:
+            chunk = handle.read(
+                1 << 20 if remaining is None else min(remaining, 1 << 20)
+            )
+            if not chunk:
+                break
+            checksum = zlib.crc32(chunk, checksum)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return checksum
+
+
+def _npy_header(path: Path) -> tuple[tuple[int, ...], np.dtype, int]:
+    """Shape, dtype and data offset of a ``.npy`` file."""
+
+    with open(path, "rb") as handle:
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            shape, _, dtype = np.lib.format.read_array_header_1_0(handle)
+        else:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(handle)
+        return shape, dtype, handle.tell()
+
+
+def _npy_header_bytes(rows: int, dtype: np.dtype) -> bytes:
+    # np.save reserves room in the header for the first axis to grow, so a
+    # longer column keeps the same header length.
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        header,
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (rows,),
+        },
+    )
+    return header.getvalue()
+
+
+def _replace_atomically(path: Path, data: bytes) -> None:
+    partial = path.with_name(f"{path.name}.partial")
+    with open(partial, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(partial, path)
+
+
 class DailyPriceStore:
-    """Local CSV store for curated daily OHLCV data."""
+    """Local store for curated daily OHLCV data.
+
+    ``"csv"`` keeps one CSV per ticker. ``"npy"`` keeps one directory per
+    ticker holding a ``.npy`` file per column (``Date`` plus OHLCV), which
+    :meth:`load` memory-maps read-only instead of parsing. Without an
+    explicit ``format`` the directory's ``store.json`` (written by
+    :func:`migrate_price_store`) decides, defaulting to CSV. Loads fall back
+    to the other format for tickers not yet written in this one.
 
-    def __init__(self, root: Path | None = None) -> None:
+    Every write also records a :class:`StoreIndex` in ``<TICKER>.index.json``
+    so an ingest can find its start date, and :meth:`append` new rows to a
+    CSV or to each npy column, without reading the stored history.
+    """
+
+    def __init__(self, root: Path | None = None, *, format: str | None = None) -> None:
         self.root = root or default_market_data_dir()
         self.root.mkdir(parents=True, exist_ok=True)
+        self.format = format or self._configured_format()
+        if self.format not in STORE_FORMATS:
+            raise ValueError(
+                f"Unknown price store format {self.format!r}; "
+                f"expected one of {STORE_FORMATS}"
+            )
 
-    def _path(self, ticker: str) -> Path:
+    def _configured_format(self) -> str:
+        manifest = self.root / _STORE_MANIFEST
+        if not manifest.exists():
+            return "csv"
+        return json.loads(manifest.read_text()).get("format", "csv")
+
+    def _csv_path(self, ticker: str) -> Path:
         return self.root / f"{ticker.upper()}.csv"
 
+    def _npy_dir(self, ticker: str) -> Path:
+        return self.root / ticker.upper()
+
+    def _has(self, ticker: str, store_format: str) -> bool:
+        if store_format == "npy":
+            return (self._npy_dir(ticker) / "Date.npy").exists()
+        return self._csv_path(ticker).exists()
+
+    def _path(self, ticker: str) -> Path:
+        if self.format == "npy":
+            return self._npy_dir(ticker)
+        return self._csv_path(ticker)
+
+    def _data_file(self, ticker: str) -> Path:
+        if self.format == "npy":
+            return self._npy_dir(ticker) / "Date.npy"
+        return self._csv_path(ticker)
+
+    def _index_path(self, ticker: str) -> Path:
+        return self.root / f"{ticker.upper()}.index.json"
+
+    def index(self, ticker: str, *, verify: bool = False) -> StoreIndex | None:
+        """The ticker's sidecar index, or ``None`` if missing or out of date.
+
+        The data file's size is always compared against the index; ``verify``
+        also recomputes its checksum. Writing the index commits an
+        :meth:`append`, so rows an interrupted append left past the indexed
+        history are truncated away here.
+        """
+
+        path, data_file = self._index_path(ticker), self._data_file(ticker)
+        if not path.exists() or not data_file.exists():
+            return None
+        saved = json.loads(path.read_text())
+        if saved.get("format") != self.format or saved.get("max_date") is None:
+            return None
+        index = StoreIndex(
+            rows=saved["rows"],
+            max_date=pd.Timestamp(saved["max_date"]),
+            size=saved["size"],
+            crc32=saved["crc32"],
+        )
+        if data_file.stat().st_size != index.size and not self._roll_back(
+            ticker, index
+        ):
+            return None
+        if verify and _file_crc32(data_file) != index.crc32:
+            return None
+        return index
+
+    def _roll_back(self, ticker: str, index: StoreIndex) -> bool:
+        """Undo an uncommitted append; ``False`` if the file changed otherwise.
+
+        The data file must start with exactly the indexed bytes (for npy, once
+        ``Date.npy``'s header is restored to the indexed row count).
+        """
+
+        data_file = self._data_file(ticker)
+        if self.format == "csv":
+            if data_file.stat().st_size < index.size or (
+                _file_crc32(data_file, index.size) != index.crc32
+            ):
+                return False
+            with open(data_file, "r+b") as handle:
+                handle.truncate(index.size)
+            return True
+
+        _, dtype, offset = _npy_header(data_file)
+        header = _npy_header_bytes(index.rows, dtype)
+        end = offset + index.rows * dtype.itemsize
+        if len(header) != offset or data_file.stat().st_size < end:
+            return False
+        with open(data_file, "rb") as handle:
+            handle.seek(offset)
+            checksum = zlib.crc32(handle.read(end - offset), zlib.crc32(header))
+        if end != index.size or checksum != index.crc32:
+            return False
+        columns = {
+            column: _npy_header(column)
+            for column in self._npy_dir(ticker).glob("*.npy")
+        }
+        if any(shape[0] < index.rows for shape, _, _ in columns.values()):
+            return False
+        for column, (_, dtype, offset) in columns.items():
+            with open(column, "r+b") as handle:
+                handle.write(_npy_header_bytes(index.rows, dtype))
+                handle.truncate(offset + index.rows * dtype.itemsize)
+        return True
+
+    def _write_index(self, ticker: str, index: StoreIndex) -> None:
+        record = {
+            "format": self.format,
+            "rows": index.rows,
+            "max_date": None if pd.isna(index.max_date) else index.max_date.isoformat(),
+            "size": index.size,
+            "crc32": index.crc32,
+        }
+        _replace_atomically(self._index_path(ticker), json.dumps(record).encode())
+
+    def tickers(self, format: str | None = None) -> list[str]:
+        """Tickers stored in ``format`` (default: either format)."""
+
+        formats = [format] if format else STORE_FORMATS
+        found: set[str] = set()
+        if "csv" in formats:
+            found.update(path.stem for path in self.root.glob("*.csv"))
+        if "npy" in formats:
+            found.update(
+                path.parent.name
+                for path in self.root.glob("*/Date.npy")
+                if not path.parent.name.endswith((".partial", ".previous"))
+            )
+        return sorted(found)
+
     def exists(self, ticker: str) -> bool:
-        return self._path(ticker).exists()
+        return any(self._has(ticker, store_format) for store_format in STORE_FORMATS)
 
     def load(self, ticker: str) -> pd.DataFrame:
         if not self.exists(ticker):
             raise FileNotFoundError(
                 f"No cached market data exists for {ticker} in {self.root}"
             )
+        self.index(ticker)  # Drops rows an interrupted append left behind.
+        preferred = sorted(STORE_FORMATS, key=lambda option: option != self.format)
+        store_format = next(option for option in preferred if self._has(ticker, option))
+        if store_format == "npy":
+            return self._load_npy(ticker.upper())
         return load_into_stock_data_set(ticker.upper(), data_dir=self.root)
 
+    def _load_npy(self, ticker: str) -> pd.DataFrame:
+        directory = self._npy_dir(ticker)
+        dates = np.load(directory / "Date.npy", mmap_mode="r")
+        columns = {
+            name: np.load(directory / f"{name}.npy", mmap_mode="r")
+            for name in _STORE_COLUMNS
+            if (directory / f"{name}.npy").exists()
+        }
+        _validate_columns(["Date", *columns], ticker)
+        if any(len(values) != len(dates) for values in columns.values()):
+            raise ValueError(f"Dataset '{ticker}' in {directory} has ragged columns")
+        if len(dates) > 1 and not (np.diff(dates.view("i8")) > 0).all():
+            raise ValueError(
+                f"Dataset '{ticker}' from {directory} must have dates in strictly "
+                "increasing order"
+            )
+        frame = pd.DataFrame(
+            columns, index=pd.DatetimeIndex(dates, name="Date"), copy=False
+        )
+        for optional_column in OPTIONAL_COLUMNS:
+            if optional_column not in frame.columns:
+                frame[optional_column] = pd.NA
+        return frame
+
+    def tail(self, ticker: str) -> pd.DataFrame:
+        """The last stored row, read without loading the whole history."""
+
+        upper = ticker.upper()
+        if self.format == "npy" and self._has(upper, "npy"):
+            return self._load_npy(upper).iloc[-1:].copy()
+        path = self._csv_path(upper)
+        with open(path, "rb") as handle:
+            header = handle.readline()
+            end = handle.seek(0, os.SEEK_END)
+            handle.seek(max(len(header), end - 4096))
+            rows = handle.read().rstrip(b"\r\n")
+        last = rows.rsplit(b"\n", 1)[-1] if rows else b""
+        frame = pd.read_csv(io.BytesIO(header + last))
+        return load_into_stock_data_set(upper, fetcher=lambda _: frame)
+
     def save(self, ticker: str, frame: pd.DataFrame) -> Path:
-        path = self._path(ticker)
-        frame.to_csv(path, index=False)
+        """Write ``frame`` (with a ``Date`` column) as the ticker's full history."""
+
+        if self.format == "npy":
+            path = self._save_npy(ticker, frame)
+            data_file = path / "Date.npy"
+            size, checksum = data_file.stat().st_size, _file_crc32(data_file)
+        else:
+            path = self._csv_path(ticker)
+            data = frame.to_csv(index=False).encode()
+            _replace_atomically(path, data)
+            size, checksum = len(data), zlib.crc32(data)
+        dates = pd.to_datetime(frame["Date"], errors="raise")
+        self._write_index(
+            ticker,
+            StoreIndex(
+                rows=len(frame),
+                max_date=dates.max() if len(frame) else pd.NaT,
+                size=size,
+                crc32=checksum,
+            ),
+        )
         return path
 
+    def append(self, ticker: str, frame: pd.DataFrame) -> Path:
+        """Add rows dated strictly after the stored history.
+
+        A CSV gains the rows in a single append, undone if the write fails,
+        and its index is updated from the appended bytes alone. The index
+        write is the commit point: if the process dies before it, the next
+        :meth:`index` or :meth:`load` truncates the partial rows. Each npy
+        column file gains the new values at its end and has its header's row
+        count updated in place; only when a column's dtype cannot hold the new
+        values (or its header cannot grow) is the ticker rewritten.
+        """
+
+        index = self.index(ticker)
+        if index is None:
+            raise ValueError(f"No up-to-date index for {ticker} in {self.root}")
+        dates = pd.to_datetime(frame["Date"], errors="raise")
+        if len(frame) and dates.min() <= index.max_date:
+            raise ValueError(
+                f"Rows for {ticker} must be dated after {index.max_date.date()}"
+            )
+        if self.format == "npy":
+            return self._append_npy(ticker, frame, index)
+
+        path = self._csv_path(ticker)
+        with open(path, "rb") as handle:
+            columns = handle.readline().decode().strip().split(",")
+        data = frame.reindex(columns=columns).to_csv(index=False, header=False).encode()
+        with open(path, "ab") as handle:
+            try:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            except BaseException:
+                handle.truncate(index.size)
+                raise
+        self._write_index(
+            ticker,
+            StoreIndex(
+                rows=index.rows + len(frame),
+                max_date=(
+                    max(index.max_date, dates.max()) if len(frame) else index.max_date
+                ),
+                size=index.size + len(data),
+                crc32=zlib.crc32(data, index.crc32),
+            ),
+        )
+        return path
+
+    def _npy_column_appends(
+        self, ticker: str, frame: pd.DataFrame, index: StoreIndex
+    ) -> list[tuple[Path, bytes, int, bytes]] | None:
+        """Per column file: new header, data offset and bytes to append.
+
+        ``None`` when the columns cannot grow in place: a dtype that cannot
+        hold the new values, a header without room for the longer shape, or
+        values for a column the store left out.
+        """
+
+        directory = self._npy_dir(ticker)
+        new_columns = {
+            "Date": pd.DatetimeIndex(
+                pd.to_datetime(frame["Date"], errors="raise")
+            ).to_numpy(),
+            **{
+                name: (
+                    frame[name].to_numpy()
+                    if name in frame.columns
+                    else np.full(len(frame), np.nan)
+                )
+                for name in _STORE_COLUMNS
+            },
+        }
+        appends = []
+        for name, values in new_columns.items():
+            path = directory / f"{name}.npy"
+            if not path.exists():
+                if not pd.isna(values).all():
+                    return None
+                continue
+            shape, dtype, offset = _npy_header(path)
+            header = _npy_header_bytes(index.rows + len(frame), dtype)
+            if (
+                shape != (index.rows,)
+                or len(header) != offset
+                or not np.can_cast(values.dtype, dtype, "same_kind")
+            ):
+                return None
+            data = np.ascontiguousarray(values.astype(dtype)).tobytes()
+            appends.append((path, header, offset + index.rows * dtype.itemsize, data))
+        return appends
+
+    def _append_npy(self, ticker: str, frame: pd.DataFrame, index: StoreIndex) -> Path:
+        appends = self._npy_column_appends(ticker, frame, index)
+        if appends is None:
+            history = self.load(ticker).reset_index()
+            return self.save(ticker, pd.concat([history, frame], ignore_index=True))
+
+        # Date goes last, so a Date.npy matching the index marks a finished
+        # append.
+        appends.sort(key=lambda append: append[0].name == "Date.npy")
+        for path, header, end, data in appends:
+            with open(path, "r+b") as handle:
+                handle.seek(end)
+                handle.write(data)
+                handle.truncate()
+                handle.seek(0)
+                handle.write(header)
+                handle.flush()
+                os.fsync(handle.fileno())
+        date_file = self._npy_dir(ticker) / "Date.npy"
+        dates = pd.to_datetime(frame["Date"], errors="raise")
+        self._write_index(
+            ticker,
+            StoreIndex(
+                rows=index.rows + len(frame),
+                max_date=(
+                    max(index.max_date, dates.max()) if len(frame) else index.max_date
+                ),
+                size=date_file.stat().st_size,
+                crc32=_file_crc32(date_file),
+            ),
+        )
+        return self._npy_dir(ticker)
+
+    def _save_npy(self, ticker: str, frame: pd.DataFrame) -> Path:
+        _validate_columns(frame.columns, ticker)
+        directory = self._npy_dir(ticker)
+        partial = directory.with_name(f"{directory.name}.partial")
+        shutil.rmtree(partial, ignore_errors=True)
+        partial.mkdir()
+        dates = pd.DatetimeIndex(pd.to_datetime(frame["Date"], errors="raise"))
+        np.save(partial / "Date.npy", dates.to_numpy(), allow_pickle=False)
+        for name in _STORE_COLUMNS:
+            # Optional columns a CSV lacked are loaded as all-NA; leave them out.
+            if name in frame.columns and not frame[name].isna().all():
+                np.save(
+                    partial / f"{name}.npy", frame[name].to_numpy(), allow_pickle=False
+                )
+
+        # Swap the finished directory in; readers holding memory maps of the
+        # old columns keep them until they are done.
+        previous = directory.with_name(f"{directory.name}.previous")
+        shutil.rmtree(previous, ignore_errors=True)
+        if directory.exists():
+            os.replace(directory, previous)
+        os.replace(partial, directory)
+        shutil.rmtree(previous, ignore_errors=True)
+        return directory
+
 
 @dataclass
 class DataQualityReport:
@@ -103,6 +580,13 @@ class DataQualityReport:
 
 @dataclass
 class IngestionResult:
+    """Outcome of ingesting one ticker.
+
+    ``quality_scope`` is ``"increment"`` when rows were appended without
+    loading the stored history: ``quality`` then covers only the last stored
+    row and the new ones, so gaps or malformed rows further back go unseen.
+    """
+
     ticker: str
     source: str
     updated_rows: int
@@ -111,6 +595,7 @@ class IngestionResult:
     quality: DataQualityReport
     status: str
     message: str
+    quality_scope: str = "history"
 
 
 def default_market_data_dir() -> Path:
@@ -235,6 +720,137 @@ def _merge_frames(
     return combined.reset_index(drop=True)
 
 
+def _status_message(
+    ticker: str, quality: DataQualityReport, updated_rows: int
+) -> tuple[str, str]:
+    if quality.malformed_records:
+        message = f"{ticker}: malformed records detected ({'; '.join(quality.malformed_records)})"
+        LOGGER.warning(message)
+        return "warning", message
+    if quality.missing_business_days:
+        preview = ", ".join(quality.missing_business_days[:3])
+        message = (
+            f"{ticker}: missing {len(quality.missing_business_days)} business days; "
+            f"first missing dates: {preview}"
+        )
+        LOGGER.warning(message)
+        return "warning", message
+    if quality.stale_business_days:
+        message = (
+            f"{ticker}: dataset is stale by {quality.stale_business_days} business days"
+        )
+        LOGGER.warning(message)
+        return "warning", message
+    message = f"{ticker}: updated {updated_rows} rows"
+    LOGGER.info(message)
+    return "ok", message
+
+
+def _ingest_ticker(
+    ticker: str,
+    *,
+    provider: DailyOhlcvProvider,
+    store: DailyPriceStore,
+    stale_after_business_days: int,
+    full_refresh: bool,
+) -> IngestionResult:
+    """Fetch and store one ticker, appending when only new rows arrived.
+
+    With an up-to-date sidecar index the start date comes from it and rows
+    after the stored history are appended; quality checks then cover the
+    last stored row plus the new ones. Overlapping or corrected rows, a
+    missing index or ``full_refresh`` merge with the full history and
+    rewrite it.
+    """
+
+    upper = ticker.upper()
+    existing: pd.DataFrame | None = None
+    index = None if full_refresh else store.index(upper)
+    if index is None and store.exists(upper):
+        try:
+            existing = store.load(upper)
+        except Exception as exc:  # pragma: no cover - defensive logging path
+            LOGGER.warning("Failed to load existing cache for %s: %s", upper, exc)
+
+    start: pd.Timestamp | None = None
+    if index is not None:
+        start = index.max_date + pd.offsets.BDay(1)
+    elif existing is not None and not existing.empty and not full_refresh:
+        start = pd.Timestamp(existing.index.max()) + pd.offsets.BDay(1)
+
+    try:
+        incoming = provider.fetch_daily_ohlcv(upper, start=start)
+        normalized = _normalize_for_store(incoming)
+        if index is not None and (normalized["Date"] > index.max_date).all():
+            last_stored = store.tail(upper).reset_index()
+            data_path = store.append(upper, normalized) if len(normalized) else None
+            total_rows = index.rows + len(normalized)
+            checked = pd.concat([last_stored, normalized], ignore_index=True)
+            quality_scope = "increment"
+        else:
+            if index is not None:
+                existing = store.load(upper)
+            checked = _merge_frames(existing, incoming)
+            data_path = store.save(upper, checked)
+            total_rows = len(checked)
+            quality_scope = "history"
+        quality = evaluate_data_quality(
+            checked,
+            stale_after_business_days=stale_after_business_days,
+        )
+        status, message = _status_message(upper, quality, len(incoming))
+        return IngestionResult(
+            ticker=upper,
+            source="provider",
+            updated_rows=len(incoming),
+            total_rows=total_rows,
+            data_path=data_path or store._path(upper),
+            quality=quality,
+            status=status,
+            message=message,
+            quality_scope=quality_scope,
+        )
+    except Exception as exc:
+        if existing is None and store.exists(upper):
+            try:
+                existing = store.load(upper)
+            except Exception:  # pragma: no cover - defensive logging path
+                existing = None
+        if existing is not None:
+            quality = evaluate_data_quality(
+                existing.reset_index().rename(columns={"index": "Date"}),
+                stale_after_business_days=stale_after_business_days,
+            )
+            message = f"{upper}: provider failed ({exc}); using cached data at {store._path(upper)}"
+            LOGGER.warning(message)
+            return IngestionResult(
+                ticker=upper,
+                source="cache",
+                updated_rows=0,
+                total_rows=len(existing),
+                data_path=store._path(upper),
+                quality=quality,
+                status="warning",
+                message=message,
+            )
+
+        message = (
+            f"{upper}: provider failed ({exc}) and no local cache exists. "
+            "Dashboard/demo will continue using bundled raw_data fallback."
+        )
+        LOGGER.error(message)
+        return IngestionResult(
+            ticker=upper,
+            source="fallback",
+            updated_rows=0,
+            total_rows=0,
+            data_path=None,
+            quality=DataQualityReport(),
+            status="error",
+            message=message,
+        )
+
+
 def ingest_curated_daily_data(
     *,
     tickers: Sequence[str] = CURATED_TICKERS,
@@ -242,107 +858,69 @@ def ingest_curated_daily_data(
     store: DailyPriceStore | None = None,
     stale_after_business_days: int = DEFAULT_STALE_AFTER_BUSINESS_DAYS,
     full_refresh: bool = False,
+    workers: int = 1,
+    rate_limit: float | None = None,
 ) -> list[IngestionResult]:
+    """Refresh every ticker in ``store``, returning results in input order.
+
+    ``workers`` tickers are fetched, validated and saved at once on a thread
+    pool, so a large universe is bound by the slowest requests rather than
+    their sum. ``rate_limit`` caps provider requests per second across all
+    workers.
+    """
+
     provider = provider or StooqDailyProvider()
     store = store or DailyPriceStore()
+    if rate_limit:
+        provider = _RateLimitedProvider(provider, RateLimiter(rate_limit))
+    # A ticker listed twice must not be written by two workers at once.
+    locks = {ticker.upper(): threading.Lock() for ticker in tickers}
+
+    def ingest(ticker: str) -> IngestionResult:
+        with locks[ticker.upper()]:
+            return _ingest_ticker(
+                ticker,
+                provider=provider,
+                store=store,
+                stale_after_business_days=stale_after_business_days,
+                full_refresh=full_refresh,
+            )
 
-    results: list[IngestionResult] = []
-    for ticker in tickers:
-        upper = ticker.upper()
-        existing: pd.DataFrame | None = None
-        if store.exists(upper):
-            try:
-                existing = store.load(upper)
-            except Exception as exc:  # pragma: no cover - defensive logging path
-                LOGGER.warning("Failed to load existing cache for %s: %s", upper, exc)
+    if workers <= 1 or len(tickers) <= 1:
+        return [ingest(ticker) for ticker in tickers]
+    with ThreadPoolExecutor(max_workers=min(workers, len(tickers))) as executor:
+        return list(executor.map(ingest, tickers))
 
-        start: pd.Timestamp | None = None
-        if existing is not None and not existing.empty and not full_refresh:
-            start = pd.Timestamp(existing.index.max()) + pd.offsets.BDay(1)
 
-        try:
-            incoming = provider.fetch_daily_ohlcv(upper, start=start)
-            merged = _merge_frames(existing, incoming)
-            quality = evaluate_data_quality(
-                merged,
-                stale_after_business_days=stale_after_business_days,
-            )
-            data_path = store.save(upper, merged)
-
-            if quality.malformed_records:
-                status = "warning"
-                message = f"{upper}: malformed records detected ({'; '.join(quality.malformed_records)})"
-                LOGGER.warning(message)
-            elif quality.missing_business_days:
-                status = "warning"
-                preview = ", ".join(quality.missing_business_days[:3])
-                message = (
-                    f"{upper}: missing {len(quality.missing_business_days)} business days; "
-                    f"first missing dates: {preview}"
-                )
-                LOGGER.warning(message)
-            elif quality.stale_business_days:
-                status = "warning"
-                message = f"{upper}: dataset is stale by {quality.stale_business_days} business days"
-                LOGGER.warning(message)
+def migrate_price_store(
+    root: Path | None = None,
+    *,
+    to: str = "npy",
+    remove_source: bool = False,
+) -> list[Path]:
+    """Convert every ticker in a store directory to the ``to`` format.
+
+    The directory's ``store.json`` is updated so later ingests and loads use
+    the new format. Source files are kept unless ``remove_source`` is set.
+    Returns the written paths.
+    """
+
+    target = DailyPriceStore(root=root, format=to)
+    source_format = next(option for option in STORE_FORMATS if option != to)
+    source = DailyPriceStore(root=target.root, format=source_format)
+
+    written = []
+    for ticker in source.tickers(source_format):
+        frame = source.load(ticker).reset_index()
+        written.append(target.save(ticker, frame))
+        if remove_source:
+            if source_format == "npy":
+                shutil.rmtree(source._npy_dir(ticker))
             else:
-                status = "ok"
-                message = f"{upper}: updated {len(incoming)} rows"
-                LOGGER.info(message)
-
-            results.append(
-                IngestionResult(
-                    ticker=upper,
-                    source="provider",
-                    updated_rows=len(incoming),
-                    total_rows=len(merged),
-                    data_path=data_path,
-                    quality=quality,
-                    status=status,
-                    message=message,
-                )
-            )
-        except Exception as exc:
-            if existing is not None:
-                quality = evaluate_data_quality(
-                    existing.reset_index().rename(columns={"index": "Date"}),
-                    stale_after_business_days=stale_after_business_days,
-                )
-                message = f"{upper}: provider failed ({exc}); using cached data at {store._path(upper)}"
-                LOGGER.warning(message)
-                results.append(
-                    IngestionResult(
-                        ticker=upper,
-                        source="cache",
-                        updated_rows=0,
-                        total_rows=len(existing),
-                        data_path=store._path(upper),
-                        quality=quality,
-                        status="warning",
-                        message=message,
-                    )
-                )
-                continue
-
-            message = (
-                f"{upper}: provider failed ({exc}) and no local cache exists. "
-                "Dashboard/demo will continue using bundled raw_data fallback."
-            )
-            LOGGER.error(message)
-            results.append(
-                IngestionResult(
-                    ticker=upper,
-                    source="fallback",
-                    updated_rows=0,
-                    total_rows=0,
-                    data_path=None,
-                    quality=DataQualityReport(),
-                    status="error",
-                    message=message,
-                )
-            )
+                source._csv_path(ticker).unlink()
 
-    return results
+    (target.root / _STORE_MANIFEST).write_text(json.dumps({"format": to}))
+    return written
 
 
 def load_market_or_demo_dataset(
@@ -369,9 +947,13 @@ __all__ = [
     "DataQualityReport",
     "DailyPriceStore",
     "IngestionResult",
+    "RateLimiter",
+    "STORE_FORMATS",
+    "StoreIndex",
     "StooqDailyProvider",
     "default_market_data_dir",
     "evaluate_data_quality",
     "ingest_curated_daily_data",
     "load_market_or_demo_dataset",
+    "migrate_price_store",
 ]
@@ -0,0 +1,119 @@
+"""Cursor-based read access to market history during a simulation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .price_matrix import PriceMatrix
+
+
+class MarketView:
+    """Full-history price arrays plus a cursor marking the current day.
+
+    The engine advances a single view through the simulation instead of
+    slicing ``StockData.data_frame`` for every day. Accessors only expose rows
+    up to and including :attr:`cursor` and return NumPy views, so strategies
+    can read recent closes without copying. :attr:`frame` still provides the
+    DataFrame slice for strategies that need it.
+    """
+
+    def __init__(
+        self,
+        prices: PriceMatrix,
+        frame: pd.DataFrame,
+        *,
+        deposits: np.ndarray | None = None,
+        cursor: int = 0,
+    ) -> None:
+        self.prices = prices
+        self.deposits = deposits
+        self._full_frame = frame
+        self._frame_cache: tuple[int, pd.DataFrame] | None = None
+        self.cursor = cursor
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "MarketView":
+        """Wrap a history DataFrame with the cursor on its last row."""
+
+        return cls(PriceMatrix.from_frame(frame), frame, cursor=len(frame.index) - 1)
+
+    def seek(self, cursor: int) -> "MarketView":
+        self.cursor = cursor
+        return self
+
+    @property
+    def rows(self) -> int:
+        """Number of rows visible at the current cursor."""
+
+        return self.cursor + 1
+
+    @property
+    def date(self) -> pd.Timestamp:
+        return self.prices.index[self.cursor]
+
+    @property
+    def tickers(self) -> list[str]:
+        return self.prices.tickers
+
+    @property
+    def money_to_add(self):
+        """Scheduled deposit for the current day."""
+
+        if self.deposits is None:
+            return 0
+        return self.deposits[self.cursor]
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """DataFrame of the history up to the cursor, built only when asked."""
+
+        if self._frame_cache is None or self._frame_cache[0] != self.cursor:
+            self._frame_cache = (self.cursor, self._full_frame.iloc[: self.rows])
+        return self._frame_cache[1]
+
+    def history(self, ticker: str, field: str = "Close") -> np.ndarray:
+        """Finite prices up to the cursor, with NaN/inf rows removed (a view)."""
+
+        count = self.prices.clean_counts[
+            self.cursor,
+            self.prices.ticker_position(ticker),
+            self.prices.field_position(field),
+        ]
+        return self.prices.clean_values(ticker, field)[:count]
+
+    def last(self, ticker: str, n: int, field: str = "Close") -> np.ndarray:
+        """The most recent ``n`` finite prices (fewer early in the history)."""
+
+        values = self.history(ticker, field)
+        return values[len(values) - min(max(n, 0), len(values)) :]
+
+    def closes(self, ticker: str, n: int | None = None) -> np.ndarray:
+        if n is None:
+            return self.history(ticker, "Close")
+        return self.last(ticker, n, "Close")
+
+    def latest(self, ticker: str, field: str = "Close") -> float | None:
+        """Latest finite price for ``field`` up to the cursor."""
+
+        values = self.history(ticker, field)
+        if not len(values):
+            return None
+        return float(values[-1])
+
+    def latest_open(self, ticker: str) -> float | None:
+        return self.latest(ticker, "Open")
+
+    def latest_close(self, ticker: str) -> float | None:
+        return self.latest(ticker, "Close")
+
+    def price(self, ticker: str, field: str, row: int | None = None) -> float | None:
+        """Forward-filled price at ``row`` (default: the cursor)."""
+
+        row = self.cursor if row is None else row
+        if row >= self.rows:
+            return None
+        return self.prices.price(ticker, field, row)
+
+
+__all__ = ["MarketView"]
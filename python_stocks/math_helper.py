@@ -1,4 +1,6 @@
 import numpy as np
+import pandas as pd
+from scipy.optimize import brentq
 from scipy.signal import butter, lfilter
 
 
@@ -48,16 +50,100 @@ def no_delay_butter_low_pass_vectorized(data, cutoff, fs, order=5):
     return bwf_twice
 
 
+def _trailing_sum(values, spans, *, exact=True):
+    """Sum the last ``spans[i]`` values ending at each ``i``, oldest first.
+
+    Terms are added in the same order as ``sum(data[i - span + 1 : i + 1])``,
+    one shifted array per offset, so results match the list-based filters to
+    the last bit; that costs one pass per window offset. ``exact=False`` takes
+    differences of a cumulative sum instead: a single pass whatever the window,
+    but rounded differently and ``NaN`` poisons every later sum. ``values`` may
+    stack several series along leading axes; the window runs along the last one.
+    """
+
+    length = values.shape[-1]
+    if not exact:
+        cumulative = np.zeros(values.shape[:-1] + (length + 1,))
+        np.cumsum(values, axis=-1, out=cumulative[..., 1:])
+        ends = np.arange(1, length + 1)
+        return cumulative[..., ends] - cumulative[..., ends - spans]
+    total = np.zeros(values.shape)
+    for offset in range(int(spans.max(initial=0)) - 1, -1, -1):
+        in_window = spans[offset:] > offset
+        first = int(in_window.argmax())
+        if in_window[first:].all():
+            # Windows only grow (the common case): add the shifted tail in place.
+            total[..., offset + first :] += values[..., first : length - offset]
+        else:
+            total[..., offset:] += np.where(
+                in_window, values[..., : length - offset], 0.0
+            )
+    return total
+
+
+def moving_average_kernel(values, maf_n, *, exact=True):
+    """Trailing mean of up to ``maf_n`` values at every index (array in/out).
+
+    ``exact=False`` trades bit-identity with ``moving_average_filter`` for a
+    single cumulative-sum pass (see ``_trailing_sum``).
+    """
+
+    values = np.asarray(values, dtype=float)
+    spans = np.minimum(np.arange(1, values.shape[-1] + 1), max(maf_n, 1))
+    return _trailing_sum(values, spans, exact=exact) / spans
+
+
+def no_delay_moving_average_kernel(values, maf_n):
+    """Zero-phase moving average: a ``maf_n // 2`` mean run forward then back."""
+
+    half_window = int(np.floor(maf_n / 2))
+    once = moving_average_kernel(values, half_window)
+    return moving_average_kernel(once[..., ::-1], half_window)[..., ::-1]
+
+
+def no_delay_moving_average_on_that_day_kernel(values, maf_n, *, exact=True):
+    """Latest zero-phase value using only the data available on each day.
+
+    On a prefix of length ``i + 1`` the filter's last value reduces to the mean
+    of the final ``min(maf_n, i + 1) // 2`` values (at least one). ``exact`` is
+    as for ``moving_average_kernel``.
+    """
+
+    values = np.asarray(values, dtype=float)
+    available = np.minimum(np.arange(1, values.shape[-1] + 1), max(maf_n, 1))
+    spans = np.maximum(available // 2, 1)
+    return _trailing_sum(values, spans, exact=exact) / spans
+
+
+def slope_kernel(values, n):
+    """``slope(values[: i + 1], n)`` at every index."""
+
+    values = np.asarray(values, dtype=float)
+    slopes = np.zeros(len(values))
+    if n < 2 or len(values) < 2:
+        return slopes
+    start = np.maximum(np.arange(len(values)) - n + 1, 0)
+    slopes[1:] = values[1:] - values[start[1:]]
+    return slopes
+
+
+def curvature_kernel(values):
+    """``curvature(values[: i + 1])`` at every index."""
+
+    values = np.asarray(values, dtype=float)
+    curvatures = np.zeros(len(values))
+    if len(values) < 3:
+        return curvatures
+    steps = values[1:] - values[:-1]
+    curvatures[2:] = steps[1:] - steps[:-1]
+    return curvatures
+
+
 def moving_average_filter_vectorized(data, maf_n):
     assert type(maf_n) is int
     if not isinstance(data, list):
         data = [data]
-
-    maf = []
-    for i in range(0, len(data)):
-        data_for_use = data[0 : i + 1]
-        maf.append(moving_average_filter(data_for_use, maf_n))
-    return maf
+    return moving_average_kernel(data, maf_n).tolist()
 
 
 def moving_average_filter(data, maf_n):
@@ -79,14 +165,7 @@ def no_delay_moving_average_filter_vectorized(data, maf_n):
     assert type(maf_n) is int
     if not isinstance(data, list):
         data = [data]
-    maf_n_to_use = int(np.floor(maf_n / 2))
-    maf_once = moving_average_filter_vectorized(data, maf_n_to_use)
-    maf_twice = list(
-        reversed(
-            moving_average_filter_vectorized(list(reversed(maf_once)), maf_n_to_use)
-        )
-    )
-    return maf_twice
+    return no_delay_moving_average_kernel(data, maf_n).tolist()
 
 
 def no_delay_moving_average_filter(data, maf_n):
@@ -94,17 +173,14 @@ def no_delay_moving_average_filter(data, maf_n):
     if not isinstance(data, list):
         data = [data]
     maf_n = int(np.min([np.max([maf_n, 1]), len(data)]))
-    data = data[-maf_n:]
-    maf = no_delay_moving_average_filter_vectorized(data, maf_n)
-    return maf[-1]
+    # The latest zero-phase output is the mean of the last maf_n // 2 values;
+    # see no_delay_moving_average_on_that_day_kernel.
+    data_in_window = data[-max(maf_n // 2, 1) :]
+    return sum(data_in_window) / len(data_in_window)
 
 
 def no_delay_moving_average_filter_on_that_day_vectorized(data, maf_n):
-    maf = []
-    for i in range(len(data)):
-        data_for_use = data[0 : i + 1]
-        maf.append(no_delay_moving_average_filter(data_for_use, maf_n))
-    return maf
+    return no_delay_moving_average_on_that_day_kernel(data, maf_n).tolist()
 
 
 def percentage_difference(from_here, to_here):
@@ -112,6 +188,102 @@ def percentage_difference(from_here, to_here):
     return 100 * (to_here - from_here) / np.abs(from_here)
 
 
+def _npv_and_derivative(rate, cash_flows, periods):
+    """Net present value of the flows at ``rate`` and its derivative."""
+
+    with np.errstate(all="ignore"):
+        discount = (1 + rate) ** -periods
+        npv = np.dot(cash_flows, discount)
+        derivative = np.dot(-periods * cash_flows, discount / (1 + rate))
+    return npv, derivative
+
+
+def _solve_irr_on_grid(cash_flows, periods, guess):
+    """Bracket a root of the NPV on a rate grid and refine it with Brent.
+
+    When the NPV changes sign in several places the root nearest ``guess`` is
+    returned; ``nan`` when it never does.
+    """
+
+    rates = np.unique(
+        np.concatenate(
+            [
+                -1 + np.geomspace(1e-6, 1, 60),
+                [0.0],
+                np.geomspace(1e-9, 100, 120),
+                -np.geomspace(1e-9, 1e-6, 10),
+            ]
+        )
+    )
+    with np.errstate(all="ignore"):
+        npv = (1 + rates[:, np.newaxis]) ** -periods @ cash_flows
+    finite = np.isfinite(npv)
+    rates, npv = rates[finite], npv[finite]
+
+    roots = list(rates[npv == 0])
+    changes = np.flatnonzero(np.sign(npv[:-1]) * np.sign(npv[1:]) < 0)
+    brackets = [(rates[i], rates[i + 1]) for i in changes]
+    candidates = roots + [(low + high) / 2 for low, high in brackets]
+    if not candidates:
+        return np.nan
+    nearest = int(np.argmin(np.abs(np.asarray(candidates) - guess)))
+    if nearest < len(roots):
+        return float(roots[nearest])
+    return float(
+        brentq(
+            lambda r: _npv_and_derivative(r, cash_flows, periods)[0],
+            *brackets[nearest - len(roots)],
+            xtol=1e-12,
+        )
+    )
+
+
+def _newton_irr(cash_flows, periods, rate, tol, max_iter):
+    for _ in range(max_iter):
+        rate = max(rate, -0.999999)
+        npv, derivative = _npv_and_derivative(rate, cash_flows, periods)
+        if not np.isfinite(npv) or not np.isfinite(derivative):
+            return None
+        if abs(derivative) < 1e-12:
+            return None
+        new_rate = rate - npv / derivative
+        if not np.isfinite(new_rate):
+            return None
+        if abs(new_rate - rate) < tol:
+            return float(new_rate)
+        rate = new_rate
+    return None
+
+
+def internal_rate_of_return(
+    cash_flows, periods=None, *, guess=0.1, tol=1e-6, max_iter=100
+):
+    """Per-period rate at which the cash flows' net present value is zero.
+
+    ``periods`` gives each flow's period index (default ``0, 1, 2, ...``), so
+    sparse schedules only need their non-zero flows. Newton's method starts
+    from ``guess`` (then zero) with the NPV and its derivative evaluated as
+    dot products against a discount-factor vector; if it diverges the root is
+    bracketed on a rate grid and solved with Brent's method. Returns ``nan``
+    when the flows have no real root.
+    """
+
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    if periods is None:
+        periods = np.arange(len(cash_flows), dtype=float)
+    periods = np.asarray(periods, dtype=float)
+    if not len(cash_flows):
+        return np.nan
+
+    # Per-period rates over long daily schedules are close to zero, where
+    # Newton from a coarse guess tends to overshoot; retry from zero first.
+    for start in dict.fromkeys([guess, 0.0]):
+        rate = _newton_irr(cash_flows, periods, start, tol, max_iter)
+        if rate is not None:
+            return rate
+    return _solve_irr_on_grid(cash_flows, periods, guess)
+
+
 def slope(data, n):
     if not isinstance(data, list):
         data = [data]
@@ -130,21 +302,26 @@ def curvature(data):
     return slope(d_data, 2)
 
 
-def slope_vectorized(data, n):
+def _elementwise(kernel, data, *args):
+    """Apply an array kernel, returning the same kind of container as ``data``.
+
+    NumPy arrays give arrays and Series give Series on the same index; lists
+    (or a single value) keep returning lists.
+    """
+
+    if isinstance(data, pd.Series):
+        values = kernel(data.to_numpy(dtype=float), *args)
+        return pd.Series(values, index=data.index, name=data.name)
+    if isinstance(data, np.ndarray):
+        return kernel(data, *args)
     if not isinstance(data, list):
         data = [data]
-    slope_vec = []
-    for i in range(0, len(data)):
-        data_for_use = data[0 : i + 1]
-        slope_vec.append(slope(data_for_use, n))
-    return slope_vec
+    return kernel(data, *args).tolist()
+
+
+def slope_vectorized(data, n):
+    return _elementwise(slope_kernel, data, n)
 
 
 def curvature_vectorized(data):
-    if not isinstance(data, list):
-        data = [data]
-    curvature_vec = []
-    for i in range(0, len(data)):
-        data_for_use = data[0 : i + 1]
-        curvature_vec.append(curvature(data_for_use))
-    return curvature_vec
+    return _elementwise(curvature_kernel, data)
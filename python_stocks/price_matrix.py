@@ -0,0 +1,119 @@
+"""Forward-filled price arrays for constant-time price lookups."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class PriceMatrix:
+    """Ticker x field price arrays forward-filled across missing rows.
+
+    ``values[row, ticker, field]`` holds the latest valid price at or before
+    ``row`` and ``last_valid`` the row that price came from (``-1`` when no
+    price has been observed yet), so trades and valuations can read the
+    effective price by integer position instead of re-scanning history.
+
+    ``clean_counts[row, ticker, field]`` counts the finite prices in rows
+    ``0..row``; together with :meth:`clean_values` it lets callers slice the
+    NaN/inf-free history up to any row without copying.
+    """
+
+    def __init__(
+        self,
+        raw: np.ndarray,
+        index: pd.DatetimeIndex,
+        tickers: Sequence[str],
+        fields: Sequence[str],
+    ) -> None:
+        self.raw = raw
+        self.index = index
+        self.tickers: List[str] = list(tickers)
+        self.fields: List[str] = list(fields)
+        self._ticker_position: Dict[str, int] = {
+            ticker: position for position, ticker in enumerate(self.tickers)
+        }
+        self._field_position: Dict[str, int] = {
+            field: position for position, field in enumerate(self.fields)
+        }
+
+        rows = np.arange(raw.shape[0]).reshape(-1, 1, 1)
+        last_valid = np.where(np.isnan(raw), -1, rows)
+        np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+        values = np.take_along_axis(raw, np.maximum(last_valid, 0), axis=0)
+        values[last_valid < 0] = np.nan
+        self.last_valid = last_valid
+        self.values = values
+        finite = np.isfinite(raw)
+        self.clean_counts = np.cumsum(finite, axis=0)
+        self._finite = finite
+        self._clean_values: Dict[tuple[int, int], np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "PriceMatrix":
+        """Build the matrix from a ``(ticker, field)`` MultiIndex DataFrame."""
+
+        tickers: List[str] = []
+        fields: List[str] = []
+        if isinstance(frame.columns, pd.MultiIndex):
+            tickers = list(frame.columns.levels[0])
+            for field in frame.columns.get_level_values(1):
+                if field not in fields:
+                    fields.append(field)
+
+        raw = np.full((len(frame.index), len(tickers), len(fields)), np.nan)
+        ticker_position = {ticker: position for position, ticker in enumerate(tickers)}
+        for ticker, field in frame.columns if tickers else []:
+            raw[:, ticker_position[ticker], fields.index(field)] = frame[
+                (ticker, field)
+            ].to_numpy(dtype=float, na_value=np.nan)
+        return cls(raw, pd.DatetimeIndex(frame.index), tickers, fields)
+
+    def window(self, start: int, stop: int) -> "PriceMatrix":
+        """Rows ``start:stop`` as a matrix of their own.
+
+        The raw prices are shared with this matrix; forward fills and clean
+        counts restart at ``start``, as if the history began there.
+        """
+
+        return PriceMatrix(
+            self.raw[start:stop], self.index[start:stop], self.tickers, self.fields
+        )
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def ticker_position(self, ticker: str) -> int:
+        return self._ticker_position[ticker]
+
+    def field_position(self, field: str) -> int:
+        return self._field_position[field]
+
+    def price(self, ticker: str, field: str, row: int) -> float | None:
+        """Return the latest valid price at or before ``row``."""
+
+        value = self.values[
+            row, self._ticker_position[ticker], self._field_position[field]
+        ]
+        if np.isnan(value):
+            return None
+        return float(value)
+
+    def clean_values(self, ticker: str, field: str) -> np.ndarray:
+        """Return every finite price of ``ticker``/``field`` in row order."""
+
+        key = (self._ticker_position[ticker], self._field_position[field])
+        if key not in self._clean_values:
+            column = self.raw[:, key[0], key[1]]
+            self._clean_values[key] = column[self._finite[:, key[0], key[1]]]
+        return self._clean_values[key]
+
+    def field_values(self, field: str, rows: int | None = None) -> np.ndarray:
+        """Return a ``rows x tickers`` view of forward-filled prices for ``field``."""
+
+        return self.values[:rows, :, self._field_position[field]]
+
+
+__all__ = ["PriceMatrix"]
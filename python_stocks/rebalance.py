@@ -0,0 +1,279 @@
+"""Target-weight rebalancing across many tickers in one vectorized pass.
+
+``buy_all_shares``/``sell_all_shares`` move a whole portfolio in and out of a
+single ticker. A rebalancing strategy instead returns :class:`TargetWeights`
+over the market's tickers, and :func:`simulate_rebalance` trades toward them
+on a schedule (daily, weekly, monthly or when weights drift too far). Each
+rebalance is computed for every ticker and path at once, so a fifty-ticker
+allocation costs one array operation per rebalance day rather than a Python
+loop per ticker per day.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .signals import MarketArrays
+
+REBALANCE_SCHEDULES = ("daily", "weekly", "monthly", "drift")
+_PERIODS = {"weekly": "W", "monthly": "M"}
+
+
+@dataclass(frozen=True)
+class TargetWeights:
+    """Portfolio weights per row for ``tickers``, shaped ``(rows, tickers)``.
+
+    A leading paths axis is optional. ``NaN`` rows keep the previous target;
+    rows before the first target hold cash. Negative weights are treated as
+    zero and weights summing above one are scaled down, so whatever is not
+    allocated stays in the bank account.
+
+    ``schedule`` picks the rebalance days: the first trading row of every
+    day, week or month, or, for ``"drift"``, any trading row on which some
+    ticker's weight is more than ``drift`` away from its target.
+    """
+
+    tickers: Sequence[str]
+    weights: np.ndarray
+    schedule: str = "monthly"
+    drift: float = 0.05
+    when: str = "Close"
+
+    def __post_init__(self) -> None:
+        if self.schedule not in REBALANCE_SCHEDULES:
+            raise ValueError(
+                f"Unknown rebalance schedule {self.schedule!r}; "
+                f"expected one of {REBALANCE_SCHEDULES}"
+            )
+
+
+RebalanceStrategy = Callable[[MarketArrays, Dict[str, Any]], TargetWeights]
+
+
+@dataclass(frozen=True)
+class RebalanceFills:
+    """Ledger arrays produced by :func:`simulate_rebalance`.
+
+    ``positions`` is shaped ``(paths, rows, tickers)``; ``rebalances`` counts
+    the days each path traded.
+    """
+
+    tickers: List[str]
+    positions: np.ndarray
+    bank_account: np.ndarray
+    money_invested: np.ndarray
+    total_fees: np.ndarray
+    total_slippage_cost: np.ndarray
+    rebalances: np.ndarray
+
+
+def schedule_rows(
+    index: pd.DatetimeIndex, trading: np.ndarray, schedule: str
+) -> np.ndarray:
+    """Mask of the trading rows that open a new day, week or month.
+
+    ``"daily"`` and ``"drift"`` consider every trading row.
+    """
+
+    if schedule not in _PERIODS:
+        return trading.copy()
+    periods = index.to_period(_PERIODS[schedule]).asi8
+    rows = np.flatnonzero(trading)
+    first = np.zeros(len(index), dtype=bool)
+    if len(rows):
+        opens = np.concatenate([[True], periods[rows[1:]] != periods[rows[:-1]]])
+        first[rows[opens]] = True
+    return first
+
+
+def _target_array(targets: TargetWeights, paths: int, rows: int) -> np.ndarray:
+    weights = np.asarray(targets.weights, dtype=float)
+    if weights.ndim == 2:
+        weights = weights[np.newaxis]
+    weights = np.broadcast_to(weights[:, :rows], (paths, rows, len(targets.tickers)))
+    # Forward-fill each ticker's weight along the rows; a row is a new target
+    # when any ticker is set on it.
+    set_rows = ~np.isnan(weights).all(axis=2)
+    last = np.where(set_rows, np.arange(rows), -1)
+    np.maximum.accumulate(last, axis=1, out=last)
+    filled = np.take_along_axis(weights, np.maximum(last, 0)[:, :, np.newaxis], axis=1)
+    filled = np.where(np.isnan(filled), 0.0, np.maximum(filled, 0.0))
+    filled[last < 0] = np.nan
+    total = filled.sum(axis=2, keepdims=True)
+    return np.where(total > 1.0, filled / np.where(total > 0, total, 1.0), filled)
+
+
+def simulate_rebalance(
+    targets: TargetWeights,
+    market: MarketArrays,
+    deposits: np.ndarray,
+    principal: float,
+    *,
+    transaction_cost_rate: float = 0.0,
+    slippage_pct: float = 0.0,
+    start_row: int = 0,
+) -> RebalanceFills:
+    """Trade toward the target weights on every scheduled row, for all paths.
+
+    Deposits accrue as in :func:`~python_stocks.signals.simulate_signals`.
+    On a rebalance row a ticker worth more than its weight of the portfolio
+    (at the unslipped price) is sold down to it, and one below the whole
+    number of shares its weight buys at the slipped, fee-inclusive price is
+    bought up to it; positions in between are left alone, so costs alone
+    never cause churn. Sells are filled first; buys are then scaled down if
+    the cash left does not cover them. Fees and slippage follow ``buy_all_shares`` and
+    ``sell_all_shares``. Tickers without a price yet are left untouched.
+    Rows before ``start_row`` are warm-up, as in
+    :func:`~python_stocks.signals.simulate_signals`; the schedule starts
+    afresh on ``start_row``.
+    """
+
+    tickers = list(targets.tickers)
+    paths, rows, count = market.paths, market.rows, len(tickers)
+    positions = np.zeros((paths, rows, count))
+    bank_account = np.zeros((paths, rows))
+    money_invested = np.asarray(deposits[:rows], dtype=float).copy()
+    money_invested[:start_row] = 0.0
+    if rows > start_row:
+        money_invested[start_row] = deposits[start_row] + principal
+    total_fees = np.zeros(paths)
+    total_slippage = np.zeros(paths)
+    rebalances = np.zeros(paths, dtype=int)
+    if rows <= start_row:
+        return RebalanceFills(
+            tickers,
+            positions,
+            bank_account,
+            money_invested,
+            total_fees,
+            total_slippage,
+            rebalances,
+        )
+
+    raw = np.empty((paths, rows, count))
+    prices = np.empty((paths, rows, count))
+    for position, ticker in enumerate(tickers):
+        raw[:, :, position] = market.raw(ticker, targets.when)
+        prices[:, :, position] = market.filled(ticker, targets.when)
+    weights = _target_array(targets, paths, rows)
+    trading = np.asarray(np.isfinite(raw).any(axis=(0, 2)))
+    candidates = np.zeros(rows, dtype=bool)
+    candidates[start_row:] = schedule_rows(
+        market.index[start_row:], trading[start_row:], targets.schedule
+    )
+    candidates &= ~np.isnan(weights).all(axis=(0, 2))
+
+    bank = np.zeros(paths)
+    held = np.zeros((paths, count))
+    rebalanced_once = np.zeros(paths, dtype=bool)
+    quiet_start = 0
+    for row in [*np.flatnonzero(candidates).tolist(), rows]:
+        if row > quiet_start:
+            stretch = np.broadcast_to(
+                money_invested[quiet_start:row], (paths, row - quiet_start)
+            )
+            accrued = np.cumsum(np.column_stack([bank, stretch]), axis=1)[:, 1:]
+            bank_account[:, quiet_start:row] = accrued
+            positions[:, quiet_start:row] = held[:, np.newaxis, :]
+            bank = accrued[:, -1].copy()
+        if row == rows:
+            break
+        quiet_start = row + 1
+
+        bank = bank + money_invested[row]
+        base = prices[:, row]
+        priced = np.isfinite(base)
+        value = held * np.where(priced, base, 0.0)
+        equity = bank + value.sum(axis=1)
+        target = weights[:, row]
+        active = ~np.isnan(target).any(axis=1) & (equity > 0)
+        if targets.schedule == "drift":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                current = value / equity[:, np.newaxis]
+            drifted = (np.abs(current - target) > targets.drift).any(axis=1)
+            active &= drifted | ~rebalanced_once
+        if active.any():
+            tradable = priced & active[:, np.newaxis]
+            base = np.where(tradable, base, 0.0)
+            buy_price = base * (1 + slippage_pct)
+            sell_price = base * (1 - slippage_pct)
+            buy_cost_per_share = buy_price * (1 + transaction_cost_rate)
+            target_value = target * equity[:, np.newaxis]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                most = np.floor(target_value / base)
+                fewest = np.floor(target_value / buy_cost_per_share)
+                sell = np.where(tradable, np.maximum(held - most, 0.0), 0.0)
+                buy = np.where(tradable, np.maximum(fewest - held, 0.0), 0.0)
+
+            sold = sell * sell_price
+            sell_fees = sold * transaction_cost_rate
+            sell_slippage = sell * (base - sell_price)
+            bank = np.maximum(0.0, bank + (sold - sell_fees).sum(axis=1))
+
+            needed = (buy * buy_cost_per_share).sum(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scale = np.where(needed > bank, bank / needed, 1.0)
+            buy = np.floor(buy * scale[:, np.newaxis])
+            bought = buy * buy_price
+            buy_fees = bought * transaction_cost_rate
+            buy_slippage = buy * (buy_price - base)
+            bank = np.maximum(0.0, bank - (bought + buy_fees).sum(axis=1))
+
+            held = held - sell + buy
+            total_fees += (sell_fees + buy_fees).sum(axis=1)
+            total_slippage += np.maximum(0.0, sell_slippage + buy_slippage).sum(axis=1)
+            traded = active & ((sell > 0) | (buy > 0)).any(axis=1)
+            rebalances += traded
+            rebalanced_once |= active
+
+        positions[:, row] = held
+        bank_account[:, row] = bank
+
+    return RebalanceFills(
+        tickers,
+        positions,
+        bank_account,
+        money_invested,
+        total_fees,
+        total_slippage,
+        rebalances,
+    )
+
+
+def rebalance_only(context):
+    """``Strategy.apply`` for strategies that only exist as target weights."""
+
+    raise TypeError(
+        "Rebalancing strategies run in the engine's vectorized pass, "
+        "not one day at a time"
+    )
+
+
+def equal_weight_targets(market: MarketArrays, params: Dict[str, Any]) -> TargetWeights:
+    """Hold every ticker (or ``params["tickers"]``) in equal proportion."""
+
+    tickers = list(params.get("tickers") or market.tickers)
+    weights = np.full((market.rows, len(tickers)), 1.0 / max(len(tickers), 1))
+    return TargetWeights(
+        tickers,
+        weights,
+        schedule=params.get("schedule", "monthly"),
+        drift=params.get("drift", 0.05),
+        when=params.get("when", "Close"),
+    )
+
+
+__all__ = [
+    "REBALANCE_SCHEDULES",
+    "RebalanceFills",
+    "RebalanceStrategy",
+    "TargetWeights",
+    "equal_weight_targets",
+    "rebalance_only",
+    "schedule_rows",
+    "simulate_rebalance",
+]
@@ -3,12 +3,18 @@
 from typing import Iterable
 
 from .dougs_strategies import (
+    signals_buy_and_hold,
+    signals_maf_investment,
+    signals_no_investment,
+    signals_openclose_investment,
+    maf_indicators,
     strategy_buy_and_hold,
     strategy_maf_investment,
     strategy_marcus_2p25,
     strategy_no_investment,
     strategy_openclose_investment,
 )
+from .rebalance import equal_weight_targets, rebalance_only
 from .strategy_registry import Strategy, StrategyRegistry
 
 
@@ -19,6 +25,7 @@ def build_default_registry(available_tickers: Iterable[str]) -> StrategyRegistry
         Strategy(
             name="no_investment",
             apply=strategy_no_investment,
+            vectorized=signals_no_investment,
             description="Hold cash with no trades.",
         )
     )
@@ -27,6 +34,7 @@ def build_default_registry(available_tickers: Iterable[str]) -> StrategyRegistry
         Strategy(
             name="buy_and_hold",
             apply=strategy_buy_and_hold,
+            vectorized=signals_buy_and_hold,
             required_fields=["Close"],
             parameters={"ticker": list(available_tickers)},
             description="Buy all shares in a ticker and hold.",
@@ -37,6 +45,7 @@ def build_default_registry(available_tickers: Iterable[str]) -> StrategyRegistry
         Strategy(
             name="open_close",
             apply=strategy_openclose_investment,
+            vectorized=signals_openclose_investment,
             required_fields=["Open", "Close"],
             parameters={"ticker": list(available_tickers)},
             description="Buy or sell at open based on previous close.",
@@ -47,6 +56,8 @@ def build_default_registry(available_tickers: Iterable[str]) -> StrategyRegistry
         Strategy(
             name="moving_average_filter",
             apply=strategy_maf_investment,
+            vectorized=signals_maf_investment,
+            indicators=maf_indicators,
             required_fields=["Close"],
             parameters={
                 "ticker": list(available_tickers),
@@ -57,6 +68,18 @@ def build_default_registry(available_tickers: Iterable[str]) -> StrategyRegistry
         )
     )
 
+    registry.register(
+        Strategy(
+            name="equal_weight",
+            apply=rebalance_only,
+            rebalance=equal_weight_targets,
+            required_fields=["Close"],
+            parameters={"schedule": ["monthly"]},
+            description="Hold every ticker in equal weight, rebalanced on a schedule.",
+            opt_in=True,
+        )
+    )
+
     registry.register(
         Strategy(
             name="marcus_savings",
@@ -0,0 +1,105 @@
+"""Return and risk statistics derived from one equity curve in a single pass."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .math_helper import internal_rate_of_return
+
+
+@dataclass(frozen=True)
+class ReturnAnalytics:
+    """Everything the reports derive from an equity curve and its deposits.
+
+    ``drawdown`` is measured on the portfolio value itself (deposits raise the
+    running peak), while ``max_drawdown`` compounds the daily returns, as the
+    printed summary and the strategy report have always done respectively.
+    Rates from :attr:`time_weighted_return` and :attr:`money_weighted_return`
+    are for the whole period; use :meth:`annualized` to convert them.
+    """
+
+    years: float
+    days: int
+    returns: np.ndarray
+    time_weighted_return: float
+    money_weighted_return: float
+    drawdown: pd.Series
+    max_drawdown: float
+    cagr: float
+    volatility: float
+    sharpe_ratio: float
+
+    def annualized(self, rate: float) -> float:
+        if self.days <= 0:
+            return rate
+        return (1 + rate) ** (1 / (self.days / 365)) - 1
+
+
+def compute_return_analytics(
+    equity_curve: pd.Series, money_invested: np.ndarray
+) -> ReturnAnalytics:
+    """Compute the return statistics for a date-indexed equity curve.
+
+    ``money_invested`` holds the deposit made on each row of the curve.
+    """
+
+    values = equity_curve.to_numpy(dtype=float)
+    deposits = np.nan_to_num(np.asarray(money_invested, dtype=float))
+    rows = len(values)
+    days = (equity_curve.index[-1] - equity_curve.index[0]).days if rows else 0
+    years = days / 365.0 if rows > 1 else 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1
+        # Daily returns net of that day's deposit, chained in order.
+        daily_growth = values[1:] / (values[:-1] + deposits[1:]) - 1
+    returns = returns[~np.isnan(returns)]
+
+    time_weighted = np.cumprod(1 + daily_growth)[-1] - 1 if rows > 1 else 0
+
+    # Only days with a deposit contribute a cash flow; the final portfolio
+    # value is received one period after the last row.
+    periods = np.flatnonzero(deposits)
+    cash_flows = np.append(-deposits[periods], values[-1] if rows else 0.0)
+    irr = internal_rate_of_return(cash_flows, np.append(periods, rows))
+    money_weighted = irr if np.isfinite(irr) else 0
+
+    running_peak = np.maximum.accumulate(values) if rows else values
+    drawdown = pd.Series(values / running_peak - 1, index=equity_curve.index)
+
+    cumulative = np.cumprod(1 + returns)
+    compounded_drawdown = cumulative / np.maximum.accumulate(cumulative) - 1
+    max_drawdown = compounded_drawdown.min() if len(returns) else 0
+
+    cagr = (values[-1] / values[0]) ** (1 / years) - 1 if years > 0 else 0
+    if len(returns):
+        mean = returns.sum() / len(returns)
+        std = (
+            np.sqrt(((mean - returns) ** 2).sum() / (len(returns) - 1))
+            if len(returns) > 1
+            else np.nan
+        )
+        volatility = std * (252**0.5)
+        sharpe = (mean * 252) / volatility if volatility else 0
+    else:
+        volatility = 0
+        sharpe = 0
+
+    return ReturnAnalytics(
+        years=years,
+        days=days,
+        returns=returns,
+        time_weighted_return=time_weighted,
+        money_weighted_return=money_weighted,
+        drawdown=drawdown,
+        max_drawdown=max_drawdown,
+        cagr=cagr,
+        volatility=volatility,
+        sharpe_ratio=sharpe,
+    )
+
+
+__all__ = ["ReturnAnalytics", "compute_return_analytics"]
@@ -1,8 +1,10 @@
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import pandas as pd
 
+from .engine.checkpoint import SimulationCheckpoint
 from .engine.simulator import SimulationEngine
+from .engine.sinks import ResultSink
 from .services.strategy_service import StrategyResult
 from .services.runtime_flags import prefer_cached_results
 
@@ -21,7 +23,7 @@ _SIMULATION_CACHE: Dict[
 
 
 def _normalize_overrides(
-    parameter_overrides: Optional[Dict[str, Dict[str, Iterable[object]]]],
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
 ) -> Tuple[str, ...]:
     if not parameter_overrides:
         return tuple()
@@ -38,7 +40,7 @@ def _build_cache_key(
     initial_deposit: int,
     historic_data,
     enabled_strategies: Optional[List[str]],
-    parameter_overrides: Optional[Dict[str, Dict[str, Iterable[object]]]],
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]],
 ) -> SimulationCacheKey:
     tickers = tuple(historic_data.tickers())
     idx = historic_data.data_frame.index
@@ -59,23 +61,32 @@ def run_some_strategies(
     initial_deposit: int,
     historic_data,
     enabled_strategies: Optional[List[str]] = None,
-    parameter_overrides: Optional[Dict[str, Dict[str, Iterable[object]]]] = None,
+    parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[object]]]] = None,
     prefer_cache: Optional[bool] = None,
+    workers: int = 1,
+    reporting: str = "silent",
+    checkpoint: Optional[SimulationCheckpoint] = None,
+    sink: Optional[ResultSink] = None,
+    retention: str = "full",
 ) -> Tuple[pd.DataFrame, List[StrategyResult]]:
     cache_key = _build_cache_key(
         initial_deposit, historic_data, enabled_strategies, parameter_overrides
     )
-    use_cache = prefer_cached_results(prefer_cache)
+    # A sink must see every run, so streamed sweeps bypass the cache.
+    use_cache = prefer_cached_results(prefer_cache) and sink is None
 
     if use_cache and cache_key in _SIMULATION_CACHE:
         cached_df, cached_results = _SIMULATION_CACHE[cache_key]
         return cached_df.copy(deep=True), list(cached_results)
 
-    engine = SimulationEngine(historic_data)
+    engine = SimulationEngine(historic_data, reporting=reporting, retention=retention)
     output = engine.run_once(
         initial_deposit,
         enabled_strategies=enabled_strategies,
         parameter_overrides=parameter_overrides,
+        workers=workers,
+        checkpoint=checkpoint,
+        sink=sink,
     )
 
     if use_cache:
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import math
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict
 
+import numpy as np
+
+from ..indicators import IndicatorSet
 from ..trading_history import TradingHistory
 
 
@@ -15,6 +19,18 @@ class StrategyContext:
     history: TradingHistory
     params: Dict[str, Any]
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random stream for this run, derived from the engine seed."""
+
+        return self.history.rng
+
+    @property
+    def indicators(self) -> IndicatorSet:
+        """Streaming indicators the engine keeps current for this run."""
+
+        return self.history.indicators
+
 
 @dataclass(frozen=True)
 class StrategyConfig:
@@ -64,4 +80,49 @@ class StrategyResult:
         }
 
 
-__all__ = ["StrategyConfig", "StrategyContext", "StrategyResult"]
+# Numeric StrategyResult fields usable to rank runs. Smaller is better for
+# LOWER_IS_BETTER; every other metric is maximized (``max_drawdown`` and
+# ``time_in_market_penalty`` are negative, so the values closest to zero rank
+# first).
+RESULT_METRICS = tuple(
+    result_field.name
+    for result_field in fields(StrategyResult)
+    if result_field.name not in ("strategy", "parameters")
+)
+LOWER_IS_BETTER = frozenset(
+    {
+        "volatility",
+        "trade_count",
+        "total_fees",
+        "slippage_cost",
+        "tracking_error",
+    }
+)
+
+
+def check_metric(metric: str) -> str:
+    if metric not in RESULT_METRICS:
+        raise ValueError(
+            f"Unknown metric {metric!r}; choose one of {', '.join(RESULT_METRICS)}"
+        )
+    return metric
+
+
+def metric_score(result: StrategyResult, metric: str) -> float:
+    """``metric`` oriented so that larger is better; ``NaN`` ranks last."""
+
+    value = float(getattr(result, metric))
+    if math.isnan(value):
+        return -math.inf
+    return -value if metric in LOWER_IS_BETTER else value
+
+
+__all__ = [
+    "LOWER_IS_BETTER",
+    "RESULT_METRICS",
+    "StrategyConfig",
+    "StrategyContext",
+    "StrategyResult",
+    "check_metric",
+    "metric_score",
+]
@@ -0,0 +1,267 @@
+"""Vectorized signal protocol for strategies evaluated on whole price arrays.
+
+Per-day strategies are called once per simulated day through
+``TradingHistory.new_day``. A strategy that can express its rule as arrays
+instead returns :class:`TradeSignals` for the whole history, and
+:func:`simulate_signals` applies the fills, transaction costs and slippage in
+a single pass over the days, vectorized across paths.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .indicators import IndicatorCache, IndicatorSeries, IndicatorSpec
+from .price_matrix import PriceMatrix
+
+
+def _forward_fill(raw: np.ndarray) -> np.ndarray:
+    rows = np.arange(raw.shape[1])
+    last_valid = np.where(np.isnan(raw), -1, rows)
+    np.maximum.accumulate(last_valid, axis=1, out=last_valid)
+    filled = np.take_along_axis(raw, np.maximum(last_valid, 0), axis=1)
+    filled[last_valid < 0] = np.nan
+    return filled
+
+
+class MarketArrays:
+    """Price arrays shaped ``(paths, rows)`` for each ticker and field.
+
+    The historical replay is a single path; simulated scenarios stack many
+    paths so a vectorized strategy evaluates all of them at once. Missing
+    prices are ``NaN``.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[Tuple[str, str], np.ndarray],
+        index: pd.DatetimeIndex,
+        *,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> None:
+        self._columns = columns
+        self.index = index
+        self.indicators = indicators if indicators is not None else IndicatorCache()
+        self._cache: Dict[Tuple[str, str, str], np.ndarray] = {}
+
+    @classmethod
+    def from_price_matrix(
+        cls,
+        prices: PriceMatrix,
+        rows: int,
+        *,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> "MarketArrays":
+        columns = {
+            (ticker, field): prices.raw[np.newaxis, :rows, t, f]
+            for t, ticker in enumerate(prices.tickers)
+            for f, field in enumerate(prices.fields)
+        }
+        return cls(columns, prices.index[:rows], indicators=indicators)
+
+    @property
+    def rows(self) -> int:
+        return len(self.index)
+
+    @property
+    def paths(self) -> int:
+        first = next(iter(self._columns.values()), None)
+        return 1 if first is None else first.shape[0]
+
+    @property
+    def tickers(self) -> list[str]:
+        return list(dict.fromkeys(ticker for ticker, _ in self._columns))
+
+    def raw(self, ticker: str, field: str) -> np.ndarray:
+        return self._columns[(ticker, field)]
+
+    def filled(self, ticker: str, field: str) -> np.ndarray:
+        """Prices forward-filled along each path (``NaN`` before the first)."""
+
+        key = (ticker, field, "filled")
+        if key not in self._cache:
+            self._cache[key] = _forward_fill(self.raw(ticker, field))
+        return self._cache[key]
+
+    def clean_count(self, ticker: str, field: str) -> np.ndarray:
+        """Number of finite prices observed up to and including each row."""
+
+        key = (ticker, field, "count")
+        if key not in self._cache:
+            self._cache[key] = np.cumsum(np.isfinite(self.raw(ticker, field)), axis=1)
+        return self._cache[key]
+
+    def indicator(self, spec: IndicatorSpec) -> IndicatorSeries:
+        """Whole-history indicator values, shared through :attr:`indicators`."""
+
+        return self.indicators.series(spec, self)
+
+    def clean_lag(self, ticker: str, field: str, lag: int = 0) -> np.ndarray:
+        """The ``lag``-th most recent finite price at each row.
+
+        Matches indexing ``[-1 - lag]`` into the NaN/inf-free history that a
+        per-day strategy sees; ``NaN`` where the history is too short.
+        """
+
+        raw = self.raw(ticker, field)
+        counts = self.clean_count(ticker, field)
+        lagged = np.full(raw.shape, np.nan)
+        for path in range(raw.shape[0]):
+            finite = raw[path][np.isfinite(raw[path])]
+            positions = counts[path] - 1 - lag
+            available = positions >= 0
+            lagged[path, available] = finite[positions[available]]
+        return lagged
+
+
+@dataclass(frozen=True)
+class TradeSignals:
+    """Per-day all-in/all-out trade flags for a single ticker.
+
+    On each row a ``buy`` is applied before a ``sell``, mirroring a per-day
+    strategy that calls ``buy_all_shares`` and then ``sell_all_shares``.
+    Fills use the forward-filled ``when`` price of that row.
+    """
+
+    ticker: Optional[str]
+    buy: np.ndarray
+    sell: np.ndarray
+    when: str = "Close"
+
+    @classmethod
+    def hold_cash(cls, market: MarketArrays) -> "TradeSignals":
+        flags = np.zeros((market.paths, market.rows), dtype=bool)
+        return cls(ticker=None, buy=flags, sell=flags)
+
+
+VectorizedStrategy = Callable[[MarketArrays, Dict[str, Any]], TradeSignals]
+
+
+@dataclass(frozen=True)
+class SignalFills:
+    """Ledger arrays produced by :func:`simulate_signals`."""
+
+    positions: np.ndarray
+    bank_account: np.ndarray
+    money_invested: np.ndarray
+    total_fees: np.ndarray
+    total_slippage_cost: np.ndarray
+
+
+def simulate_signals(
+    signals: TradeSignals,
+    market: MarketArrays,
+    deposits: np.ndarray,
+    principal: float,
+    *,
+    transaction_cost_rate: float = 0.0,
+    slippage_pct: float = 0.0,
+    start_row: int = 0,
+) -> SignalFills:
+    """Apply all-in/all-out fills for every path in one pass over the days.
+
+    The arithmetic follows ``TradingHistory.buy_all_shares`` and
+    ``sell_all_shares`` step for step, so a single-path result matches the
+    per-day callback ledger exactly. Rows before ``start_row`` are warm-up
+    (see ``TradingHistory.start_row``): no deposits, no trades; the
+    principal arrives on ``start_row``.
+    """
+
+    paths, rows = market.paths, market.rows
+    positions = np.zeros((paths, rows))
+    bank_account = np.zeros((paths, rows))
+    money_invested = np.asarray(deposits[:rows], dtype=float).copy()
+    money_invested[:start_row] = 0.0
+    if rows > start_row:
+        money_invested[start_row] = deposits[start_row] + principal
+    total_fees = np.zeros(paths)
+    total_slippage = np.zeros(paths)
+
+    if signals.ticker is None:
+        bank_account[:] = np.cumsum(money_invested)
+        return SignalFills(
+            positions, bank_account, money_invested, total_fees, total_slippage
+        )
+
+    base_prices = np.broadcast_to(
+        market.filled(signals.ticker, signals.when), (paths, rows)
+    )
+    buy_flags = np.broadcast_to(signals.buy, (paths, rows))
+    sell_flags = np.broadcast_to(signals.sell, (paths, rows))
+    if start_row:
+        trading = np.arange(rows) >= start_row
+        buy_flags, sell_flags = buy_flags & trading, sell_flags & trading
+    buy_price = base_prices * (1 + slippage_pct)
+    sell_price = base_prices * (1 - slippage_pct)
+    buy_cost_per_share = buy_price * (1 + transaction_cost_rate)
+
+    bank = np.zeros(paths)
+    held = np.zeros(paths)
+    # Rows without a flag on any path only accrue deposits; they are filled a
+    # stretch at a time. ``cumsum`` adds left to right, exactly like the loop.
+    flagged = np.flatnonzero((buy_flags | sell_flags).any(axis=0))
+    quiet_start = 0
+    for row in [*flagged.tolist(), rows]:
+        if row > quiet_start:
+            stretch = np.broadcast_to(
+                money_invested[quiet_start:row], (paths, row - quiet_start)
+            )
+            accrued = np.cumsum(np.column_stack([bank, stretch]), axis=1)[:, 1:]
+            bank_account[:, quiet_start:row] = accrued
+            positions[:, quiet_start:row] = held[:, np.newaxis]
+            bank = accrued[:, -1].copy()
+        if row == rows:
+            break
+        quiet_start = row + 1
+
+        bank = bank + money_invested[row]
+        base = base_prices[:, row]
+        priced = ~np.isnan(base)
+
+        buying = buy_flags[:, row] & priced & (bank > 0)
+        if buying.any():
+            shares = np.zeros(paths)
+            shares[buying] = np.floor(bank[buying] / buy_cost_per_share[buying, row])
+            buying &= shares > 0
+        if buying.any():
+            trade_value = shares * buy_price[:, row]
+            fee = trade_value * transaction_cost_rate
+            slipped = shares * (buy_price[:, row] - base)
+            bank = np.where(buying, np.maximum(0.0, bank - trade_value - fee), bank)
+            held = np.where(buying, held + shares, held)
+            total_fees = np.where(buying, total_fees + fee, total_fees)
+            total_slippage = np.where(
+                buying, total_slippage + np.maximum(0.0, slipped), total_slippage
+            )
+
+        selling = sell_flags[:, row] & priced & (held > 0)
+        if selling.any():
+            trade_value = held * sell_price[:, row]
+            fee = trade_value * transaction_cost_rate
+            slipped = held * (base - sell_price[:, row])
+            bank = np.where(selling, np.maximum(0.0, bank + trade_value - fee), bank)
+            held = np.where(selling, 0.0, held)
+            total_fees = np.where(selling, total_fees + fee, total_fees)
+            total_slippage = np.where(
+                selling, total_slippage + np.maximum(0.0, slipped), total_slippage
+            )
+
+        positions[:, row] = held
+        bank_account[:, row] = bank
+
+    return SignalFills(
+        positions, bank_account, money_invested, total_fees, total_slippage
+    )
+
+
+__all__ = [
+    "MarketArrays",
+    "SignalFills",
+    "TradeSignals",
+    "VectorizedStrategy",
+    "simulate_signals",
+]
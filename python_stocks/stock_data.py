@@ -1,10 +1,14 @@
+import copy
+
 import numpy as np
 import pandas as pd
 from typing import Callable
 
 from .data_loading import load_into_stock_data_set
-from .math_helper import no_delay_moving_average_filter_on_that_day_vectorized
+from .math_helper import no_delay_moving_average_on_that_day_kernel
+from .market_view import MarketView
 from .plotting import plt
+from .price_matrix import PriceMatrix
 
 
 class StockData:
@@ -25,17 +29,49 @@ class StockData:
         inn = df.index
         idx = pd.date_range(inn[0], inn[-1])
         df = df.reindex(idx, fill_value=np.nan)
+        self._deposits: tuple[tuple, np.ndarray] | None = None
         self.data_frame = df
         self.monthly_deposit = monthly_deposit
         self.daily_deposit = daily_deposit
 
+    @property
+    def data_frame(self) -> pd.DataFrame:
+        return self._data_frame
+
+    @data_frame.setter
+    def data_frame(self, frame: pd.DataFrame) -> None:
+        self._data_frame = frame
+        self.prices = PriceMatrix.from_frame(frame)
+        self._deposits = None
+
+    def deposit_schedule(self) -> np.ndarray:
+        """Per-row deposits: the daily amount plus the monthly one on the 1st."""
+
+        key = (self.daily_deposit, self.monthly_deposit)
+        if self._deposits is None or self._deposits[0] != key:
+            first_of_month = np.asarray(self.data_frame.index.day == 1)
+            schedule = np.where(
+                first_of_month,
+                self.daily_deposit + self.monthly_deposit,
+                self.daily_deposit,
+            )
+            self._deposits = (key, schedule)
+        return self._deposits[1]
+
+    def market_view(self, cursor: int = 0) -> MarketView:
+        """Return a cursor over the full price arrays and deposit schedule."""
+
+        return MarketView(
+            self.prices,
+            self.data_frame,
+            deposits=self.deposit_schedule(),
+            cursor=cursor,
+        )
+
     def get_stock_df_to_today_and_money_to_add(self, row_n):
         # Create stock history df up to this day.
         stock_df_to_today = self.data_frame.iloc[:row_n]
-        # Calculate the investment schedule.
-        money_to_add = self.daily_deposit
-        if stock_df_to_today.index[-1].day == 1:
-            money_to_add += self.monthly_deposit
+        money_to_add = self.deposit_schedule()[row_n - 1]
         return stock_df_to_today, money_to_add
 
     def add_external_investments(self, monthly_deposit, daily_deposit):
@@ -53,6 +89,15 @@ class StockData:
         end = end_date or self.data_frame.index[-1]
         self.data_frame = self.data_frame.loc[start:end]
 
+    def window(self, start: int, stop: int) -> "StockData":
+        """Rows ``start:stop`` as a new StockData sharing this one's prices."""
+
+        window = copy.copy(self)
+        window._data_frame = self.data_frame.iloc[start:stop]
+        window.prices = self.prices.window(start, stop)
+        window._deposits = None
+        return window
+
     def plot(self):
         df = self.data_frame
         for ticker in self.tickers():
@@ -60,16 +105,18 @@ class StockData:
             sub_df = df[ticker]["Close"]  # [['Close', 'Open', 'High', 'Low']]
             sub_df = sub_df[~sub_df.isin([np.nan, np.inf, -np.inf])]
             # sub_df.plot(kind='line', title=ticker+' Prices')
-            data = list(sub_df)
+            data = sub_df.to_numpy(dtype=float)
+            # The plot needs no bit-identity with the trading filters, so take
+            # the single-pass cumulative-sum kernels.
             plt.plot(sub_df.index, data, label="Closing Prices")
             plt.plot(
                 sub_df.index,
-                no_delay_moving_average_filter_on_that_day_vectorized(data, 10),
+                no_delay_moving_average_on_that_day_kernel(data, 10, exact=False),
                 label="Closing Prices - on that day - MAF 10",
             )
             plt.plot(
                 sub_df.index,
-                no_delay_moving_average_filter_on_that_day_vectorized(data, 100),
+                no_delay_moving_average_on_that_day_kernel(data, 100, exact=False),
                 label="Closing Prices - on that day - MAF 100",
             )
             plt.legend()
@@ -1,25 +1,61 @@
 from dataclasses import dataclass, field
 from itertools import product
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .indicators import IndicatorSpec
+from .rebalance import RebalanceStrategy
+from .signals import VectorizedStrategy
 from .trading_history import TradingHistory
 from .services.strategy_service import StrategyContext
 
 StrategyCallable = Callable[[StrategyContext], TradingHistory]
+IndicatorDeclaration = Callable[[Dict[str, Any]], Sequence[IndicatorSpec]]
 
 
 @dataclass(frozen=True)
 class Strategy:
-    """A simple strategy interface with metadata and parameter sweeps."""
+    """A simple strategy interface with metadata and parameter sweeps.
+
+    ``apply`` is called once per simulated day. Strategies whose rule can be
+    expressed on whole price arrays may also provide ``vectorized``, which
+    returns :class:`~python_stocks.signals.TradeSignals` for the full history;
+    the engine then fills the run in one pass instead of stepping ``apply``.
+
+    ``indicators`` maps a parameter combination to the streaming indicators
+    the strategy reads; the engine updates them with every bar before calling
+    ``apply``.
+
+    ``rebalance`` returns :class:`~python_stocks.rebalance.TargetWeights`
+    across several tickers instead; such strategies are always filled by the
+    engine's vectorized pass (``apply`` is usually
+    :func:`~python_stocks.rebalance.rebalance_only`).
+
+    ``opt_in`` strategies only run when named in ``enabled_names``; a run
+    that enables nothing explicitly skips them.
+    """
 
     name: str
     apply: StrategyCallable
     required_fields: Sequence[str] = field(default_factory=list)
     parameters: Dict[str, Sequence[Any]] = field(default_factory=dict)
     description: str = ""
+    vectorized: Optional[VectorizedStrategy] = None
+    indicators: Optional[IndicatorDeclaration] = None
+    rebalance: Optional[RebalanceStrategy] = None
+    opt_in: bool = False
 
     def expand_parameters(
-        self, overrides: Optional[Dict[str, Iterable[Any]]] = None
+        self, overrides: Optional[Mapping[str, Iterable[Any]]] = None
     ) -> List[Dict[str, Any]]:
         """Expand the parameter grid into a list of concrete parameter dictionaries."""
 
@@ -45,11 +81,19 @@ class Strategy:
     ) -> Callable[[TradingHistory], TradingHistory]:
         """Return a callable consumable by TradingHistory.new_day."""
 
-        def runner(history: TradingHistory) -> TradingHistory:
-            context = StrategyContext(history=history, params=params)
-            return self.apply(context)
+        return StrategyRunner(strategy=self, params=params)
 
-        return runner
+
+@dataclass(frozen=True)
+class StrategyRunner:
+    """Picklable adapter binding a strategy to one parameter combination."""
+
+    strategy: Strategy
+    params: Dict[str, Any]
+
+    def __call__(self, history: TradingHistory) -> TradingHistory:
+        context = StrategyContext(history=history, params=self.params)
+        return self.strategy.apply(context)
 
 
 class StrategyRegistry:
@@ -64,17 +108,24 @@ class StrategyRegistry:
     def available_strategies(self) -> List[str]:
         return list(self._strategies.keys())
 
+    def default_strategies(self) -> List[str]:
+        """Strategies run when none are enabled explicitly."""
+
+        return [
+            name for name, strategy in self._strategies.items() if not strategy.opt_in
+        ]
+
     def get(self, name: str) -> Strategy:
         return self._strategies[name]
 
     def expand_strategies(
         self,
         enabled_names: Optional[Iterable[str]] = None,
-        parameter_overrides: Optional[Dict[str, Dict[str, Iterable[Any]]]] = None,
+        parameter_overrides: Optional[Mapping[str, Mapping[str, Iterable[Any]]]] = None,
     ) -> List[Tuple[Strategy, Dict[str, Any]]]:
         """Return all strategy/parameter combinations to run."""
 
-        names = enabled_names or self.available_strategies()
+        names = enabled_names or self.default_strategies()
         overrides = parameter_overrides or {}
 
         strategy_runs: List[Tuple[Strategy, Dict[str, Any]]] = []
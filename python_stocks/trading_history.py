@@ -1,8 +1,15 @@
 import numpy as np
 import pandas as pd
 
+from .indicators import IndicatorSet
+from .ledger import TradingLedger
+from .market_view import MarketView
 from .math_helper import percentage_difference
 from .plotting import plt
+from .price_matrix import PriceMatrix
+from .return_analytics import ReturnAnalytics, compute_return_analytics
+from .rebalance import RebalanceFills
+from .signals import SignalFills
 
 
 class TradingHistory:
@@ -16,57 +23,134 @@ class TradingHistory:
         *,
         transaction_cost_rate: float = 0.0,
         slippage_pct: float = 0.0,
+        capacity: int = 0,
+        rng: np.random.Generator | None = None,
+        start_row: int = 0,
     ):
-        df = pd.DataFrame(columns=col_list)
-        df.index = pd.to_datetime(df.index)
-
-        self.trading_history_df = df
+        self._ledger = TradingLedger(col_list, capacity)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.indicators = IndicatorSet()
         self.principal = principal
         self.strat_function = strat_function
-        self.stock_df_to_today = pd.DataFrame()
+        self._equity_cache: tuple[tuple[int, ...], pd.Series] | None = None
+        self._analytics_cache: tuple[tuple[int, ...], ReturnAnalytics] | None = None
+        self.market = MarketView.from_frame(pd.DataFrame())
         self.name = name
         self.transaction_cost_rate = max(0.0, transaction_cost_rate)
         self.slippage_pct = max(0.0, slippage_pct)
         self.total_fees: float = 0.0
         self.total_slippage_cost: float = 0.0
+        # Rows before ``start_row`` are warm-up: recorded empty, never traded
+        # and left out of the return analytics.
+        self.start_row = start_row
+
+    def __getstate__(self):
+        # The market view references the full price history; it is shared and
+        # re-attached by the receiver rather than copied with every history.
+        state = self.__dict__.copy()
+        state["market"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.market is None:
+            self.market = MarketView.from_frame(pd.DataFrame())
+
+    @property
+    def ledger(self) -> TradingLedger:
+        return self._ledger
+
+    @ledger.setter
+    def ledger(self, ledger: TradingLedger) -> None:
+        self._ledger = ledger
+
+    @property
+    def trading_history_df(self) -> pd.DataFrame:
+        """Read-only DataFrame view over the ledger rows recorded so far."""
+
+        return self._ledger.to_frame()
+
+    @trading_history_df.setter
+    def trading_history_df(self, frame: pd.DataFrame) -> None:
+        self._ledger = TradingLedger.from_frame(frame, self._ledger.capacity)
+
+    @property
+    def stock_df_to_today(self) -> pd.DataFrame:
+        """DataFrame view of the market history up to the current day."""
+
+        return self.market.frame
+
+    @stock_df_to_today.setter
+    def stock_df_to_today(self, frame: pd.DataFrame) -> None:
+        self.market = MarketView.from_frame(frame)
+
+    @property
+    def price_matrix(self) -> PriceMatrix:
+        return self.market.prices
 
     #### STRATS ####
     # def strat1(self):
 
     #### GENERAL HELP ####
-    def new_day(self, stock_df_to_today, money_to_add):
-        self.stock_df_to_today = stock_df_to_today
-        df = self.trading_history_df
-        todays_date = stock_df_to_today.index[-1]
-
-        is_first_day = len(stock_df_to_today.index) <= 1
-        if is_first_day:
-            df.loc[todays_date] = [0.0] * len(df.columns)
-            starting_bank = 0
-        else:
-            df.loc[todays_date] = df.iloc[-1]
-            starting_bank = df.at[todays_date, "bank_account"]
+    def new_day(self, market: MarketView | pd.DataFrame, money_to_add):
+        if isinstance(market, pd.DataFrame):
+            market = MarketView.from_frame(market)
+        self.market = market
+        ledger = self._ledger
+        todays_date = market.date
+
+        if market.rows <= self.start_row:
+            ledger.append_row(todays_date, carry=False)
+            return
+        is_first_day = market.rows <= self.start_row + 1
+        ledger.append_row(todays_date, carry=not is_first_day)
+        starting_bank = 0 if is_first_day else ledger.get("bank_account")
 
         deposit = money_to_add + (self.principal if is_first_day else 0)
-        df.at[todays_date, "money_invested"] = deposit
-        df.at[todays_date, "bank_account"] = starting_bank + deposit
-
-        self.trading_history_df = df
+        ledger.set("money_invested", deposit)
+        ledger.set("bank_account", starting_bank + deposit)
 
         strat = self.strat_function
         self = strat(self)
 
+    def record_fills(
+        self, fills: SignalFills, index: pd.DatetimeIndex, ticker, path: int = 0
+    ):
+        """Replace the ledger with one path of a vectorized signal simulation."""
+
+        data = {
+            "bank_account": fills.bank_account[path],
+            "money_invested": fills.money_invested,
+        }
+        if ticker is not None:
+            data[ticker] = fills.positions[path]
+        self._ledger = TradingLedger.from_columns(
+            self._ledger.columns, index, data, self._ledger.capacity
+        )
+        self.total_fees = float(fills.total_fees[path])
+        self.total_slippage_cost = float(fills.total_slippage_cost[path])
+
+    def record_rebalance(
+        self, fills: RebalanceFills, index: pd.DatetimeIndex, path: int = 0
+    ):
+        """Replace the ledger with one path of a target-weight rebalance."""
+
+        data = {
+            "bank_account": fills.bank_account[path],
+            "money_invested": fills.money_invested,
+        }
+        for position, ticker in enumerate(fills.tickers):
+            data[ticker] = fills.positions[path, :, position]
+        self._ledger = TradingLedger.from_columns(
+            self._ledger.columns, index, data, self._ledger.capacity
+        )
+        self.total_fees = float(fills.total_fees[path])
+        self.total_slippage_cost = float(fills.total_slippage_cost[path])
+
     def _get_effective_price(
         self, ticker: str, column: str, index: int
     ) -> float | None:
-        prices = self.stock_df_to_today[ticker][column]
-        if index >= len(prices):
-            return None
-
-        valid_history = prices.iloc[: index + 1].dropna()
-        if valid_history.empty:
-            return None
-        return float(valid_history.iloc[-1])
+        return self.market.price(ticker, column, index)
 
     def _price_with_slippage(self, base_price: float, is_buy: bool) -> float:
         if is_buy:
@@ -74,35 +158,67 @@ class TradingHistory:
         return base_price * (1 - self.slippage_pct)
 
     def current_portfolio_value(self, index):
-        stock_value = 0
-        for ticker in self.stock_df_to_today.columns.levels[0]:
+        ledger = self._ledger
+        stock_value = 0.0
+        for ticker in self.price_matrix.tickers:
             valid_stock_price = self._get_effective_price(ticker, "Close", index)
             if valid_stock_price is None:
                 continue
-            stock_value += (
-                valid_stock_price
-                * self.trading_history_df.at[
-                    self.trading_history_df.index[index], ticker
-                ]
-            )
-        return (
-            self.trading_history_df.at[
-                self.trading_history_df.index[index], "bank_account"
-            ]
-            + stock_value
-        )
+            stock_value += valid_stock_price * ledger.get(ticker, index)
+        return ledger.get("bank_account", index) + stock_value
 
     def current_protfolio_value(self, index):
         return self.current_portfolio_value(index)
 
+    def _cache_key(self) -> tuple[int, ...]:
+        ledger = self._ledger
+        return (id(ledger), ledger.revision, id(self.market), self.market.cursor)
+
+    def equity_curve(self) -> pd.Series:
+        """Return the cached daily portfolio value as a date-indexed Series.
+
+        The curve is computed in one pass as forward-filled closes times
+        positions plus cash, and is recomputed only after the ledger or the
+        price history changes.
+        """
+
+        ledger = self._ledger
+        cache_key = self._cache_key()
+        if self._equity_cache is not None and self._equity_cache[0] == cache_key:
+            return self._equity_cache[1]
+
+        rows = len(ledger)
+        stock_value = np.zeros(rows)
+        prices = self.price_matrix
+        if rows and prices.tickers:
+            closes = np.full((rows, len(prices.tickers)), np.nan)
+            market_rows = min(rows, self.market.rows)
+            closes[:market_rows] = prices.field_values("Close", market_rows)
+            for position, ticker in enumerate(prices.tickers):
+                contribution = closes[:, position] * ledger.column(ticker)
+                stock_value += np.where(
+                    np.isnan(closes[:, position]), 0.0, contribution
+                )
+        values = ledger.column("bank_account") + stock_value if rows else stock_value
+        curve = pd.Series(values, index=ledger.index, dtype=float)
+        self._equity_cache = (cache_key, curve)
+        return curve
+
     def portfolio_value_history(self):
-        # Can vectorize?
-        # Should return a Series object with timestamps.
-        # apply function?
-        value_history = []
-        for i in range(0, len(self.trading_history_df.index)):
-            value_history.append(self.current_portfolio_value(i))
-        return value_history
+        return self.equity_curve().tolist()
+
+    def return_analytics(self) -> ReturnAnalytics:
+        """Return statistics for the equity curve, cached alongside it."""
+
+        cache_key = self._cache_key()
+        if self._analytics_cache is None or self._analytics_cache[0] != cache_key:
+            start = self.start_row
+            analytics = compute_return_analytics(
+                self.equity_curve().iloc[start:],
+                self._ledger.column("money_invested")[start:],
+            )
+            self._analytics_cache = (cache_key, analytics)
+        return self._analytics_cache[1]
 
     #### BUY SELL HELP ####
     # def buy_one_share(self):
@@ -111,10 +227,9 @@ class TradingHistory:
     #         self.bank_account_history[-1] -= self.price_history[-1]
 
     def buy_all_shares(self, ticker_name, whentobuy="Close"):
-        latest_index = len(self.trading_history_df.index) - 1
-        bank_account = self.trading_history_df.at[
-            self.trading_history_df.index[-1], "bank_account"
-        ]
+        ledger = self._ledger
+        latest_index = len(ledger) - 1
+        bank_account = ledger.get("bank_account")
         base_price = self._get_effective_price(ticker_name, whentobuy, latest_index)
         if base_price is None or bank_account <= 0:
             return
@@ -129,17 +244,10 @@ class TradingHistory:
         transaction_cost = trade_value * self.transaction_cost_rate
         slippage_cost = shares_to_buy * (stock_price - base_price)
         updated_bank = bank_account - trade_value - transaction_cost
-        updated_position = (
-            self.trading_history_df.at[self.trading_history_df.index[-1], ticker_name]
-            + shares_to_buy
-        )
+        updated_position = ledger.get(ticker_name) + shares_to_buy
 
-        self.trading_history_df.at[
-            self.trading_history_df.index[-1], "bank_account"
-        ] = max(0.0, updated_bank)
-        self.trading_history_df.at[self.trading_history_df.index[-1], ticker_name] = (
-            updated_position
-        )
+        ledger.set("bank_account", max(0.0, updated_bank))
+        ledger.set(ticker_name, updated_position)
         self.total_fees += transaction_cost
         self.total_slippage_cost += max(0.0, slippage_cost)
 
@@ -149,10 +257,9 @@ class TradingHistory:
     #         self.bank_account_history[-1] += self.price_history[-1]
 
     def sell_all_shares(self, ticker_name, whentobuy="Close"):
-        latest_index = len(self.trading_history_df.index) - 1
-        shares_to_sell = self.trading_history_df.at[
-            self.trading_history_df.index[-1], ticker_name
-        ]
+        ledger = self._ledger
+        latest_index = len(ledger) - 1
+        shares_to_sell = ledger.get(ticker_name)
         if shares_to_sell <= 0:
             return
 
@@ -164,126 +271,44 @@ class TradingHistory:
         trade_value = shares_to_sell * stock_price
         transaction_cost = trade_value * self.transaction_cost_rate
         slippage_cost = shares_to_sell * (base_price - stock_price)
-        updated_bank = (
-            self.trading_history_df.at[
-                self.trading_history_df.index[-1], "bank_account"
-            ]
-            + trade_value
-            - transaction_cost
-        )
+        updated_bank = ledger.get("bank_account") + trade_value - transaction_cost
 
-        self.trading_history_df.at[
-            self.trading_history_df.index[-1], "bank_account"
-        ] = max(0.0, updated_bank)
-        self.trading_history_df.at[self.trading_history_df.index[-1], ticker_name] = 0
+        ledger.set("bank_account", max(0.0, updated_bank))
+        ledger.set(ticker_name, 0)
         self.total_fees += transaction_cost
         self.total_slippage_cost += max(0.0, slippage_cost)
 
     def time_weighted_return(self, annualize: bool = True):
-        holding_period_return = 1
-        port_val_hist = self.portfolio_value_history()
-        money_added = self.trading_history_df["money_invested"].fillna(0)
-        for i in range(1, len(self.trading_history_df.index)):
-            todays_change = (
-                port_val_hist[i] / (port_val_hist[i - 1] + money_added.iloc[i]) - 1
-            )
-            holding_period_return *= 1 + todays_change
-
-        time_delta = (
-            self.trading_history_df.index[-1] - self.trading_history_df.index[0]
-        )
-        time_weighted_return = holding_period_return - 1
-        if not annualize or time_delta.days <= 0:
-            return time_weighted_return
-
-        num_years = time_delta.days / 365
-        return (1 + time_weighted_return) ** (1 / num_years) - 1
+        analytics = self.return_analytics()
+        if not annualize:
+            return analytics.time_weighted_return
+        return analytics.annualized(analytics.time_weighted_return)
 
     def money_weighted_return(self, annualize: bool = True):
-        port_val_hist = self.portfolio_value_history()
-        money_added = self.trading_history_df["money_invested"].fillna(0)
-
-        cash_flows = [-float(money) for money in money_added]
-        cash_flows.append(port_val_hist[-1])
-
-        irr = self._internal_irr(cash_flows)
-        if irr is None or not np.isfinite(irr):
-            return 0
-
-        time_delta = (
-            self.trading_history_df.index[-1] - self.trading_history_df.index[0]
-        )
-        if not annualize or time_delta.days <= 0:
-            return irr
-
-        num_years = time_delta.days / 365
-        return (1 + irr) ** (1 / num_years) - 1
-
-    def _internal_irr(self, cash_flows: list[float], *, guess: float = 0.1) -> float:
-        rate = guess
-        for _ in range(100):
-            if not np.isfinite(rate):
-                break
-            if rate <= -0.999999:
-                rate = -0.999999
-
-            base = 1 + rate
-            npv = 0.0
-            derivative = 0.0
-            for i, cf in enumerate(cash_flows):
-                exponent = float(i)
-                try:
-                    with np.errstate(over="raise", invalid="raise", divide="raise"):
-                        discount = base**exponent
-                        derivative_discount = base ** (exponent + 1.0)
-                except (OverflowError, FloatingPointError):
-                    npv = np.nan
-                    derivative = np.nan
-                    break
-                if not np.isfinite(discount) or not np.isfinite(derivative_discount):
-                    npv = np.nan
-                    derivative = np.nan
-                    break
-                npv += cf / discount
-                derivative += -i * cf / derivative_discount
-            if abs(derivative) < 1e-12:
-                break
-
-            new_rate = rate - npv / derivative
-            if not np.isfinite(new_rate):
-                break
-            if abs(new_rate - rate) < 1e-6:
-                return new_rate
-            rate = new_rate
-
-        return rate
+        analytics = self.return_analytics()
+        if not annualize:
+            return analytics.money_weighted_return
+        return analytics.annualized(analytics.money_weighted_return)
 
     def drawdown_series(self):
-        portfolio_values = pd.Series(
-            self.portfolio_value_history(), index=self.trading_history_df.index
-        )
-        if portfolio_values.empty:
-            return pd.Series(dtype=float)
-        running_max = portfolio_values.cummax()
-        return portfolio_values / running_max - 1
+        return self.return_analytics().drawdown
 
     #### DISPLAY HELP ####
     def printer(self):
         print("\nStrat: " + self.name + ":")
-        last_idx = self.trading_history_df.index[-1]
-        for ticker in self.stock_df_to_today.columns.levels[0]:
-            shares = self.trading_history_df.at[last_idx, ticker]
+        ledger = self._ledger
+        for ticker in self.price_matrix.tickers:
+            shares = ledger.get(ticker)
             if shares != 0:
                 print("Shares of " + ticker + " Owned in the end: " + str(shares))
-        print(
-            "Bank Account left over: "
-            + "%.2f" % self.trading_history_df.at[last_idx, "bank_account"]
-        )
+        print("Bank Account left over: " + "%.2f" % ledger.get("bank_account"))
         # protfolio_value = self.shares_history[-1]*self.price_history[-1] + self.bank_account_history[-1]
-        port_val_hist = self.portfolio_value_history()
-        print("Total Value: " + "%.2f" % port_val_hist[-1])
+        port_val_hist = self.equity_curve()
+        print("Total Value: " + "%.2f" % port_val_hist.iloc[-1])
 
-        percentage_increase = percentage_difference(port_val_hist[0], port_val_hist[-1])
+        percentage_increase = percentage_difference(
+            port_val_hist.iloc[0], port_val_hist.iloc[-1]
+        )
         print("Total Percentage Increase: " + "%.2f" % percentage_increase + "%")
         twr = self.time_weighted_return()
         mwr = self.money_weighted_return()
@@ -294,8 +319,63 @@ class TradingHistory:
             print("Max Drawdown: " + "%.2f" % (drawdown.min() * 100) + "%")
 
     def add_port_value_to_plt(self):
-        portfolio_value_history = self.portfolio_value_history()
-        plt.plot(
-            self.trading_history_df.index, portfolio_value_history, label=self.name
+        portfolio_values = self.equity_curve()
+        plt.plot(portfolio_values.index, portfolio_values.to_numpy(), label=self.name)
+        plt.legend()
+
+
+class EquityHistory:
+    """Compact stand-in for a finished :class:`TradingHistory`.
+
+    Keeps the run's name, its cost totals and a float32 equity curve over an
+    index shared with the other runs, which is enough to print a summary and
+    plot the portfolio without the per-ticker daily ledger.
+    """
+
+    __slots__ = ("name", "index", "values", "total_fees", "total_slippage_cost")
+
+    def __init__(
+        self,
+        name: str,
+        index: pd.DatetimeIndex,
+        values: np.ndarray,
+        total_fees: float = 0.0,
+        total_slippage_cost: float = 0.0,
+    ):
+        self.name = name
+        self.index = index
+        self.values = np.asarray(values, dtype=np.float32)
+        self.total_fees = total_fees
+        self.total_slippage_cost = total_slippage_cost
+
+    @classmethod
+    def from_history(
+        cls, history: TradingHistory, index: pd.DatetimeIndex | None = None
+    ) -> "EquityHistory":
+        curve = history.equity_curve()
+        if index is None or len(index) != len(curve):
+            index = curve.index
+        return cls(
+            history.name,
+            index,
+            curve.to_numpy(),
+            history.total_fees,
+            history.total_slippage_cost,
+        )
+
+    def equity_curve(self) -> pd.Series:
+        return pd.Series(self.values, index=self.index, dtype=float)
+
+    def printer(self):
+        print("\nStrat: " + self.name + ":")
+        port_val_hist = self.equity_curve()
+        print("Total Value: " + "%.2f" % port_val_hist.iloc[-1])
+        percentage_increase = percentage_difference(
+            port_val_hist.iloc[0], port_val_hist.iloc[-1]
         )
+        print("Total Percentage Increase: " + "%.2f" % percentage_increase + "%")
+
+    def add_port_value_to_plt(self):
+        portfolio_values = self.equity_curve()
+        plt.plot(portfolio_values.index, portfolio_values.to_numpy(), label=self.name)
         plt.legend()
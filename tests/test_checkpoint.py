@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_stocks.engine.checkpoint import SimulationCheckpoint
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.stock_data import StockData
+from python_stocks.strategy_registry import Strategy
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _stock_data():
+    dates = pd.bdate_range("2020-01-01", periods=60)
+    closes = 30 + np.cumsum(np.random.default_rng(5).normal(0.05, 1, len(dates)))
+    frame = pd.DataFrame({"Open": closes - 0.3, "Close": closes}, index=dates)
+    stock_data = StockData(["AAA"], loader={"AAA": frame}.__getitem__)
+    stock_data.add_external_investments(50, 0)
+    return stock_data
+
+
+def _engine(crash_after=None, calls=None, rows=None, vectorized=False):
+    def coin_flip(context):
+        if calls is not None:
+            calls.append(len(context.history.ledger))
+        if crash_after is not None and len(context.history.ledger) > crash_after:
+            raise _Interrupted
+        if context.rng.random() < 0.5:
+            context.history.buy_all_shares("AAA")
+        else:
+            context.history.sell_all_shares("AAA")
+        return context.history
+
+    registry = build_default_registry(["AAA"])
+    registry.register(Strategy(name="coin_flip", apply=coin_flip, parameters={}))
+    stock_data = _stock_data()
+    if rows is not None:
+        stock_data = stock_data.window(0, rows)
+    return SimulationEngine(
+        stock_data,
+        registry=registry,
+        transaction_cost_rate=0.001,
+        vectorized=vectorized,
+        reporting="silent",
+    )
+
+
+def _assert_same_output(resumed, expected):
+    pd.testing.assert_frame_equal(resumed.report_df, expected.report_df)
+    for got, want in zip(resumed.histories, expected.histories):
+        pd.testing.assert_frame_equal(got.trading_history_df, want.trading_history_df)
+        assert got.total_fees == want.total_fees
+
+
+def test_interrupted_run_resumes_to_identical_output(tmp_path):
+    expected = _engine().run_once(1000, seed=7)
+    checkpoint = SimulationCheckpoint(tmp_path, every=10)
+
+    with pytest.raises(_Interrupted):
+        _engine(crash_after=45).run_once(1000, seed=7, checkpoint=checkpoint)
+    assert checkpoint.path.exists()
+
+    calls: list[int] = []
+    resumed = _engine(calls=calls).run_once(1000, seed=7, checkpoint=checkpoint)
+    _assert_same_output(resumed, expected)
+    assert min(calls) >= 40
+
+    # The finished run is saved too, so a second resume skips the day loop.
+    again = _engine(crash_after=0).run_once(1000, seed=7, checkpoint=checkpoint)
+    _assert_same_output(again, expected)
+
+
+def test_checkpoints_only_resume_matching_runs(tmp_path):
+    checkpoint = SimulationCheckpoint(tmp_path, every=10)
+    _engine().run_once(1000, seed=7, checkpoint=checkpoint)
+
+    with pytest.raises(_Interrupted):
+        _engine(crash_after=0).run_once(1000, seed=8, checkpoint=checkpoint)
+
+    fresh = SimulationCheckpoint(tmp_path, every=10, resume=False)
+    with pytest.raises(_Interrupted):
+        _engine(crash_after=0).run_once(1000, seed=7, checkpoint=fresh)
+
+
+def test_batch_checkpoints_each_seed_separately(tmp_path):
+    checkpoint = SimulationCheckpoint(tmp_path, every=20)
+    expected = _engine().run_batch(1000, seeds=[1, 2])
+
+    first = _engine().run_batch(1000, seeds=[1, 2], checkpoint=checkpoint)
+    resumed = _engine(crash_after=0).run_batch(
+        1000, seeds=[1, 2], checkpoint=checkpoint
+    )
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["seed-1", "seed-2"]
+    for got, again, want in zip(first, resumed, expected):
+        _assert_same_output(got, want)
+        _assert_same_output(again, want)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_incremental_checkpoint_steps_only_appended_days(tmp_path, vectorized):
+    expected = _engine(vectorized=vectorized).run_once(1000, seed=7)
+    checkpoint = SimulationCheckpoint(tmp_path, every=10, incremental=True)
+    _engine(rows=45, vectorized=vectorized).run_once(
+        1000, seed=7, checkpoint=checkpoint
+    )
+
+    calls: list[int] = []
+    extended = _engine(calls=calls, vectorized=vectorized).run_once(
+        1000, seed=7, checkpoint=checkpoint
+    )
+
+    _assert_same_output(extended, expected)
+    assert min(calls) >= 44
+
+    # Without the incremental flag a shorter snapshot is not extended.
+    _engine(rows=45).run_once(1000, seed=7, checkpoint=checkpoint)
+    with pytest.raises(_Interrupted):
+        _engine(crash_after=0).run_once(
+            1000, seed=7, checkpoint=SimulationCheckpoint(tmp_path)
+        )
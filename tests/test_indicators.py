@@ -0,0 +1,154 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.indicators import (
+    IndicatorCacheStats,
+    IndicatorSet,
+    IndicatorSpec,
+    MovingAverage,
+    NoDelayMovingAverage,
+)
+from python_stocks.market_view import MarketView
+from python_stocks.math_helper import (
+    moving_average_filter,
+    no_delay_moving_average_filter,
+)
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.stock_data import StockData
+from python_stocks.trading_history import TradingHistory
+
+
+def test_streaming_filters_match_full_history_filters():
+    prices = np.random.default_rng(0).normal(100, 5, 60).tolist()
+    for window in (1, 2, 5, 10, 21):
+        no_delay = NoDelayMovingAverage(window)
+        causal = MovingAverage(window)
+        for day, price in enumerate(prices):
+            no_delay.update(price)
+            causal.update(price)
+            history = prices[: day + 1]
+            assert no_delay.value == no_delay_moving_average_filter(
+                history[-window:], window
+            )
+            assert causal.value == moving_average_filter(history, window)
+            if day:
+                yesterday = no_delay_moving_average_filter(
+                    history[:-1][-window:], window
+                )
+                assert no_delay.slope == no_delay.value - yesterday
+
+
+def test_running_sum_filters_stay_within_rounding_of_the_exact_ones():
+    prices = np.random.default_rng(1).normal(100, 5, 5000)
+    for kind in (MovingAverage, NoDelayMovingAverage):
+        for window in (1, 2, 5, 21, 200):
+            exact, running = kind(window), kind(window, exact=False)
+            for day, price in enumerate(prices):
+                exact.update(float(price))
+                running.update(float(price))
+                assert running.value == pytest.approx(exact.value, rel=1e-12)
+                if day == 2500:
+                    # A checkpointed running sum resumes where it left off.
+                    resumed = kind(window, exact=False)
+                    resumed.load_state(json.loads(json.dumps(running.state())))
+                    running = resumed
+            assert running.count == exact.count
+            values = kind.kernel(prices, window, exact=False)
+            assert running.value == pytest.approx(values[-1], rel=1e-12)
+
+
+def test_indicator_set_skips_missing_bars():
+    closes = [10.0, np.nan, 11.0, 12.0]
+    frame = pd.concat(
+        [pd.DataFrame({"Close": closes}, index=pd.date_range("2021-01-01", periods=4))],
+        axis=1,
+        keys=["AAA"],
+    )
+    market = MarketView.from_frame(frame)
+    spec = IndicatorSpec("AAA", 4, kind="ma")
+    indicators = IndicatorSet([spec, spec])
+
+    for cursor in range(4):
+        indicators.update(market.seek(cursor))
+
+    indicator = indicators.get(spec)
+    assert indicator is not None
+    assert indicator.count == 3
+    assert indicator.value == moving_average_filter([10.0, 11.0, 12.0], 4)
+
+
+def test_engine_indicators_match_recomputed_moving_average_filter(monkeypatch):
+    monkeypatch.setattr(TradingHistory, "printer", lambda self: None)
+    dates = pd.date_range("2020-01-01", periods=80, freq="D")
+    closes = 50 + np.cumsum(np.random.default_rng(3).normal(0.3, 1, len(dates)))
+    frames = {"AAA": pd.DataFrame({"Open": closes, "Close": closes}, index=dates)}
+    stock_data = StockData(["AAA"], loader=frames.__getitem__)
+
+    streaming = build_default_registry(stock_data.tickers())
+    recomputed = build_default_registry(stock_data.tickers())
+    maf = recomputed.get("moving_average_filter")
+    recomputed.register(
+        maf.__class__(
+            name=maf.name,
+            apply=maf.apply,
+            required_fields=maf.required_fields,
+            parameters=maf.parameters,
+            description=maf.description,
+        )
+    )
+    overrides = {"moving_average_filter": {"short_window": [4, 7], "long_window": [20]}}
+
+    outputs = [
+        SimulationEngine(stock_data, registry=registry).run_once(
+            1000,
+            enabled_strategies=["moving_average_filter"],
+            parameter_overrides=overrides,
+        )
+        for registry in (streaming, recomputed)
+    ]
+
+    assert outputs[0].report_df.equals(outputs[1].report_df)
+    for first, second in zip(outputs[0].histories, outputs[1].histories):
+        assert isinstance(first, TradingHistory) and isinstance(second, TradingHistory)
+        assert first.trading_history_df.equals(second.trading_history_df)
+
+
+def _drifting_stock_data():
+    dates = pd.date_range("2020-01-01", periods=80, freq="D")
+    closes = 50 + np.cumsum(np.random.default_rng(3).normal(0.3, 1, len(dates)))
+    closes[[10, 11, 40]] = np.nan
+    frames = {"AAA": pd.DataFrame({"Open": closes, "Close": closes}, index=dates)}
+    return StockData(["AAA"], loader=frames.__getitem__)
+
+
+def test_sweep_shares_indicators_through_the_cache(monkeypatch):
+    monkeypatch.setattr(TradingHistory, "printer", lambda self: None)
+    stock_data = _drifting_stock_data()
+    overrides = {
+        "moving_average_filter": {"short_window": [4, 7], "long_window": [20, 30]}
+    }
+
+    outputs = [
+        SimulationEngine(
+            stock_data,
+            registry=build_default_registry(stock_data.tickers()),
+            vectorized=vectorized,
+        ).run_once(
+            1000,
+            enabled_strategies=["moving_average_filter"],
+            parameter_overrides=overrides,
+        )
+        for vectorized in (True, False)
+    ]
+
+    # Four runs read two specs each, over four distinct windows.
+    for output in outputs:
+        assert output.indicator_stats == IndicatorCacheStats(hits=4, misses=4)
+    assert outputs[0].report_df.equals(outputs[1].report_df)
+    for first, second in zip(outputs[0].histories, outputs[1].histories):
+        assert isinstance(first, TradingHistory) and isinstance(second, TradingHistory)
+        assert first.trading_history_df.equals(second.trading_history_df)
@@ -1,11 +1,17 @@
+import threading
+import time
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from python_stocks.market_data import (
     DailyPriceStore,
+    RateLimiter,
     evaluate_data_quality,
     ingest_curated_daily_data,
+    migrate_price_store,
 )
 
 
@@ -100,3 +106,178 @@ def test_quality_flags_malformed_records():
     assert report.malformed_records
     assert any("High lower than Low" in item for item in report.malformed_records)
     assert any("negative volume" in item for item in report.malformed_records)
+
+
+def test_migrated_store_memory_maps_the_same_frames(tmp_path):
+    DailyPriceStore(root=tmp_path).save(
+        "SPY", _frame_with_business_days("2025-01-06", 8)
+    )
+    expected = DailyPriceStore(root=tmp_path).load("SPY")
+
+    written = migrate_price_store(tmp_path, remove_source=True)
+
+    assert written == [tmp_path / "SPY"]
+    assert not (tmp_path / "SPY.csv").exists()
+    store = DailyPriceStore(root=tmp_path)
+    assert store.format == "npy"
+    loaded = store.load("SPY")
+    pd.testing.assert_frame_equal(loaded.copy(), expected, check_index_type=False)
+    assert isinstance(loaded._mgr.blocks[0].values, np.memmap)
+
+
+def test_npy_store_ingests_and_converts_back(tmp_path):
+    provider = _FakeProvider(_frame_with_business_days("2025-01-06", 5))
+    store = DailyPriceStore(root=tmp_path, format="npy")
+
+    results = ingest_curated_daily_data(
+        tickers=["SPY"], provider=provider, store=store, stale_after_business_days=10000
+    )
+
+    assert results[0].data_path == tmp_path / "SPY"
+    assert len(store.load("SPY")) == 5
+    assert migrate_price_store(tmp_path, to="csv") == [tmp_path / "SPY.csv"]
+    assert DailyPriceStore(root=tmp_path).format == "csv"
+
+
+@pytest.mark.parametrize("store_format", ["csv", "npy"])
+def test_daily_ingest_appends_without_loading_history(
+    tmp_path, monkeypatch, store_format
+):
+    full = _frame_with_business_days("2025-01-06", 8)
+    store = DailyPriceStore(root=tmp_path, format=store_format)
+    ingest_curated_daily_data(
+        tickers=["SPY"],
+        provider=_FakeProvider(full.head(5)),
+        store=store,
+        stale_after_business_days=10000,
+    )
+
+    def no_full_load(ticker):
+        raise AssertionError("append path loaded the full history")
+
+    monkeypatch.setattr(store, "load", no_full_load)
+    monkeypatch.setattr(store, "save", no_full_load)
+    results = ingest_curated_daily_data(
+        tickers=["SPY"],
+        provider=_FakeProvider(full),
+        store=store,
+        stale_after_business_days=10000,
+    )
+    monkeypatch.undo()
+
+    assert results[0].status == "ok"
+    assert (results[0].updated_rows, results[0].total_rows) == (3, 8)
+    assert results[0].quality_scope == "increment"
+    index = store.index("SPY", verify=True)
+    assert index is not None
+    assert index.rows == 8
+    assert index.max_date == pd.Timestamp("2025-01-15")
+    rewritten = DailyPriceStore(root=tmp_path / "rewritten", format=store_format)
+    rewritten.save("SPY", full)
+    appended = store.load("SPY")
+    pd.testing.assert_frame_equal(
+        appended.copy(), rewritten.load("SPY")[appended.columns].copy()
+    )
+    if store_format == "npy":
+        for column in (tmp_path / "SPY").iterdir():
+            assert (
+                column.read_bytes()
+                == (tmp_path / "rewritten" / "SPY" / column.name).read_bytes()
+            )
+
+
+@pytest.mark.parametrize("store_format", ["csv", "npy"])
+def test_interrupted_append_is_rolled_back(tmp_path, monkeypatch, store_format):
+    full = _frame_with_business_days("2025-01-06", 8)
+    store = DailyPriceStore(root=tmp_path, format=store_format)
+    store.save("SPY", full.head(5))
+    committed = store.index("SPY", verify=True)
+
+    def crash(ticker, index):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(store, "_write_index", crash)
+    with pytest.raises(KeyboardInterrupt):
+        store.append("SPY", full.tail(3))
+    monkeypatch.undo()
+
+    reopened = DailyPriceStore(root=tmp_path, format=store_format)
+    assert reopened.index("SPY", verify=True) == committed
+    assert len(reopened.load("SPY")) == 5
+    reopened.append("SPY", full.tail(3))
+    assert len(reopened.load("SPY")) == 8
+
+
+def test_overlapping_rows_rewrite_the_history(tmp_path):
+    store = DailyPriceStore(root=tmp_path)
+    store.save("SPY", _frame_with_business_days("2025-01-06", 5))
+    corrected = _frame_with_business_days("2025-01-06", 6)
+    corrected.loc[1, "Close"] = 100.75
+
+    class _IgnoresStart(_FakeProvider):
+        def fetch_daily_ohlcv(self, symbol, *, start=None, end=None):
+            return self.frame.copy()
+
+    results = ingest_curated_daily_data(
+        tickers=["SPY"],
+        provider=_IgnoresStart(corrected),
+        store=store,
+        stale_after_business_days=10000,
+    )
+
+    assert results[0].total_rows == 6
+    assert results[0].quality_scope == "history"
+    assert store.load("SPY")["Close"].iloc[1] == 100.75
+    index = store.index("SPY", verify=True)
+    assert index is not None and index.rows == 6
+
+
+class _SlowProvider(_FakeProvider):
+    def __init__(self, frame, delay):
+        super().__init__(frame)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_daily_ohlcv(self, symbol, *, start=None, end=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return super().fetch_daily_ohlcv(symbol, start=start, end=end)
+
+
+def test_concurrent_ingest_overlaps_requests_and_keeps_order(tmp_path):
+    tickers = [f"T{number}" for number in range(8)]
+    provider = _SlowProvider(_frame_with_business_days("2025-01-06", 5), 0.2)
+
+    started = time.perf_counter()
+    results = ingest_curated_daily_data(
+        tickers=tickers,
+        provider=provider,
+        store=DailyPriceStore(root=tmp_path),
+        stale_after_business_days=10000,
+        workers=4,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert [result.ticker for result in results] == tickers
+    assert all(result.status == "ok" for result in results)
+    assert provider.peak == 4
+    assert elapsed < 8 * 0.2 / 2
+
+
+def test_rate_limiter_spaces_calls():
+    now = [0.0]
+    waits: list[float] = []
+    limiter = RateLimiter(4, clock=lambda: now[0], sleep=waits.append)
+
+    for _ in range(3):
+        limiter.acquire()
+    now[0] = 10.0
+    limiter.acquire()
+
+    assert waits == [0.25, 0.5]
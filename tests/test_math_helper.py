@@ -1,14 +1,23 @@
 import unittest
 
+import numpy as np
+import pandas as pd
+
 from python_stocks.math_helper import (
     curvature,
+    curvature_kernel,
     curvature_vectorized,
+    internal_rate_of_return,
+    moving_average_kernel,
     moving_average_filter,
     moving_average_filter_vectorized,
     no_delay_moving_average_filter,
     no_delay_moving_average_filter_vectorized,
+    no_delay_moving_average_kernel,
+    no_delay_moving_average_on_that_day_kernel,
     percentage_difference,
     slope,
+    slope_kernel,
     slope_vectorized,
 )
 
@@ -149,6 +158,83 @@ class TestMathHelper(unittest.TestCase):
         self.assertEqual([0, 0, -1], curvature_vectorized([0, 1, 1]))
         self.assertEqual([0, 0, -2, 2], curvature_vectorized([1, 2, 1, 2]))
 
+    def test_slope_and_curvature_accept_arrays_and_series(self):
+        values = np.array([1.0, 2.0, 4.0, 7.0, 11.0])
+        np.testing.assert_array_equal(
+            slope_vectorized(values, 3), [0.0, 1.0, 3.0, 5.0, 7.0]
+        )
+        np.testing.assert_array_equal(
+            curvature_vectorized(values), [0.0, 0.0, 1.0, 1.0, 1.0]
+        )
+
+        series = pd.Series(values, index=pd.date_range("2021-01-01", periods=5))
+        slopes = slope_vectorized(series, 2)
+        self.assertIsInstance(slopes, pd.Series)
+        self.assertTrue(slopes.index.equals(series.index))
+        self.assertEqual([0.0, 1.0, 2.0, 3.0, 4.0], slopes.tolist())
+        self.assertEqual(
+            curvature_vectorized(values.tolist()),
+            curvature_vectorized(series).tolist(),
+        )
+
+    def test_kernels_match_prefix_evaluation_exactly(self):
+        data = np.random.default_rng(1).normal(100, 10, 40).tolist()
+        prefixes = [data[: i + 1] for i in range(len(data))]
+        for n in (-1, 0, 1, 2, 3, 7, 40, 50):
+            self.assertEqual(
+                [moving_average_filter(prefix, n) for prefix in prefixes],
+                moving_average_kernel(data, n).tolist(),
+            )
+            self.assertEqual(
+                [no_delay_moving_average_filter(prefix, n) for prefix in prefixes],
+                no_delay_moving_average_on_that_day_kernel(data, n).tolist(),
+            )
+            self.assertEqual(
+                [slope(prefix, n) for prefix in prefixes],
+                slope_kernel(data, n).tolist(),
+            )
+        half = 5
+        once = [moving_average_filter(prefix, half) for prefix in prefixes]
+        twice = [
+            moving_average_filter(list(reversed(once))[: i + 1], half)
+            for i in range(len(once))
+        ]
+        self.assertEqual(
+            list(reversed(twice)),
+            no_delay_moving_average_kernel(data, 2 * half).tolist(),
+        )
+        self.assertEqual(
+            [curvature(prefix) for prefix in prefixes],
+            curvature_kernel(data).tolist(),
+        )
+
+    def test_cumulative_sum_kernels_stay_within_rounding(self):
+        data = np.random.default_rng(2).normal(100, 10, (3, 500))
+        for n in (1, 10, 100, 600):
+            np.testing.assert_allclose(
+                moving_average_kernel(data, n, exact=False),
+                moving_average_kernel(data, n),
+                rtol=1e-12,
+            )
+            np.testing.assert_allclose(
+                no_delay_moving_average_on_that_day_kernel(data, n, exact=False),
+                no_delay_moving_average_on_that_day_kernel(data, n),
+                rtol=1e-12,
+            )
+
+    def test_internal_rate_of_return(self):
+        self.assertAlmostEqual(0.1, internal_rate_of_return([-100, 110]))
+        self.assertAlmostEqual(0.1, internal_rate_of_return([-100, 0, 121]))
+        # Sparse flows only list the non-zero periods.
+        self.assertAlmostEqual(0.1, internal_rate_of_return([-100, 121], [0, 2]))
+        self.assertTrue(np.isnan(internal_rate_of_return([100, 100])))
+
+        # Long daily schedules where Newton from the default guess diverges.
+        daily = np.append(np.full(5000, -10.0), 60000.0)
+        rate = internal_rate_of_return(daily)
+        npv = np.dot(daily, (1 + rate) ** -np.arange(len(daily)))
+        self.assertLess(abs(npv), 1e-5 * np.abs(daily).sum())
+
 
 if __name__ == "__main__":
     unittest.main()
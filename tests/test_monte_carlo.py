@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_stocks.engine.monte_carlo import MonteCarloEngine
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.stock_data import StockData
+
+
+def _stock_data():
+    dates = pd.bdate_range("2020-01-01", periods=120)
+    closes = 40 + np.cumsum(np.random.default_rng(11).normal(0.1, 1, len(dates)))
+    frame = pd.DataFrame({"Open": closes - 0.2, "Close": closes}, index=dates)
+    stock_data = StockData(["AAA"], loader={"AAA": frame}.__getitem__)
+    stock_data.add_external_investments(100, 0)
+    return stock_data
+
+
+def test_single_block_path_replays_history():
+    stock_data = _stock_data()
+    engine = MonteCarloEngine(stock_data, block_size=10_000)
+
+    columns = engine.bootstrap.paths(np.random.SeedSequence(0).spawn(2))
+    history = stock_data.prices.raw[: engine.rows, 0, :]
+    for f, field in enumerate(stock_data.prices.fields):
+        np.testing.assert_allclose(columns[("AAA", field)][1], history[:, f])
+
+    output = engine.run(1000, paths=2, seed=0, enabled_strategies=["buy_and_hold"])
+    replay = SimulationEngine(
+        stock_data, registry=build_default_registry(["AAA"]), reporting="silent"
+    ).run_once(1000, enabled_strategies=["buy_and_hold"])
+    simulated = output.distribution_df.iloc[0]
+    for metric in ("cagr", "max_drawdown", "sharpe_ratio"):
+        assert simulated[metric] == pytest.approx(getattr(replay.results[0], metric))
+
+
+def test_paths_depend_only_on_seed_and_position():
+    engine = MonteCarloEngine(_stock_data(), block_size=5)
+
+    whole = engine.run(1000, paths=10, seed=42, chunk_size=10)
+    chunked = engine.run(1000, paths=10, seed=42, chunk_size=3)
+    other_seed = engine.run(1000, paths=10, seed=43)
+
+    pd.testing.assert_frame_equal(whole.distribution_df, chunked.distribution_df)
+    assert not whole.distribution_df.equals(other_seed.distribution_df)
+    assert set(whole.distribution_df["strategy"]) == {
+        "no_investment",
+        "buy_and_hold",
+        "open_close",
+        "moving_average_filter",
+    }
+
+    summary = whole.summary()
+    assert ("cagr", "p50") in summary.columns
+    assert len(summary) == whole.distribution_df["run"].nunique()
+
+
+def test_per_day_only_strategies_are_rejected():
+    engine = MonteCarloEngine(_stock_data())
+
+    with pytest.raises(ValueError, match="marcus_savings"):
+        engine.run(1000, paths=2, enabled_strategies=["marcus_savings"])
+
+
+def test_late_listed_ticker_starts_at_its_first_close():
+    dates = pd.bdate_range("2020-01-01", periods=60)
+    closes = 40 + np.cumsum(np.random.default_rng(3).normal(0.1, 1, len(dates)))
+    frames = {
+        "AAA": pd.DataFrame({"Close": closes}, index=dates),
+        "BBB": pd.DataFrame({"Close": closes[20:] * 2}, index=dates[20:]),
+    }
+    stock_data = StockData(["AAA", "BBB"], loader=frames.__getitem__)
+    engine = MonteCarloEngine(stock_data, block_size=5)
+
+    late = engine.bootstrap.paths(np.random.SeedSequence(1).spawn(3))[("BBB", "Close")]
+    listed = stock_data.data_frame.index.get_loc(dates[20])
+
+    assert np.isnan(late[:, :listed]).all()
+    assert (late[:, listed] == closes[20] * 2).all()
+    trading = np.isfinite(stock_data.prices.raw[: engine.rows, 0, 0])
+    assert np.isfinite(late[:, trading & (np.arange(engine.rows) >= listed)]).all()
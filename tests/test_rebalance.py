@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.rebalance import (
+    TargetWeights,
+    equal_weight_targets,
+    schedule_rows,
+    simulate_rebalance,
+)
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.signals import MarketArrays
+from python_stocks.stock_data import StockData
+from python_stocks.trading_history import TradingHistory
+
+
+def _stock_data(tickers, periods=90):
+    dates = pd.bdate_range("2022-01-03", periods=periods)
+    rng = np.random.default_rng(17)
+    frames = {}
+    for ticker in tickers:
+        closes = 50 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, len(dates))))
+        frames[ticker] = pd.DataFrame(
+            {"Open": closes * 0.999, "Close": closes}, index=dates
+        )
+    stock_data = StockData(list(tickers), loader=frames.__getitem__)
+    stock_data.add_external_investments(200, 0)
+    return stock_data
+
+
+def _arrays(stock_data):
+    rows = stock_data.total_days() - 1
+    return MarketArrays.from_price_matrix(stock_data.prices, rows)
+
+
+def test_monthly_schedule_picks_first_trading_day_of_each_month():
+    index = pd.date_range("2022-01-01", "2022-03-31", freq="D")
+    trading = np.asarray(index.dayofweek < 5)
+
+    rows = index[schedule_rows(index, trading, "monthly")]
+
+    assert list(rows.strftime("%Y-%m-%d")) == ["2022-01-03", "2022-02-01", "2022-03-01"]
+    weekly = schedule_rows(index, trading, "weekly")
+    assert list(index[weekly].dayofweek) == [0] * weekly.sum()
+
+
+def test_rebalance_tracks_equal_weights_and_charges_costs():
+    stock_data = _stock_data(["AAA", "BBB", "CCC"])
+    market = _arrays(stock_data)
+    deposits = stock_data.deposit_schedule()
+    targets = equal_weight_targets(market, {"schedule": "weekly"})
+
+    fills = simulate_rebalance(
+        targets,
+        market,
+        deposits,
+        10_000,
+        transaction_cost_rate=0.001,
+        slippage_pct=0.0005,
+    )
+
+    closes = np.stack([market.filled(t, "Close")[0] for t in targets.tickers], axis=1)
+    value = fills.positions[0] * closes
+    equity = value.sum(axis=1) + fills.bank_account[0]
+    trading = np.isfinite(market.raw("AAA", "Close")[0])
+    rebalanced = schedule_rows(market.index, trading, "weekly")
+    weights = value[rebalanced] / equity[rebalanced, np.newaxis]
+    # Within one share (and the cost band) of a third each after every rebalance.
+    assert np.abs(weights - 1 / 3).max() < 0.01
+    assert fills.total_fees[0] > 0
+    assert fills.total_slippage_cost[0] > 0
+    assert fills.rebalances[0] <= rebalanced.sum()
+
+
+def test_full_weight_never_sells_and_drift_trades_less_than_daily():
+    stock_data = _stock_data(["AAA"])
+    market = _arrays(stock_data)
+    deposits = stock_data.deposit_schedule()
+    weights = np.ones((market.rows, 1))
+
+    def run(schedule):
+        return simulate_rebalance(
+            TargetWeights(["AAA"], weights, schedule=schedule, drift=0.2),
+            market,
+            deposits,
+            10_000,
+            transaction_cost_rate=0.001,
+        )
+
+    daily, drift = run("daily"), run("drift")
+
+    assert (np.diff(daily.positions[0, :, 0]) >= 0).all()
+    assert 0 < drift.rebalances[0] < daily.rebalances[0]
+
+
+def test_engine_fills_equal_weight_across_many_tickers():
+    tickers = [f"T{number:02d}" for number in range(50)]
+    stock_data = _stock_data(tickers, periods=260)
+    engine = SimulationEngine(
+        stock_data,
+        registry=build_default_registry(tickers),
+        transaction_cost_rate=0.001,
+        vectorized=False,
+        reporting="silent",
+    )
+
+    output = engine.run_once(
+        100_000,
+        enabled_strategies=["equal_weight"],
+        parameter_overrides={"equal_weight": {"schedule": ["monthly", "drift"]}},
+    )
+
+    assert list(output.report_df["strategy"]) == ["equal_weight", "equal_weight"]
+    history = output.histories[0]
+    assert isinstance(history, TradingHistory)
+    ledger = history.trading_history_df
+    assert (ledger[tickers].iloc[-1] > 0).all()
+    assert output.results[0].total_fees > 0
+    assert output.results[0].trade_count > 0
+
+
+def test_equal_weight_runs_only_when_enabled_by_name():
+    registry = build_default_registry(["AAA", "BBB"])
+
+    default_runs = {strategy.name for strategy, _ in registry.expand_strategies()}
+    named_runs = registry.expand_strategies(["equal_weight"])
+
+    assert "equal_weight" not in default_runs
+    assert [strategy.name for strategy, _ in named_runs] == ["equal_weight"]
@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 
 from python_stocks.engine.simulator import _compute_metrics
+from python_stocks.return_analytics import compute_return_analytics
 from python_stocks.services import runtime_flags
 from python_stocks.services.data_service import DataService
 from python_stocks.trading_history import TradingHistory
@@ -35,6 +36,16 @@ class _StubHistory:
     def portfolio_value_history(self):
         return [1000.0, 1110.0, 1150.0]
 
+    def equity_curve(self):
+        return pd.Series(
+            self.portfolio_value_history(), index=self.trading_history_df.index
+        )
+
+    def return_analytics(self):
+        return compute_return_analytics(
+            self.equity_curve(), self.trading_history_df["money_invested"]
+        )
+
 
 def test_compute_metrics_tracks_trades_and_penalties():
     history = _StubHistory()
@@ -1,8 +1,14 @@
+from collections import Counter
+
+import numpy as np
 import pandas as pd
 
 from python_stocks.engine.simulator import SimulationEngine, render_summary_artifacts
+from python_stocks.plotting import plt
 from python_stocks.registry_factory import build_default_registry
 from python_stocks.stock_data import StockData
+from python_stocks.strategy_registry import Strategy, StrategyRegistry
+from python_stocks.trading_history import EquityHistory, TradingHistory
 
 
 class _InMemoryLoader:
@@ -13,6 +19,22 @@ class _InMemoryLoader:
         return self.frames[ticker]
 
 
+def _random_entry(context):
+    if context.rng.random() < 0.5:
+        context.history.buy_all_shares("AAA")
+    else:
+        context.history.sell_all_shares("AAA")
+    return context.history
+
+
+def _random_registry():
+    registry = StrategyRegistry()
+    registry.register(
+        Strategy(name="coin_flip", apply=_random_entry, parameters={"n": [1, 2]})
+    )
+    return registry
+
+
 def _build_stock_data():
     dates = pd.date_range("2020-01-01", periods=6, freq="D")
     base = pd.DataFrame(
@@ -57,3 +79,146 @@ def test_batch_runs_collect_multiple_seeds():
     assert len(outputs) == 2
     assert outputs[0].report_df.shape == outputs[1].report_df.shape
     assert outputs[0].results[0].strategy == outputs[1].results[0].strategy
+
+
+def test_parallel_run_matches_serial_order_and_results():
+    stock_data = _build_stock_data()
+    engine = SimulationEngine(
+        stock_data, registry=build_default_registry(stock_data.tickers())
+    )
+
+    serial = engine.run_once(1000, seed=7)
+    parallel = engine.run_once(1000, seed=7, workers=2)
+
+    assert serial.report_df.equals(parallel.report_df)
+    assert [h.name for h in serial.histories] == [h.name for h in parallel.histories]
+    for serial_history, parallel_history in zip(serial.histories, parallel.histories):
+        assert isinstance(serial_history, TradingHistory)
+        assert isinstance(parallel_history, TradingHistory)
+        assert (
+            serial_history.portfolio_value_history()
+            == parallel_history.portfolio_value_history()
+        )
+
+
+def test_parallel_batch_is_identical_to_serial_batch():
+    stock_data = _build_stock_data()
+    engine = SimulationEngine(stock_data, registry=_random_registry())
+
+    serial = engine.run_batch(1000, seeds=[3, 4, 5])
+    parallel = engine.run_batch(1000, seeds=[3, 4, 5], workers=2)
+    streamed = list(engine.iter_batch(1000, seeds=[3, 4, 5], workers=2))
+
+    assert [output.seed for output in parallel] == [3, 4, 5]
+    assert Counter(output.seed for output in streamed) == Counter([3, 4, 5])
+    for serial_output, parallel_output in zip(serial, parallel):
+        assert serial_output.report_df.equals(parallel_output.report_df)
+        for serial_history, parallel_history in zip(
+            serial_output.histories, parallel_output.histories
+        ):
+            assert isinstance(serial_history, TradingHistory)
+            assert isinstance(parallel_history, TradingHistory)
+            assert serial_history.trading_history_df.equals(
+                parallel_history.trading_history_df
+            )
+    first, second = serial[0].histories[0], serial[1].histories[0]
+    assert isinstance(first, TradingHistory) and isinstance(second, TradingHistory)
+    assert not first.trading_history_df.equals(second.trading_history_df)
+
+
+def test_selected_runs_keep_their_seed_streams_serial_and_parallel():
+    stock_data = _build_stock_data()
+    engine = SimulationEngine(stock_data, registry=_random_registry())
+
+    full = engine.run_once(1000, seed=9)
+    subset = engine.run_once(1000, seed=9, run_indices=[1])
+    parallel = engine.run_once(1000, seed=9, run_indices=[1, 0], workers=2)
+
+    assert subset.results == [full.results[1]]
+    assert parallel.results == [full.results[1], full.results[0]]
+    selected, original = subset.histories[0], full.histories[1]
+    assert isinstance(selected, TradingHistory)
+    assert isinstance(original, TradingHistory)
+    assert selected.trading_history_df.equals(original.trading_history_df)
+
+
+def test_compact_retention_keeps_results_and_drops_ledgers():
+    stock_data = _build_stock_data()
+    registry = build_default_registry(stock_data.tickers())
+    overrides = {"moving_average_filter": {"long_window": [2, 3, 4]}}
+
+    def run(retention, **kwargs):
+        engine = SimulationEngine(
+            stock_data, registry=registry, retention=retention, reporting="silent"
+        )
+        return engine.run_once(
+            1000, seed=5, parameter_overrides=overrides, chunk_size=2, **kwargs
+        )
+
+    full = run("full")
+    equity = run("equity")
+    metrics = run("metrics", workers=2)
+
+    assert equity.report_df.equals(full.report_df)
+    assert metrics.report_df.equals(full.report_df)
+    assert metrics.histories == []
+    assert [h.name for h in equity.histories] == [h.name for h in full.histories]
+    for compact, history in zip(equity.histories, full.histories):
+        assert isinstance(compact, EquityHistory)
+        assert compact.values.dtype == np.float32
+        pd.testing.assert_series_equal(
+            compact.equity_curve(), history.equity_curve(), rtol=1e-6
+        )
+    assert equity.histories[0].index is equity.histories[1].index
+
+
+def test_vectorized_signals_match_per_day_callbacks():
+    stock_data = _build_stock_data()
+    stock_data.add_external_investments(monthly_deposit=100, daily_deposit=5)
+    registry = build_default_registry(stock_data.tickers())
+    enabled = ["no_investment", "buy_and_hold", "open_close"]
+
+    def run(vectorized: bool):
+        return SimulationEngine(
+            stock_data,
+            registry=registry,
+            transaction_cost_rate=0.001,
+            slippage_pct=0.002,
+            vectorized=vectorized,
+        ).run_once(1000, enabled_strategies=enabled, seed=1)
+
+    stepped = run(vectorized=False)
+    vectorized = run(vectorized=True)
+
+    assert stepped.report_df.equals(vectorized.report_df)
+    for stepped_history, vectorized_history in zip(
+        stepped.histories, vectorized.histories
+    ):
+        assert stepped_history.trading_history_df.equals(
+            vectorized_history.trading_history_df
+        )
+        assert stepped_history.total_fees == vectorized_history.total_fees
+
+
+def test_silent_runs_defer_console_and_plot_output(capsys):
+    stock_data = _build_stock_data()
+    engine = SimulationEngine(
+        stock_data,
+        registry=build_default_registry(stock_data.tickers()),
+        reporting="silent",
+    )
+    figure = plt.figure()
+
+    output = engine.run_once(1000, seed=1)
+
+    assert capsys.readouterr().out == ""
+    assert not figure.axes
+
+    output.print_summaries()
+    printed = capsys.readouterr().out
+    assert all(history.name in printed for history in output.histories)
+
+    engine.run_once(1000, seed=1, reporting="summary")
+    assert capsys.readouterr().out == printed
+    assert not figure.axes
+    plt.close(figure)
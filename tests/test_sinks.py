@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.engine.sinks import CsvResultSink, NdjsonResultSink, open_sink
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.stock_data import StockData
+
+GRID = {"moving_average_filter": {"long_window": [5, 10, 20], "short_window": [2, 3]}}
+
+
+def _engine():
+    dates = pd.bdate_range("2021-01-01", periods=80)
+    closes = 20 + np.cumsum(np.random.default_rng(3).normal(0.05, 0.5, len(dates)))
+    frame = pd.DataFrame({"Open": closes - 0.1, "Close": closes}, index=dates)
+    stock_data = StockData(["AAA"], loader={"AAA": frame}.__getitem__)
+    stock_data.add_external_investments(100, 0)
+    return SimulationEngine(
+        stock_data, registry=build_default_registry(["AAA"]), reporting="silent"
+    )
+
+
+def _sweep(engine, **kwargs):
+    return engine.run_once(
+        1000,
+        enabled_strategies=["moving_average_filter"],
+        parameter_overrides=GRID,
+        seed=1,
+        **kwargs,
+    )
+
+
+def test_csv_sink_streams_results_in_chunks(tmp_path):
+    engine = _engine()
+    expected = _sweep(engine)
+
+    with CsvResultSink(tmp_path / "results.csv", equity_frequency="W") as sink:
+        streamed = _sweep(engine, sink=sink, chunk_size=4)
+
+    assert streamed.histories == []
+    pd.testing.assert_frame_equal(streamed.report_df, expected.report_df)
+
+    written = pd.read_csv(tmp_path / "results.csv")
+    assert list(written["run"]) == list(range(6))
+    np.testing.assert_allclose(written["cagr"], expected.report_df["cagr"])
+    assert json.loads(written["parameters"][0]) == expected.results[0].parameters
+
+    equity = pd.read_csv(tmp_path / "results_equity.csv", parse_dates=["date"])
+    weekly = expected.histories[2].equity_curve().resample("W").last().dropna()
+    np.testing.assert_allclose(equity[equity["run"] == 2]["equity"], weekly)
+
+
+def test_parallel_ndjson_sink_writes_every_run(tmp_path):
+    engine = _engine()
+    expected = _sweep(engine)
+
+    with NdjsonResultSink(tmp_path / "results.ndjson") as sink:
+        streamed = _sweep(engine, sink=sink, chunk_size=2, workers=2)
+
+    pd.testing.assert_frame_equal(streamed.report_df, expected.report_df)
+    lines = (tmp_path / "results.ndjson").read_text().splitlines()
+    records = sorted((json.loads(line) for line in lines), key=lambda r: r["run"])
+    assert [record["sharpe_ratio"] for record in records] == list(
+        expected.report_df["sharpe_ratio"]
+    )
+
+
+def test_open_sink_picks_the_format_from_the_suffix(tmp_path):
+    with open_sink(tmp_path / "out.jsonl") as sink:
+        assert isinstance(sink, NdjsonResultSink)
+    with pytest.raises(ValueError, match="Unsupported result sink"):
+        open_sink(tmp_path / "out.txt")
@@ -40,3 +40,49 @@ def test_limit_timeframe_trims_bounds(monkeypatch):
     assert list(stock_data.data_frame.index) == list(
         pd.date_range("2020-01-02", periods=2, freq="D")
     )
+
+
+def test_price_matrix_forward_fills_and_tracks_last_valid_row(monkeypatch):
+    stub_df = _make_stub_df().set_index("Date")
+    stub_df.loc[stub_df.index[2], "Close"] = float("nan")
+    monkeypatch.setattr(
+        stock_data_module, "load_into_stock_data_set", lambda _: stub_df
+    )
+
+    stock_data = StockData(["AAA"])
+    prices = stock_data.prices
+
+    assert prices.price("AAA", "Close", 2) == 2.0
+    assert prices.price("AAA", "Open", 2) == 3.0
+    assert list(prices.last_valid[:, 0, prices.field_position("Close")]) == [
+        0,
+        1,
+        1,
+        3,
+    ]
+
+    stock_data.limit_timeframe("2020-01-03", "2020-01-04")
+    assert stock_data.prices.price("AAA", "Close", 0) is None
+    assert stock_data.prices.price("AAA", "Close", 1) == 4.0
+
+
+def test_market_view_exposes_clean_history_and_deposits(monkeypatch):
+    stub_df = _make_stub_df().set_index("Date")
+    stub_df.loc[stub_df.index[1], "Close"] = float("inf")
+    monkeypatch.setattr(
+        stock_data_module, "load_into_stock_data_set", lambda _: stub_df
+    )
+
+    stock_data = StockData(["AAA"], monthly_deposit=100, daily_deposit=10)
+    market = stock_data.market_view()
+
+    assert market.money_to_add == 110
+    assert list(market.closes("AAA")) == [1.0]
+
+    market.seek(3)
+    assert market.money_to_add == 10
+    assert list(market.closes("AAA")) == [1.0, 3.0, 4.0]
+    assert list(market.closes("AAA", 2)) == [3.0, 4.0]
+    assert market.latest_open("AAA") == 4.0
+    assert len(market.frame) == 4
+    assert list(stock_data.deposit_schedule()) == [110, 10, 10, 10]
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from python_stocks.engine.checkpoint import SimulationCheckpoint
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.engine.sweep import SuccessiveHalvingSweep, halving_schedule
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.stock_data import StockData
+
+GRID = {"moving_average_filter": {"short_window": [3, 5, 8], "long_window": [12, 20]}}
+
+
+def _stock_data():
+    dates = pd.date_range("2020-01-01", periods=240, freq="D")
+    steps = np.random.default_rng(5).normal(0.05, 1, len(dates))
+    closes = 60 + np.cumsum(steps) + 4 * np.sin(np.arange(len(dates)) / 7)
+    frames = {"AAA": pd.DataFrame({"Open": closes, "Close": closes}, index=dates)}
+    return StockData(["AAA"], loader=frames.__getitem__)
+
+
+def test_halving_schedule_grows_prefixes_to_the_full_range():
+    assert halving_schedule(1000, 16, min_days=50) == [62, 125, 250, 500, 1000]
+    assert halving_schedule(1000, 9, eta=3, min_days=200) == [200, 333, 1000]
+    assert halving_schedule(1000, 4, keep=4) == [1000]
+
+
+def test_successive_halving_prunes_the_worst_runs_per_stage():
+    stock_data = _stock_data()
+    registry = build_default_registry(stock_data.tickers())
+    sweep = SuccessiveHalvingSweep(
+        stock_data, metric="cagr", min_days=60, registry=registry
+    )
+
+    result = sweep.run(
+        1000, enabled_strategies=["moving_average_filter"], parameter_overrides=GRID
+    )
+
+    # 6 -> 3 -> 2 -> 1 runs; the first prefix is raised to min_days twice.
+    assert [stage.days for stage in result.stages] == [60, 60, 120, 240]
+    assert [len(stage.results) for stage in result.stages] == [6, 3, 2, 1]
+    assert [len(stage.pruned) for stage in result.stages] == [3, 1, 1, 0]
+
+    for stage, following in zip(result.stages, result.stages[1:]):
+        direct = SimulationEngine(
+            stock_data.window(0, stage.days), registry=registry, reporting="silent"
+        ).run_once(
+            1000,
+            enabled_strategies=["moving_average_filter"],
+            parameter_overrides=GRID,
+        )
+        for run, stage_result in stage.results.items():
+            assert stage_result == direct.results[run]
+        kept = set(following.results)
+        assert kept.isdisjoint(stage.pruned)
+        assert min(stage.results[run].cagr for run in kept) >= max(
+            stage.results[run].cagr for run in stage.pruned
+        )
+
+    report = result.report_df
+    assert report["pruned_at_stage"].value_counts().to_dict() == {0: 3, 1: 1, 2: 1}
+    assert result.survivors == [report["pruned_at_stage"].isna().idxmax()]
+    assert result.output.results == [result.best]
+
+
+def test_repeated_final_prefix_reports_only_the_survivors():
+    stock_data = _stock_data()
+    registry = build_default_registry(stock_data.tickers())
+    sweep = SuccessiveHalvingSweep(
+        stock_data, metric="cagr", min_days=240, registry=registry
+    )
+
+    result = sweep.run(
+        1000, enabled_strategies=["moving_average_filter"], parameter_overrides=GRID
+    )
+
+    assert [stage.days for stage in result.stages] == [240, 240, 240, 240]
+    assert result.output.results == [result.best]
+    assert len(result.output.histories) == 1
+    assert len(result.output.report_df) == 1
+
+
+def test_survivors_are_extended_from_their_previous_stage(monkeypatch, tmp_path):
+    stock_data = _stock_data()
+    registry = build_default_registry(stock_data.tickers())
+    loaded = []
+    load = SimulationCheckpoint.load
+
+    def spy(self, key, rows, data_key):
+        state = load(self, key, rows, data_key)
+        loaded.append((self.directory.name, rows, state.rows if state else None))
+        return state
+
+    monkeypatch.setattr(SimulationCheckpoint, "load", spy)
+    sweep = SuccessiveHalvingSweep(
+        stock_data, metric="cagr", min_days=60, registry=registry, workers=1
+    )
+    result = sweep.run(
+        1000,
+        enabled_strategies=["moving_average_filter"],
+        parameter_overrides=GRID,
+        checkpoint=SimulationCheckpoint(tmp_path),
+    )
+
+    # Every run starts from scratch once; each later stage resumes the
+    # survivors from the prefix they finished the stage before.
+    survivors = [sorted(stage.results) for stage in result.stages]
+    assert loaded == (
+        [(f"run-{run}", 60, None) for run in survivors[0]]
+        + [(f"run-{run}", 120, 60) for run in survivors[2]]
+        + [(f"run-{run}", 240, 120) for run in survivors[3]]
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"run-{run}" for run in survivors[0]
+    ]
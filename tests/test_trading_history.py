@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from python_stocks.trading_history import TradingHistory
 
@@ -131,3 +132,116 @@ def test_sell_all_shares_applies_slippage_and_costs():
         == expected_trade_value - expected_cost
     )
     assert trading_history.trading_history_df.at[dates[0], "AAA"] == 0
+
+
+def test_ledger_grows_past_initial_capacity():
+    dates = pd.date_range("2020-01-01", periods=4)
+    prices = pd.DataFrame({"Close": [10.0, 11.0, 12.0, 13.0]}, index=dates)
+    stock_df = pd.concat([prices], axis=1, keys=["AAA"])
+
+    trading_history = TradingHistory(
+        ["AAA", "bank_account", "money_invested"],
+        principal=100,
+        strat_function=_noop_strategy,
+        name="test",
+        capacity=2,
+    )
+    for row_n in range(1, len(dates) + 1):
+        trading_history.new_day(stock_df.iloc[:row_n], money_to_add=5)
+
+    frame = trading_history.trading_history_df
+    assert list(frame.index) == list(dates)
+    assert list(frame["bank_account"]) == [105.0, 110.0, 115.0, 120.0]
+    assert list(frame["money_invested"]) == [105.0, 5.0, 5.0, 5.0]
+
+
+def test_equity_curve_is_cached_until_ledger_changes():
+    dates = pd.date_range("2020-01-01", periods=2)
+    prices = pd.DataFrame({"Close": [10.0, 12.0]}, index=dates)
+    stock_df = pd.concat([prices], axis=1, keys=["AAA"])
+
+    trading_history = TradingHistory(
+        ["AAA", "bank_account", "money_invested"],
+        principal=100,
+        strat_function=_noop_strategy,
+        name="test",
+    )
+    trading_history.new_day(stock_df.iloc[:1], money_to_add=0)
+    trading_history.new_day(stock_df, money_to_add=0)
+
+    first = trading_history.equity_curve()
+    assert trading_history.equity_curve() is first
+    assert list(first) == [100.0, 100.0]
+
+    trading_history.buy_all_shares("AAA")
+
+    updated = trading_history.equity_curve()
+    assert updated is not first
+    assert list(updated) == [100.0, 100.0]
+    assert trading_history.ledger.get("AAA") == 8
+    assert trading_history.portfolio_value_history() == list(updated)
+
+
+def test_money_weighted_return_solves_long_daily_schedules():
+    dates = pd.date_range("2020-01-01", periods=400)
+    closes = np.linspace(10.0, 14.0, len(dates))
+    stock_df = pd.concat(
+        [pd.DataFrame({"Close": closes}, index=dates)], axis=1, keys=["AAA"]
+    )
+    deposits = np.where(dates.day == 1, 100.0, 0.0)
+    shares = np.cumsum(deposits) / 10.0
+
+    trading_history = TradingHistory(
+        ["AAA", "bank_account", "money_invested"],
+        principal=0,
+        strat_function=_noop_strategy,
+        name="test",
+    )
+    trading_history.stock_df_to_today = stock_df
+    trading_history.trading_history_df = pd.DataFrame(
+        {"AAA": shares, "bank_account": 0.0, "money_invested": deposits},
+        index=dates,
+    )
+
+    rate = trading_history.money_weighted_return(annualize=False)
+
+    flows = np.append(-deposits, shares[-1] * closes[-1])
+    npv = np.dot(flows, (1 + rate) ** -np.arange(len(flows)))
+    assert rate > 0
+    assert abs(npv) < 1e-5 * np.abs(flows).sum()
+
+
+def test_return_analytics_are_cached_and_match_pandas():
+    dates = pd.date_range("2020-01-01", periods=5)
+    prices = pd.DataFrame({"Close": [10.0, 12.0, 9.0, 11.0, 13.0]}, index=dates)
+    trading_history = TradingHistory(
+        ["AAA", "bank_account", "money_invested"],
+        principal=0,
+        strat_function=_noop_strategy,
+        name="test",
+    )
+    trading_history.stock_df_to_today = pd.concat([prices], axis=1, keys=["AAA"])
+    trading_history.trading_history_df = pd.DataFrame(
+        {
+            "AAA": [10, 10, 10, 10, 10],
+            "bank_account": [0.0, 0.0, 50.0, 50.0, 50.0],
+            "money_invested": [100.0, 0.0, 50.0, 0.0, 0.0],
+        },
+        index=dates,
+    )
+
+    analytics = trading_history.return_analytics()
+    curve = trading_history.equity_curve()
+    returns = curve.pct_change().dropna()
+
+    assert trading_history.return_analytics() is analytics
+    assert analytics.volatility == returns.std() * (252**0.5)
+    assert analytics.sharpe_ratio == (returns.mean() * 252) / analytics.volatility
+    assert analytics.drawdown.equals(curve / curve.cummax() - 1)
+    assert trading_history.drawdown_series().min() == analytics.drawdown.min()
+    assert trading_history.time_weighted_return(annualize=False) == pytest.approx(
+        (120 / 100) * (140 / (120 + 50)) * (160 / 140) * (180 / 160) - 1
+    )
+
+    trading_history.ledger.set("bank_account", 60.0)
+    assert trading_history.return_analytics() is not analytics
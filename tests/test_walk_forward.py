@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from python_stocks.cli import parse_args
+from python_stocks.engine.simulator import SimulationEngine
+from python_stocks.engine.walk_forward import (
+    WalkForwardOptimizer,
+    walk_forward_windows,
+)
+from python_stocks.registry_factory import build_default_registry
+from python_stocks.services.strategy_service import StrategyResult, metric_score
+from python_stocks.stock_data import StockData
+from python_stocks.trading_history import TradingHistory
+
+GRID = {"short_window": [4, 7], "long_window": [15, 25]}
+
+
+def _stock_data():
+    dates = pd.date_range("2020-01-01", periods=200, freq="D")
+    steps = np.random.default_rng(7).normal(0.1, 1, len(dates))
+    closes = 50 + np.cumsum(steps) + 5 * np.sin(np.arange(len(dates)) / 9)
+    frames = {"AAA": pd.DataFrame({"Open": closes, "Close": closes}, index=dates)}
+    return StockData(["AAA"], loader=frames.__getitem__)
+
+
+def test_windows_roll_forward_by_the_out_of_sample_length():
+    windows = walk_forward_windows(100, 40, 20)
+
+    assert [(w.in_sample, w.out_of_sample) for w in windows] == [
+        ((0, 40), (40, 60)),
+        ((20, 60), (60, 80)),
+        ((40, 80), (80, 100)),
+    ]
+    anchored = walk_forward_windows(100, 40, 20, step_days=30, anchored=True)
+    assert [(w.in_sample, w.out_of_sample) for w in anchored] == [
+        ((0, 40), (40, 60)),
+        ((0, 70), (70, 90)),
+    ]
+    with pytest.raises(ValueError):
+        walk_forward_windows(100, 1, 20)
+
+
+def test_walk_forward_picks_in_sample_best_and_tests_it_forward():
+    stock_data = _stock_data()
+    registry = build_default_registry(stock_data.tickers())
+    optimizer = WalkForwardOptimizer(
+        stock_data,
+        "moving_average_filter",
+        in_sample_days=80,
+        out_of_sample_days=40,
+        metric="cagr",
+        registry=registry,
+    )
+
+    result = optimizer.run(1000, GRID)
+
+    assert len(result.folds) == 3
+    report = result.report_df
+    assert list(report["fold"]) == [0, 1, 2]
+    assert report.loc[0, "out_of_sample_start"] == stock_data.data_frame.index[80]
+
+    for fold in result.folds:
+        start, stop = fold.window.in_sample
+        sweep = SimulationEngine(
+            stock_data.window(start, stop), registry=registry, reporting="silent"
+        ).run_once(
+            1000,
+            enabled_strategies=["moving_average_filter"],
+            parameter_overrides={"moving_average_filter": GRID},
+        )
+        assert fold.in_sample_report.equals(sweep.report_df)
+        assert fold.in_sample.cagr == sweep.report_df["cagr"].max()
+
+        start, _ = fold.window.in_sample
+        out_start, stop = fold.window.out_of_sample
+        forward = SimulationEngine(
+            stock_data.window(start, stop),
+            registry=registry,
+            reporting="silent",
+            warmup_days=out_start - start,
+        ).run_once(
+            1000,
+            enabled_strategies=["moving_average_filter"],
+            parameter_overrides={
+                "moving_average_filter": {
+                    name: [value] for name, value in fold.parameters.items()
+                }
+            },
+        )
+        assert forward.results[0] == fold.out_of_sample
+
+
+def test_stock_data_window_matches_a_fresh_frame():
+    stock_data = _stock_data()
+    window = stock_data.window(30, 90)
+    rebuilt = StockData(
+        ["AAA"],
+        loader=lambda ticker: stock_data.data_frame[ticker].iloc[30:90],
+    )
+
+    np.testing.assert_array_equal(window.prices.values, rebuilt.prices.values)
+    np.testing.assert_array_equal(window.deposit_schedule(), rebuilt.deposit_schedule())
+    assert window.total_days() == 60
+    assert stock_data.total_days() == 200
+
+
+def test_walk_forward_cli_arguments():
+    args = parse_args(
+        [
+            "walk-forward",
+            "--strategy",
+            "moving_average_filter",
+            "--param",
+            "moving_average_filter.short_window=10,20",
+            "--in-sample-days",
+            "365",
+            "--out-of-sample-days",
+            "90",
+            "--metric",
+            "cagr",
+        ]
+    )
+
+    assert args.command == "walk-forward"
+    assert args.in_sample_days == 365
+    assert args.metric == "cagr"
+    assert args.step_days is None
+
+
+def test_smallest_time_in_market_penalty_ranks_first():
+    def result(penalty):
+        return StrategyResult(
+            strategy="moving_average_filter",
+            parameters={},
+            cagr=0.1,
+            max_drawdown=-0.2,
+            volatility=0.15,
+            sharpe_ratio=0.5,
+            trade_count=4,
+            total_fees=0.0,
+            slippage_cost=0.0,
+            tracking_error=0.0,
+            time_in_market_penalty=penalty,
+        )
+
+    runs = [result(-0.009), result(-0.002)]
+    best = max(runs, key=lambda run: metric_score(run, "time_in_market_penalty"))
+
+    assert best.time_in_market_penalty == -0.002
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_warmup_primes_indicators_and_scores_only_later_rows(vectorized):
+    stock_data = _stock_data()
+    registry = build_default_registry(stock_data.tickers())
+    overrides = {"moving_average_filter": {"short_window": [7], "long_window": [60]}}
+
+    def forward(data, warmup_days=0):
+        return SimulationEngine(
+            data,
+            registry=registry,
+            reporting="silent",
+            vectorized=vectorized,
+            warmup_days=warmup_days,
+        ).run_once(
+            1000,
+            enabled_strategies=["moving_average_filter"],
+            parameter_overrides=overrides,
+        )
+
+    cold = forward(stock_data.window(140, 200))
+    warm = forward(stock_data.window(60, 200), warmup_days=80)
+
+    history = warm.histories[0]
+    assert isinstance(history, TradingHistory)
+    ledger = history.trading_history_df
+    assert (ledger.iloc[:80] == 0).all().all()
+    assert ledger["money_invested"].iloc[80] == 1000
+    assert cold.results[0].trade_count == 0
+    assert warm.results[0].trade_count > 0